@@ -0,0 +1,44 @@
+import argparse
+import time
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.regexlexer import RegexLexer
+from Parser.parser import Parser
+from Benchmarks.generator import generate_expressions_program
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Parsing time of an arithmetic heavy program")
+    parser.add_argument("-n",
+                        "--functions",
+                        help="number of generated functions",
+                        type=int,
+                        default=2000)
+    parser.add_argument("-r",
+                        "--repeats",
+                        help="number of measurements, the best is reported",
+                        type=int,
+                        default=3)
+    args = parser.parse_args()
+
+    source = generate_expressions_program(args.functions)
+    tokenStream = RegexLexer(sourceHandler=DirectInputHandler(source),
+                             symbolsTable=SymbolsTable()).tokenize()
+    print(f"Source size: {len(source.encode()) / 2**20:.2f} MB, "
+          f"{len(tokenStream)} tokens")
+
+    #tokens are lexed up front, so only parsing is measured
+    best = None
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        Parser(lexer=tokenStream.cursor()).try_parse_program()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(f"parsing: {best:.3f} s, {len(tokenStream) / best:.0f} tokens/s")
+
+
+if __name__ == "__main__":
+    run()
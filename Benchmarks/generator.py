@@ -0,0 +1,56 @@
+FUNCTION_TEMPLATE = """# helper function number {index}
+fn helper_{index}(int a, float f) -> int {{
+    int tmp = a * {index} + a / 3 - 7;
+    float scaled = f * 0.5 + 1.25;
+    frc part = frc({index}, 7) + int_to_frc(a);
+    string label = "helper_{index}: \\"generated\\"";
+    if ((tmp > 100) && (a != 0)) {{
+        tmp = tmp - 100;
+    }}
+    else tmp = tmp + frc_to_int(part);
+    while (tmp < 10) tmp = tmp + 1;
+    return tmp + float_to_int(scaled);
+}}
+
+"""
+
+MAIN_TEMPLATE = """fn main() -> int {{
+    int result = 0;
+    int i = 0;
+    while (i < {calls}) {{
+        result = result + helper_{index}(i, 2.5);
+        i = i + 1;
+    }}
+    return result;
+}}
+"""
+
+
+def generate_program(functionsCount: int, calls: int = 10) -> str:
+    functions = [
+        FUNCTION_TEMPLATE.format(index=index)
+        for index in range(functionsCount)
+    ]
+    main = MAIN_TEMPLATE.format(calls=calls, index=functionsCount - 1)
+    return "int globalCounter = 0;\n\n" + "".join(functions) + main
+
+
+EXPRESSION_FUNCTION_TEMPLATE = """fn compute_{index}(int a, int b, float f) -> int {{
+    int x = -a * b + (a - b) * {index} / 3 - b * b + a * (b + 1) * 2;
+    float y = f * f - f / 2.5 + -f * (f + 1.5) * 0.25 + int_to_float(a - b);
+    while ((x - a * 2) > (b + 10 * a)) x = x - (a + b) * 2 + 1;
+    if (!(a * b + 3 < x - 1)) x = x + a * a - b / 2;
+    return x + float_to_int(y) * 2 - (a + b * {index}) / (b + 1);
+}}
+
+"""
+
+
+def generate_expressions_program(functionsCount: int) -> str:
+    functions = [
+        EXPRESSION_FUNCTION_TEMPLATE.format(index=index)
+        for index in range(functionsCount)
+    ]
+    main = ("fn main() -> int "
+            f"return compute_{functionsCount - 1}(3, 4, 1.5);")
+    return "".join(functions) + main
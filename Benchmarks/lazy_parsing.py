@@ -0,0 +1,45 @@
+import argparse
+import contextlib
+import io
+import time
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.regexlexer import RegexLexer
+from Parser.parser import Parser
+from Interpreter.interpreter import Interpreter
+from Benchmarks.generator import generate_program
+
+
+def measure(source: str, lazy: bool) -> float:
+    #time from reading the source to the result of main
+    start = time.perf_counter()
+    lexer = RegexLexer(sourceHandler=DirectInputHandler(source),
+                       symbolsTable=SymbolsTable())
+    with contextlib.redirect_stdout(io.StringIO()):
+        Interpreter(Parser(lexer=lexer, lazy=lazy)).interpret()
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Startup time with function bodies parsed on first call")
+    parser.add_argument("-n",
+                        "--functions",
+                        help="number of generated functions, "
+                        "only one of them is called",
+                        type=int,
+                        default=4000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    print(f"Source size: {len(source.encode()) / 2**20:.2f} MB")
+
+    eager = measure(source, lazy=False)
+    print(f"full parsing: {eager:.3f} s")
+    lazy = measure(source, lazy=True)
+    print(f"lazy parsing: {lazy:.3f} s, speedup: {eager / lazy:.2f}x")
+
+
+if __name__ == "__main__":
+    run()
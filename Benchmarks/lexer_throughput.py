@@ -0,0 +1,39 @@
+import argparse
+import time
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable, TokenTypes
+from Lexer.lexer import Lexer
+from Lexer.regexlexer import RegexLexer
+from Benchmarks.generator import generate_program
+
+
+def measure(lexerClass, source: str) -> float:
+    start = time.perf_counter()
+    lexer = lexerClass(sourceHandler=DirectInputHandler(source),
+                       symbolsTable=SymbolsTable())
+    while lexer.get_token().type != TokenTypes.EOF:
+        pass
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare throughput of the lexer engines")
+    parser.add_argument("-n",
+                        "--functions",
+                        help="number of generated functions",
+                        type=int,
+                        default=2000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    megabytes = len(source.encode()) / 2**20
+    print(f"Source size: {megabytes:.2f} MB")
+    for name, lexerClass in [("classic", Lexer), ("regex", RegexLexer)]:
+        elapsed = measure(lexerClass, source)
+        print(f"{name:>8}: {elapsed:.3f} s, {megabytes / elapsed:.2f} MB/s")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,51 @@
+import argparse
+import time
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.regexlexer import RegexLexer
+from Parser.parser import Parser
+
+NESTED_PROGRAMS = {
+    "parentheses":
+    lambda depth: "fn main() -> int return " + "(" * depth + "1" + ")" *
+    depth + ";",
+    "blocks":
+    lambda depth: "fn main() " + "{" * depth + "}" * depth,
+    "if statements":
+    lambda depth: "fn main() " + "if (1) " * depth + "return 1;",
+    "function calls":
+    lambda depth: "fn main() -> int return " + "f(" * depth + "1" + ")" *
+    depth + ";"
+}
+
+
+def measure(source: str) -> float:
+    start = time.perf_counter()
+    Parser(lexer=RegexLexer(sourceHandler=DirectInputHandler(source),
+                            symbolsTable=SymbolsTable())).try_parse_program()
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Parsing time of deeply nested programs")
+    parser.add_argument("-d",
+                        "--max-depth",
+                        help="the deepest nesting measured",
+                        type=int,
+                        default=100000)
+    args = parser.parse_args()
+
+    for name, build_source in NESTED_PROGRAMS.items():
+        print(f"{name}:")
+        depth = 10
+        while depth <= args.max_depth:
+            elapsed = measure(build_source(depth))
+            print(f"{depth:>8} levels: {elapsed:.3f} s, "
+                  f"{elapsed / depth * 1e6:.1f} us per level")
+            depth *= 10
+
+
+if __name__ == "__main__":
+    run()
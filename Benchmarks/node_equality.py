@@ -0,0 +1,63 @@
+import argparse
+import pickle
+import time
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.regexlexer import RegexLexer
+from Parser.parser import Parser
+from Benchmarks.generator import generate_program
+
+
+def parse(source: str):
+    return Parser(lexer=RegexLexer(sourceHandler=DirectInputHandler(source),
+                                   symbolsTable=SymbolsTable())
+                  ).try_parse_program()
+
+
+def pickle_equal(left, right) -> bool:
+    #equality used by nodes before, kept here for comparison
+    return isinstance(right, left.__class__) and pickle.dumps(
+        left) == pickle.dumps(right)
+
+
+def measure(compare, left, right, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        compare(left, right)
+    return (time.perf_counter() - start) / repeats
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare pickle based and structural node equality")
+    parser.add_argument("-n",
+                        "--functions",
+                        help="number of generated functions",
+                        type=int,
+                        default=2000)
+    parser.add_argument("-r",
+                        "--repeats",
+                        help="number of comparisons",
+                        type=int,
+                        default=10)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    left, right = parse(source), parse(source)
+    different = parse(source.replace("return result;", "return 0;"))
+
+    start = time.perf_counter()
+    hash(left), hash(right), hash(different)
+    print(f"first hash of 3 trees: {time.perf_counter() - start:.4f} s")
+
+    for name, compare in [("pickle", pickle_equal),
+                          ("structural", lambda left, right: left == right)]:
+        equal = measure(compare, left, right, args.repeats)
+        notEqual = measure(compare, left, different, args.repeats)
+        print(f"{name:>10}: equal trees {equal * 1000:.3f} ms, "
+              f"different trees {notEqual * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    run()
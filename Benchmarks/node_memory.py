@@ -0,0 +1,75 @@
+import argparse
+import sys
+import tracemalloc
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.regexlexer import RegexLexer
+from Parser.ast import INode
+from Parser.parser import Parser
+from Benchmarks.generator import generate_program
+
+
+def collect_nodes(program) -> dict:
+    nodesByType = {}
+    stack = [program]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, INode):
+            nodesByType.setdefault(value.__class__, []).append(value)
+            stack.extend(getattr(value, field) for field in value.fields)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+    return nodesByType
+
+
+def dict_node_size(nodeClass, nodes: list) -> float:
+    #node as it was before __slots__: same attributes kept in __dict__
+    dictNodeClass = type(nodeClass.__name__, (), {})
+    names = [name for name in nodeClass.__slots__ if name != "_hash"]
+
+    tracemalloc.start()
+    copies = []
+    for node in nodes:
+        copy = dictNodeClass()
+        for name in names:
+            setattr(copy, name, getattr(node, name))
+        copies.append(copy)
+    size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(copies)
+    tracemalloc.stop()
+    return size / len(nodes)
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Memory used by AST nodes with __dict__ and __slots__")
+    parser.add_argument("-n",
+                        "--functions",
+                        help="number of generated functions",
+                        type=int,
+                        default=2000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    program = Parser(lexer=RegexLexer(
+        sourceHandler=DirectInputHandler(source),
+        symbolsTable=SymbolsTable())).try_parse_program()
+
+    totalBefore, totalAfter = 0, 0
+    print(f"{'node type':>22} {'count':>8} {'before B':>9} {'after B':>8}")
+    for nodeClass, nodes in sorted(collect_nodes(program).items(),
+                                   key=lambda item: -len(item[1])):
+        before = dict_node_size(nodeClass, nodes)
+        after = sys.getsizeof(nodes[0])
+        totalBefore += before * len(nodes)
+        totalAfter += after * len(nodes)
+        print(f"{nodeClass.__name__:>22} {len(nodes):>8} {before:>9.1f} "
+              f"{after:>8}")
+
+    print(f"total: before {totalBefore / 2**20:.2f} MB, "
+          f"after {totalAfter / 2**20:.2f} MB")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,46 @@
+import argparse
+import time
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.regexlexer import RegexLexer
+from Parser.parser import Parser
+from Parser.parallel import ParallelParser
+from Benchmarks.generator import generate_program
+
+
+def measure(build_parser, source: str) -> float:
+    start = time.perf_counter()
+    build_parser(DirectInputHandler(source)).try_parse_program()
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Scaling of parallel lexing and parsing")
+    parser.add_argument("-n",
+                        "--functions",
+                        help="number of generated functions",
+                        type=int,
+                        default=4000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    print(f"Source size: {len(source.encode()) / 2**20:.2f} MB")
+
+    sequential = measure(
+        lambda sourceHandler: Parser(lexer=RegexLexer(
+            sourceHandler=sourceHandler, symbolsTable=SymbolsTable())),
+        source)
+    print(f"sequential: {sequential:.3f} s")
+    for workers in [1, 2, 4, 8]:
+        elapsed = measure(
+            lambda sourceHandler: ParallelParser(sourceHandler=sourceHandler,
+                                                 symbolsTable=SymbolsTable(),
+                                                 workers=workers), source)
+        print(f"{workers:>2} workers: {elapsed:.3f} s, "
+              f"speedup: {sequential / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,50 @@
+import argparse
+import tracemalloc
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable, TokenTypes
+from Lexer.regexlexer import RegexLexer
+from Benchmarks.generator import generate_program
+
+
+def build_lexer(source: str) -> RegexLexer:
+    return RegexLexer(sourceHandler=DirectInputHandler(source),
+                      symbolsTable=SymbolsTable())
+
+
+def token_list(source: str) -> list:
+    lexer = build_lexer(source)
+    tokens = [lexer.get_token()]
+    while tokens[-1].type != TokenTypes.EOF:
+        tokens.append(lexer.get_token())
+    return tokens
+
+
+def measure(build, source: str) -> tuple:
+    tracemalloc.start()
+    result = build(source)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return len(result), size
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare memory of token objects and token stream")
+    parser.add_argument("-n",
+                        "--functions",
+                        help="number of generated functions",
+                        type=int,
+                        default=1000)
+    args = parser.parse_args()
+
+    source = generate_program(args.functions)
+    for name, build in [("Token list", token_list),
+                        ("TokenStream", lambda s: build_lexer(s).tokenize())]:
+        count, size = measure(build, source)
+        print(f"{name:>12}: {count} tokens, {size / 2**20:.2f} MB, "
+              f"{size / count:.1f} B/token")
+
+
+if __name__ == "__main__":
+    run()
@@ -1,12 +1,21 @@
-from HelperModules.sourcehandler import FileHandler, DirectInputHandler
+from HelperModules.sourcehandler import FileHandler, DirectInputHandler, StreamHandler
 from HelperModules.errorhandler import *
+from HelperModules.memocache import MemoCache, DEFAULT_MEMO_SIZE
+from HelperModules.programcache import ProgramCache, CACHE_DIRECTORY
+from HelperModules.resultcache import ResultCache, RESULTS_DIRECTORY
 from HelperModules.symbols import SymbolsTable
 from Lexer.lexer import Lexer
+from Lexer.regexlexer import RegexLexer
 from Parser.parser import Parser
-from Interpreter.interpreter import Interpreter
+from Parser.parallel import ParallelParser
+from Interpreter.interpreter import Interpreter, INTERPRETER_VERSION
+from Optimizer.optimizer import Optimizer
+from Optimizer.inlining import DEFAULT_INLINE_BUDGET
 
 import argparse
+import os
 import pathlib
+import sys
 
 
 def get_arguments():
@@ -22,6 +31,59 @@ def get_arguments():
                        "--file",
                        help="path to file with code",
                        type=pathlib.Path)
+    group.add_argument("-i",
+                       "--stdin",
+                       help="read code from standard input as it arrives",
+                       action="store_true")
+
+    parser.add_argument("-l",
+                        "--lexer",
+                        help="lexer engine used to tokenize source code",
+                        choices=["classic", "regex"],
+                        default="classic")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        help="lex and parse top level definitions in JOBS processes",
+        type=int)
+    parser.add_argument(
+        "--lazy",
+        help="parse bodies of functions when they are called for the first "
+        "time, uses regex lexer and no cache, ignored with --jobs",
+        action="store_true")
+    parser.add_argument(
+        "--check",
+        help="parse whole program and report syntax errors without running it",
+        action="store_true")
+    parser.add_argument("--no-optimize",
+                        help="run program without optimization passes",
+                        action="store_true")
+    parser.add_argument(
+        "--inline-budget",
+        help="largest size in nodes of inlined function body, 0 disables "
+        "inlining",
+        type=int,
+        default=DEFAULT_INLINE_BUDGET)
+    parser.add_argument(
+        "--memoize",
+        help="cache results of pure functions, at most SIZE least recently "
+        f"used results of every function (default {DEFAULT_MEMO_SIZE})",
+        type=int,
+        nargs="?",
+        const=DEFAULT_MEMO_SIZE,
+        metavar="SIZE")
+    parser.add_argument(
+        "--cache-results",
+        help="keep output and result of program and results of pure "
+        "functions in cache, programs run again replay them, uses --memoize",
+        action="store_true")
+    parser.add_argument("--no-cache",
+                        help="do not use cached results of previous runs",
+                        action="store_true")
+    parser.add_argument("-s",
+                        "--stats",
+                        help="print compilation statistics at exit",
+                        action="store_true")
 
     return parser.parse_args()
 
@@ -33,6 +95,8 @@ def run() -> None:
             sourceHandler = DirectInputHandler(args.text)
         elif args.file is not None:
             sourceHandler = FileHandler(str(args.file))
+        elif args.stdin:
+            sourceHandler = StreamHandler(sys.stdin.buffer)
         else:
             print("Invalid arguments.")
             print("Use -h for more information about usage.")
@@ -41,14 +105,77 @@ def run() -> None:
         print("File not found. Invalid file name.")
         return
 
+    symbolsTable = SymbolsTable()
+    optimizer = None if args.no_optimize else Optimizer(
+        args.inline_budget)
+    memoCache = None if args.memoize is None else MemoCache(args.memoize)
+    #checking has to see every function body
+    lazy = args.lazy and not args.check and args.jobs is None
     try:
-        lexer = Lexer(sourceHandler=sourceHandler, symbolsTable=SymbolsTable())
-        parser = Parser(lexer=lexer)
-        interpreter = Interpreter(parser)
-        interpreter.interpret()
+        if args.jobs is not None:
+            parser = ParallelParser(sourceHandler=sourceHandler,
+                                    symbolsTable=symbolsTable,
+                                    workers=args.jobs)
+        else:
+            #only regex lexer can skip bodies of functions
+            lexerClass = RegexLexer if args.lexer == "regex" or lazy else Lexer
+            lexer = lexerClass(sourceHandler=sourceHandler,
+                               symbolsTable=symbolsTable)
+            parser = Parser(lexer=lexer, lazy=lazy)
+
+        if args.check:
+            parser.try_parse_program()
+            print("No syntax errors found.")
+        else:
+            programCache = None
+            resultCache = None
+            if args.file is not None and not (args.no_cache or lazy):
+                #parsed program is cached next to the source file
+                directory = os.path.join(os.path.dirname(args.file),
+                                         CACHE_DIRECTORY)
+                programCache = ProgramCache(directory=directory,
+                                            version=INTERPRETER_VERSION)
+                if args.cache_results:
+                    resultCache = ResultCache(
+                        directory=os.path.join(directory, RESULTS_DIRECTORY),
+                        version=INTERPRETER_VERSION)
+                    if memoCache is None:
+                        memoCache = MemoCache()
+
+            interpreter = Interpreter(parser, programCache, optimizer,
+                                      memoCache, resultCache)
+            interpreter.interpret()
 
     except IError as error:
         print(error)
+    except RecursionError:
+        #parser handles any nesting, interpreter is still recursive
+        print("Program is nested too deep to be run.")
+
+    if args.stats:
+        print_stats(symbolsTable, optimizer, memoCache)
+
+
+def print_stats(symbolsTable: SymbolsTable, optimizer: Optimizer,
+                memoCache: MemoCache) -> None:
+    internStats = symbolsTable.get_intern_stats()
+    print(f"Interned identifiers and literals: {len(symbolsTable.internDict)}, "
+          f"hits: {internStats.hits}, misses: {internStats.misses}, "
+          f"hit rate: {internStats.hitRate:.1%}")
+    if optimizer is not None:
+        optimizerStats = optimizer.get_stats()
+        print(f"Dead code nodes removed: {optimizerStats.removedNodes}")
+        print(f"Inlined function calls: {optimizerStats.inlinedCalls}")
+        print("Loop invariant expressions hoisted: "
+              f"{optimizerStats.hoistedExpressions}")
+        for function, count in optimizerStats.eliminatedExpressions.items():
+            print(f"Common subexpression evaluations eliminated in "
+                  f"{function}: {count}")
+    if memoCache is not None:
+        memoStats = memoCache.get_stats()
+        print(f"Memoized function calls hits: {memoStats.hits}, "
+              f"misses: {memoStats.misses}, "
+              f"hit rate: {memoStats.hitRate:.1%}")
 
 
 if __name__ == "__main__":
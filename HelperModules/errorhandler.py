@@ -5,41 +5,66 @@ from typing import Union
 import re
 
 
+def get_error_context(sourceHandler: Union[FileHandler, DirectInputHandler],
+                      position: tuple) -> str:
+    lineNr, columnNr = position
+    line = sourceHandler.get_line(lineNr)
+
+    errorPointer = re.sub(r"\S", ' ', line)
+    errorPointer = errorPointer[:(columnNr -
+                                  1)] + '^' + errorPointer[columnNr:]
+
+    return f"Where: line:{lineNr}, column:{columnNr}\n" + f"{line}\n{errorPointer}\n"
+
+
 class IError(Exception):
     pass
 
 
 class LexerError(IError):
-    def __init__(
-            self, message: str,
-            sourceHandler: Union[FileHandler, DirectInputHandler]) -> None:
+    def __init__(self,
+                 message: str,
+                 sourceHandler: Union[FileHandler, DirectInputHandler],
+                 position: tuple = None) -> None:
         if sourceHandler is None:
             super().__init__("Lexer error.\n" + message)
         else:
-            lineNr, columnNr = sourceHandler.get_position()
-            line = sourceHandler.get_line()
-
-            errorPointer = re.sub(r"\S", ' ', line)
-            errorPointer = errorPointer[:(columnNr -
-                                          1)] + '^' + errorPointer[columnNr:]
+            if position is None:
+                position = sourceHandler.get_position()
 
-            self.message = f"Lexer error.\n" + f"Where: line:{lineNr}, column:{columnNr}\n" + f"{line}\n{errorPointer}\n" + f"What: {message}\n"
+            self.message = f"Lexer error.\n" + get_error_context(
+                sourceHandler, position) + f"What: {message}\n"
             super().__init__(self.message)
 
 
 class ParserError(IError):
-    def __init__(self, message: str, currentToken: Token = None) -> None:
+    def __init__(
+            self,
+            message: str,
+            currentToken: Token = None,
+            sourceHandler: Union[FileHandler, DirectInputHandler] = None
+    ) -> None:
         if currentToken is None:
             super().__init__("Parser error.\n" + message)
         else:
-            lineNr, columnNr = currentToken.position
-            self.message = f"Parser error.\n" + f"Where: line:{lineNr}, column:{columnNr}\n" + f"What: {message}\n" + f"Got {currentToken}.\n"
+            if sourceHandler is None:
+                lineNr, columnNr = currentToken.position
+                where = f"Where: line:{lineNr}, column:{columnNr}\n"
+            else:
+                where = get_error_context(sourceHandler, currentToken.position)
+
+            self.message = f"Parser error.\n" + where + f"What: {message}\n" + f"Got {currentToken}.\n"
             super().__init__(self.message)
 
 
 class InterpreterError(IError):
-    def __init__(self, message: str, currentInstruction: str = None) -> None:
+    def __init__(self,
+                 message: str,
+                 currentInstruction: str = None,
+                 position: tuple = None) -> None:
         self.message = message
+        #position of the innermost node with known position which failed
+        self.position = position
         if currentInstruction is None:
             super().__init__("Interpreter error.\n" + self.message)
         else:
@@ -48,6 +73,21 @@ class InterpreterError(IError):
 
 
 class InterpreterRuntimeError(IError):
-    def __init__(self, message: str, currentFunction: str) -> None:
-        self.message = f"Interpreter error in function: {currentFunction}.\n" + f"What: {message}\n"
+    errorName = "Interpreter error"
+
+    def __init__(
+            self,
+            message: str,
+            currentFunction: str,
+            sourceHandler: Union[FileHandler, DirectInputHandler] = None,
+            position: tuple = None) -> None:
+        self.message = f"{self.errorName} in function: {currentFunction}.\n"
+        if sourceHandler is not None and position is not None:
+            self.message += get_error_context(sourceHandler, position)
+        self.message += f"What: {message}\n"
         super().__init__(self.message)
+
+
+class TypeCheckError(InterpreterRuntimeError):
+    #found before the program runs, reported like errors of running it
+    errorName = "Type error"
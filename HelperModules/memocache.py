@@ -0,0 +1,57 @@
+from collections import OrderedDict, namedtuple
+
+MemoStats = namedtuple("MemoStats", ["hits", "misses", "hitRate"])
+
+DEFAULT_MEMO_SIZE = 1024
+#returned when arguments were not cached, results may be any value
+MISSING = object()
+
+
+class MemoCache:
+    #results of pure functions for their arguments, every function keeps
+    #at most maxSize least recently used results
+    def __init__(self, maxSize: int = DEFAULT_MEMO_SIZE) -> None:
+        self.maxSize = maxSize
+        self.hits = 0
+        self.misses = 0
+        #functions with results stored since they were added
+        self.changedFunctions = set()
+        self.__results = {}
+
+    def get(self, function: str, arguments: tuple):
+        results = self.__results.get(function)
+        if results is None or (result := results.get(arguments,
+                                                     MISSING)) is MISSING:
+            self.misses += 1
+            return MISSING
+
+        self.hits += 1
+        results.move_to_end(arguments)
+        return result
+
+    def store(self, function: str, arguments: tuple, result) -> None:
+        if self.maxSize <= 0:
+            return
+
+        results = self.__results.setdefault(function, OrderedDict())
+        results[arguments] = result
+        self.changedFunctions.add(function)
+        if len(results) > self.maxSize:
+            results.popitem(last=False)
+
+    def add_results(self, function: str, results: dict) -> None:
+        #added results are used less recently than the ones already kept
+        added = OrderedDict(results)
+        added.update(self.__results.get(function, {}))
+        while len(added) > self.maxSize:
+            added.popitem(last=False)
+        self.__results[function] = added
+
+    def get_results(self, function: str) -> dict:
+        return dict(self.__results.get(function, {}))
+
+    def get_stats(self) -> MemoStats:
+        calls = self.hits + self.misses
+        return MemoStats(hits=self.hits,
+                         misses=self.misses,
+                         hitRate=self.hits / calls if calls else 0.0)
@@ -0,0 +1,88 @@
+import os
+import pickle
+import tempfile
+
+CACHE_DIRECTORY = "__bifcache__"
+CACHE_SUFFIX = ".pickle"
+MAX_CACHE_SIZE = 2**26
+
+
+class ProgramCache:
+    def __init__(self,
+                 directory: str,
+                 version: str,
+                 maxSize: int = MAX_CACHE_SIZE) -> None:
+        self.directory = directory
+        self.version = version
+        self.maxSize = maxSize
+
+    def __get_path(self, digest: str) -> str:
+        #programs cached by other interpreter versions are never loaded
+        return os.path.join(self.directory,
+                            f"{digest}-{self.version}{CACHE_SUFFIX}")
+
+    def load(self, digest: str):
+        path = self.__get_path(digest)
+        try:
+            with open(path, 'rb') as file:
+                program = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError, RecursionError):
+            #damaged or outdated entry is dropped and program parsed again
+            self.__remove(path)
+            return None
+
+        #modification time marks last use for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return program
+
+    def store(self, digest: str, program) -> None:
+        #cache is only an optimisation, program runs without it
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            file = tempfile.NamedTemporaryFile(dir=self.directory,
+                                               suffix=".tmp",
+                                               delete=False)
+        except OSError:
+            return
+
+        #readers never see partly written file
+        try:
+            with file:
+                pickle.dump(program, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, self.__get_path(digest))
+        except (OSError, pickle.PicklingError, RecursionError):
+            self.__remove(file.name)
+            return
+
+        self.__evict()
+
+    def __evict(self) -> None:
+        entries = []
+        with os.scandir(self.directory) as iterator:
+            for entry in iterator:
+                if entry.name.endswith(CACHE_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        #least recently used entries are removed first
+        size = sum(entrySize for _, entrySize, _ in entries)
+        for _, entrySize, path in sorted(entries):
+            if size <= self.maxSize:
+                break
+            self.__remove(path)
+            size -= entrySize
+
+    def __remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
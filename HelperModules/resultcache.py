@@ -0,0 +1,40 @@
+import io
+
+from HelperModules.programcache import ProgramCache
+
+RESULTS_DIRECTORY = "results"
+PROGRAM_PREFIX = "program-"
+FUNCTION_PREFIX = "function-"
+
+
+class OutputRecorder(io.StringIO):
+    #keeps copy of everything written to stream
+    def __init__(self, stream) -> None:
+        super().__init__()
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        self.stream.write(text)
+        return super().write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+class ResultCache(ProgramCache):
+    #output and results of programs and results of pure functions,
+    #entries are named by digests of their trees
+    def load_program_result(self, digest: str):
+        #printed output and list of values left by main
+        return self.load(PROGRAM_PREFIX + digest)
+
+    def store_program_result(self, digest: str, output: str,
+                             results: list) -> None:
+        self.store(PROGRAM_PREFIX + digest, (output, results))
+
+    def load_function_results(self, digest: str) -> dict:
+        #results keyed by tuples of arguments, least recently used first
+        return self.load(FUNCTION_PREFIX + digest) or {}
+
+    def store_function_results(self, digest: str, results: dict) -> None:
+        self.store(FUNCTION_PREFIX + digest, results)
@@ -1,6 +1,50 @@
+import codecs
+import hashlib
 import io
-import linecache
+import mmap
+import re
 from abc import ABC, abstractmethod
+from collections import deque
+
+CHUNK_SIZE = 2**16
+WINDOW_SIZE = 256
+TEXT_NEWLINE_PATTERN = re.compile("\n")
+#raw file bytes, newlines are translated the same way as by the decoder
+BYTES_NEWLINE_PATTERN = re.compile(b"\r\n?|\n")
+
+
+class LineIndex:
+    def __init__(self, newLinePattern: re.Pattern) -> None:
+        self.newLinePattern = newLinePattern
+        # offsets of the first char of every line found so far
+        self.lineStarts = [0]
+        self.length = 0
+        self.__pendingCarriageReturn = False
+
+    def add(self, chunk) -> None:
+        start = 0
+        if self.__pendingCarriageReturn and chunk[:1] == b"\n":
+            #"\r\n" split between chunks is a single newline
+            self.lineStarts[-1] += 1
+            start = 1
+
+        base = self.length
+        self.lineStarts.extend(
+            base + match.end()
+            for match in self.newLinePattern.finditer(chunk, start))
+        self.length += len(chunk)
+        self.__pendingCarriageReturn = chunk[-1:] == b"\r"
+
+    def get_line_span(self, lineNr: int, source) -> tuple:
+        #(start, end) offsets of line content in source, without the newline
+        if lineNr < 1 or lineNr > len(self.lineStarts):
+            return None
+
+        start = self.lineStarts[lineNr - 1]
+        #line ends at the first newline after its start
+        match = self.newLinePattern.search(source, start)
+        end = match.start() if match else len(source)
+        return (start, end)
 
 
 class SourceHandler(ABC):
@@ -8,18 +52,45 @@ class SourceHandler(ABC):
     def __init__(self, file) -> None:
         self._file = file
 
+        # chunk of input currently being consumed
+        self._buffer = ''
+        self._bufferPos = 0
+        self._currentChar = ''
+        self._eof = False
+
         # position of the current char in input
         self._column = 0
         self._line = 1
+        self._offset = -1
+
+        # start offsets of lines, used to show lines in error messages
+        self._lineIndex = LineIndex(TEXT_NEWLINE_PATTERN)
+
+    def _read_chunk(self) -> str:
+        return self._file.read(CHUNK_SIZE)
 
     def get_next_char(self) -> str:
-        self._currentChar = self._file.read(1)
+        if self._bufferPos >= len(self._buffer):
+            if self._eof or not (chunk := self._read_chunk()):
+                #EOF is sticky, every next call returns '' and keeps position
+                if not self._eof:
+                    self._offset += 1
+                self._eof = True
+                self._currentChar = ''
+                return self._currentChar
+
+            self._buffer = chunk
+            self._bufferPos = 0
+
+        self._currentChar = self._buffer[self._bufferPos]
+        self._bufferPos += 1
+        self._offset += 1
 
-        if self._currentChar != '':
-            self._column += 1
         if self._currentChar == '\n':
             self._column = 0
             self._line += 1
+        else:
+            self._column += 1
 
         return self._currentChar
 
@@ -29,8 +100,42 @@ class SourceHandler(ABC):
     def get_position(self) -> tuple:
         return (self._line, self._column)
 
+    def get_offset(self) -> int:
+        return self._offset
+
+    def is_eof(self) -> bool:
+        return self._eof
+
+    def read_all(self) -> str:
+        chunks = [self._buffer[self._bufferPos:]]
+        while not self._eof and (chunk := self._read_chunk()):
+            chunks.append(chunk)
+
+        self._buffer = ''
+        self._bufferPos = 0
+        self._eof = True
+        return ''.join(chunks)
+
+    def get_digest(self) -> str:
+        #hash of the whole source, None when it can not be known up front
+        return None
+
+    def get_line_span(self, lineNr: int = None) -> tuple:
+        return self._lineIndex.get_line_span(lineNr or self._line,
+                                             self._get_source())
+
+    def get_line(self, lineNr: int = None) -> str:
+        if (span := self.get_line_span(lineNr)) is None:
+            return ''
+
+        start, end = span
+        return self._decode(self._get_source()[start:end])
+
+    def _decode(self, text) -> str:
+        return text
+
     @abstractmethod
-    def get_line(self) -> str:
+    def _get_source(self):
         pass
 
 
@@ -38,11 +143,32 @@ class FileHandler(SourceHandler):
     def __init__(self, filename: str):
         self._filename = filename
         try:
-            super().__init__(open(self._filename, 'r'))
+            super().__init__(open(self._filename, 'rb'))
         except IOError:
             raise IOError
 
+        # same decoding as text mode open(): utf-8 with universal newlines
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('utf-8')(), translate=True)
+        self._lineIndex = LineIndex(BYTES_NEWLINE_PATTERN)
+        self._mapPos = 0
+        try:
+            self._map = mmap.mmap(self._file.fileno(),
+                                  0,
+                                  access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            #empty files and non regular files (pipes) can not be mapped,
+            #read bytes are kept for error messages
+            self._map = None
+            self._readBytes = bytearray()
+
     def __del__(self):
+        try:
+            if self._map is not None:
+                self._map.close()
+        except AttributeError:
+            pass
+
         try:
             self._file.close()
         except AttributeError:
@@ -51,13 +177,157 @@ class FileHandler(SourceHandler):
         except IOError:
             raise IOError
 
-    def get_line(self) -> str:
-        return linecache.getline(self._filename, self._line)
+    def _read_raw_chunk(self) -> bytes:
+        if self._map is None:
+            chunk = self._file.read(CHUNK_SIZE)
+            self._readBytes += chunk
+        else:
+            chunk = self._map[self._mapPos:self._mapPos + CHUNK_SIZE]
+            self._mapPos += len(chunk)
+            if self._lineIndex.length >= self._mapPos:
+                #rest of file was already indexed by line lookup
+                return chunk
+
+        self._lineIndex.add(chunk)
+        return chunk
+
+    def _read_chunk(self) -> str:
+        #decoder may hold back bytes of a split char or trailing '\r'
+        while raw := self._read_raw_chunk():
+            if text := self._decoder.decode(raw):
+                return text
+
+        return self._decoder.decode(b'', final=True)
+
+    def _get_source(self):
+        return self._readBytes if self._map is None else self._map
+
+    def get_digest(self) -> str:
+        if self._map is None:
+            return None
+        return hashlib.sha256(self._map).hexdigest()
+
+    def _decode(self, text) -> str:
+        return text.decode('utf-8', errors='replace')
+
+    def get_line_span(self, lineNr: int = None) -> tuple:
+        #program loaded from cache is not lexed, lines past the read part
+        #of mapped file are indexed on lookup
+        if (self._map is not None and lineNr is not None
+                and lineNr > len(self._lineIndex.lineStarts)
+                and self._lineIndex.length < len(self._map)):
+            self._lineIndex.add(self._map[self._lineIndex.length:])
+        return super().get_line_span(lineNr)
 
 
 class DirectInputHandler(SourceHandler):
     def __init__(self, directInput: str):
-        super().__init__(io.StringIO(directInput))
+        super().__init__(None)
+        self._source = directInput
+        self._sourcePos = 0
+
+    def _read_chunk(self) -> str:
+        chunk = self._source[self._sourcePos:self._sourcePos + CHUNK_SIZE]
+        self._sourcePos += len(chunk)
+        return chunk
+
+    def read_all(self) -> str:
+        #slicing from the beginning does not copy the input
+        text = self._buffer[self._bufferPos:] + self._source[self._sourcePos:]
+        self._buffer = ''
+        self._bufferPos = 0
+        self._sourcePos = len(self._source)
+        self._eof = True
+        return text
+
+    def _get_source(self):
+        return self._source
+
+    def get_digest(self) -> str:
+        return hashlib.sha256(self._source.encode(
+            'utf-8', errors='surrogatepass')).hexdigest()
+
+    def get_line_span(self, lineNr: int = None) -> tuple:
+        #whole input is known up front, it is indexed on the first lookup
+        if self._lineIndex.length < len(self._source):
+            self._lineIndex.add(self._source)
+        return super().get_line_span(lineNr)
+
+
+class StreamHandler(SourceHandler):
+    def __init__(self, stream, windowSize: int = WINDOW_SIZE):
+        super().__init__(stream)
+        self._decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('utf-8')(), translate=True)
+        self._streamEnd = False
+        self._pendingChunks = deque()
+
+        # recently read lines as (start offset, text), last one may be incomplete
+        self._windowSize = windowSize
+        self._lines = deque([(0, '')])
+        self._firstLineNr = 1
+        self._readLength = 0
+
+    def _read_raw_chunk(self) -> bytes:
+        #read1 returns what is available instead of waiting for a full chunk
+        if hasattr(self._file, 'read1'):
+            return self._file.read1(CHUNK_SIZE)
+        return self._file.read(CHUNK_SIZE)
+
+    def _read_stream_chunk(self) -> str:
+        if self._streamEnd:
+            return ''
+
+        while raw := self._read_raw_chunk():
+            if text := self._decoder.decode(raw):
+                self._add_lines(text)
+                return text
+
+        self._streamEnd = True
+        text = self._decoder.decode(b'', final=True)
+        self._add_lines(text)
+        return text
+
+    def _read_chunk(self) -> str:
+        if self._pendingChunks:
+            return self._pendingChunks.popleft()
+        return self._read_stream_chunk()
+
+    def _add_lines(self, chunk: str) -> None:
+        parts = chunk.split('\n')
+        start, text = self._lines[-1]
+        self._lines[-1] = (start, text + parts[0])
+
+        offset = self._readLength + len(parts[0]) + 1
+        for part in parts[1:]:
+            self._lines.append((offset, part))
+            offset += len(part) + 1
+        self._readLength += len(chunk)
+
+        #only lines close behind the current one are kept for error messages
+        while self._firstLineNr < self._line - self._windowSize:
+            self._lines.popleft()
+            self._firstLineNr += 1
+
+    def get_line_span(self, lineNr: int = None) -> tuple:
+        lineNr = lineNr or self._line
+        #incomplete line is read to its end, so whole line can be shown
+        while lineNr == self._firstLineNr + len(self._lines) - 1 and (
+                chunk := self._read_stream_chunk()):
+            self._pendingChunks.append(chunk)
+
+        index = lineNr - self._firstLineNr
+        if index < 0 or index >= len(self._lines):
+            return None
+
+        start, text = self._lines[index]
+        return (start, start + len(text))
+
+    def get_line(self, lineNr: int = None) -> str:
+        lineNr = lineNr or self._line
+        if self.get_line_span(lineNr) is None:
+            return ''
+        return self._lines[lineNr - self._firstLineNr][1]
 
-    def get_line(self) -> str:
-        return self._file.getvalue().splitlines()[self._line - 1]
\ No newline at end of file
+    def _get_source(self):
+        return None
@@ -1,5 +1,8 @@
+from collections import namedtuple
 from enum import Enum, auto
 
+InternStats = namedtuple("InternStats", ["hits", "misses", "hitRate"])
+
 
 class TokenTypes(Enum):
     FUNCTION = auto(),
@@ -79,3 +82,26 @@ class SymbolsTable:
             "&&": TokenTypes.AND,
             "||": TokenTypes.OR
         }
+
+        # canonical identifiers and literals of the compiled source
+        self.internDict = {}
+        self.internHits = 0
+        self.internMisses = 0
+
+    def intern(self, value):
+        #type is a part of the key, so 1 and 1.0 are different values
+        key = (value.__class__, value)
+        if (internedValue := self.internDict.get(key)) is None:
+            internedValue = self.internDict[key] = value
+            self.internMisses += 1
+        else:
+            self.internHits += 1
+
+        return internedValue
+
+    def get_intern_stats(self) -> InternStats:
+        lookups = self.internHits + self.internMisses
+        hitRate = self.internHits / lookups if lookups else 0.0
+        return InternStats(hits=self.internHits,
+                           misses=self.internMisses,
+                           hitRate=hitRate)
@@ -1,81 +1,202 @@
-import math
-
+from Parser.ast import structure_digest
 from Parser.parser import Parser
 from Parser.types import *
 
 from HelperModules.errorhandler import InterpreterError, InterpreterRuntimeError
+from HelperModules.memocache import MISSING, MemoCache
+from HelperModules.programcache import ProgramCache
+from HelperModules.resultcache import OutputRecorder, ResultCache
+from Interpreter.operators import (ARITHMETIC_OPERATORS,
+                                   CONDITION_OPERATORS, negate)
+from Interpreter.resolver import Resolver
+from Interpreter.typechecker import GLOBAL_SCOPE, TypeChecker
 from Interpreter.visitor import Visitor
+from Optimizer.optimizer import Optimizer
+from Optimizer.purity import find_dependencies, find_pure_functions
 import Interpreter.stdlib as std
 
 from collections import namedtuple
+import contextlib
+import sys
 
+#variables are kept in frame list at slots given by resolver
 Context = namedtuple("Context", ["variables", "functions", "specials"])
-VariableInfo = namedtuple("VariableInfo", ["type", "value"])
 
 EVAL_RETURN_EXP = "__eval_return_exp__"
+#value of slot of variable which was not defined yet
+UNDEFINED = object()
+#changed whenever cached programs of older versions can not be used
+INTERPRETER_VERSION = "1.3"
 
 
 class Interpreter(Visitor):
-    def __init__(self, parser: Parser) -> None:
+    def __init__(self,
+                 parser: Parser,
+                 programCache: ProgramCache = None,
+                 optimizer: Optimizer = None,
+                 memoCache: MemoCache = None,
+                 resultCache: ResultCache = None) -> None:
         if parser is None:
             raise InterpreterError("Parser module not provided.")
 
         self.__parser: Parser = parser
+        self.__sourceHandler = parser.sourceHandler
+        self.__programCache = programCache
+        self.__optimizer = optimizer
+        self.__memoCache = memoCache
+        #functions returning value whose calls are memoized
+        self.__memoizedFunctions = set()
+        #results of memoized functions are shared with other runs
+        #when result cache is given
+        self.__resultCache = resultCache
+        self.__functionDigests = {}
+        self.__typeChecker = TypeChecker(self.__sourceHandler)
+        self.__resolver = Resolver()
+        #lazily parsed functions are checked, optimized and resolved
+        #on their first call
+        self.__uncheckedFunctions = set()
         self.__contextList: list[Context] = []
         self.__results = []
         self.__return = False
+        #set when return rebinds parameters of its function for tail call
+        self.__tailCall = False
+
+    def __load_program(self) -> Program:
+        if self.__programCache is None or (
+                digest := self.__sourceHandler.get_digest()) is None:
+            return self.__parser.try_parse_program()
+
+        if (program := self.__programCache.load(digest)) is None:
+            program = self.__parser.try_parse_program()
+            if program is not None:
+                self.__programCache.store(digest, program)
+
+        return program
 
     def interpret(self, returnResult: bool = False):
-        program = self.__parser.try_parse_program()
-        if program is not None:
+        program = self.__load_program()
+        if program is None:
+            print("Parsed data are empty. No program to interpret.")
+        elif self.__resultCache is None:
             program.accept(self)
         else:
-            print("Parsed data are empty. No program to interpret.")
+            self.__interpret_cached(program)
 
         if returnResult:
             return self.__get_result()
 
+    def __interpret_cached(self, program: Program) -> None:
+        #program reads no input, so its output is the same in every run
+        digest = structure_digest(program)
+        entry = self.__resultCache.load_program_result(digest)
+        if entry is not None:
+            output, results = entry
+            sys.stdout.write(output)
+            self.__results.extend(results)
+            return
+
+        recorder = OutputRecorder(sys.stdout)
+        try:
+            with contextlib.redirect_stdout(recorder):
+                program.accept(self)
+        finally:
+            self.__store_function_results()
+
+        #only result of main is kept
+        self.__resultCache.store_program_result(digest, recorder.getvalue(),
+                                                self.__results[-1:])
+
+    def __load_function_results(self, program: Program) -> None:
+        if self.__resultCache is None:
+            return
+
+        #digest covers every definition result of function depends on
+        for identifier in self.__memoizedFunctions:
+            digest = structure_digest(find_dependencies(program, identifier))
+            self.__functionDigests[identifier] = digest
+            self.__memoCache.add_results(
+                identifier, self.__resultCache.load_function_results(digest))
+
+    def __store_function_results(self) -> None:
+        for identifier, digest in self.__functionDigests.items():
+            if identifier in self.__memoCache.changedFunctions:
+                self.__resultCache.store_function_results(
+                    digest, self.__memoCache.get_results(identifier))
+
     def evaluate_program(self, element: Program):
         self.__build_global_context(element)
-        mainFunction = self.__get_local_context().functions['main']
+        #types are checked once, so evaluation does not check them
+        self.__uncheckedFunctions = self.__typeChecker.check_program(element)
+        if self.__optimizer is not None:
+            element = self.__optimize_program(element)
+        self.__resolver.resolve_program(element, self.__uncheckedFunctions)
+        if self.__memoCache is not None:
+            self.__memoizedFunctions = {
+                functionDef.identifier
+                for functionDef in element.functionDefList
+                if functionDef.returnType is not None
+            } & find_pure_functions(element, self.__uncheckedFunctions)
+            self.__load_function_results(element)
+        self.__initialize_global_variables(element)
+
+        mainFunction = self.__get_function('main')
         try:
+            #main has its own frame like any called function
+            self.__build_new_context(mainFunction,
+                                     FunctionCall(identifier='main',
+                                                  arguments=[]))
             mainFunction.accept(self)
 
             if EVAL_RETURN_EXP in self.__get_local_context().specials:
                 if self.__get_local_context(
                 ).specials[EVAL_RETURN_EXP] is not None:
                     result = self.__get_result()
-                    self.__check_type(mainFunction.returnType, result)
-
                     print(f"Program finished with result: {result}")
                     self.__add_result(result)
 
             self.__pop_context()
+            self.__pop_context()
 
         except InterpreterError as error:
-            raise InterpreterRuntimeError(error.message, "main")
+            raise InterpreterRuntimeError(
+                error.message, "main", self.__sourceHandler, error.position
+                or mainFunction.position)
 
     def evaluate_function_definition(self, element: FunctionDef):
         try:
             element.statement.accept(self)
+            #self tail calls run body again in the same frame
+            while self.__tailCall:
+                self.__tailCall = False
+                self.__return = False
+                element.statement.accept(self)
         except InterpreterError as error:
-            raise InterpreterRuntimeError(error.message, element.identifier)
+            #failing statement or expression is shown when it is known
+            raise InterpreterRuntimeError(
+                error.message, element.identifier, self.__sourceHandler,
+                error.position or element.position)
 
     def evaluate_function_call(self, element: FunctionCall):
         if element.identifier in self.__get_global_context().functions:
-            function = self.__get_global_context().functions[
-                element.identifier]
-
+            function = self.__get_function(element.identifier)
             self.__build_new_context(function, element)
 
             if element.identifier in std.functions:
-                argumentsList = []
-                for parameter in function.parameters:
-                    argumentsList.append(self.__get_local_context().variables[
-                        parameter.identifier].value)
-                if (result := std.functions[element.identifier](argumentsList)
-                    ) is not None:
+                #arguments are the only variables of stdlib functions
+                try:
+                    result = std.functions[element.identifier](
+                        self.__get_local_context().variables)
+                except ZeroDivisionError:
+                    raise InterpreterError("Division by zero.", str(element),
+                                           element.position)
+                except (ArithmeticError, ValueError):
+                    raise InterpreterError(
+                        f"Invalid arguments of {element.identifier}.",
+                        str(element), element.position)
+                if result is not None:
                     self.__results.append(result)
+            elif element.identifier in self.__memoizedFunctions:
+                self.__call_memoized(function)
             else:
                 function.accept(self)
 
@@ -83,7 +204,8 @@ class Interpreter(Visitor):
             self.__pop_context()
         else:
             raise InterpreterError(
-                f"Function {element.identifier} is undefined.", str(element))
+                f"Function {element.identifier} is undefined.", str(element),
+                element.position)
 
     def evaluate_statement_block(self, element: StatementBlock):
         for statement in element.statements:
@@ -93,73 +215,56 @@ class Interpreter(Visitor):
 
     def evaluate_return_statement(self, element: ReturnStatement):
         try:
-            if EVAL_RETURN_EXP in self.__get_local_context().specials:
+            if element.isTailCall:
+                self.__rebind_parameters(element.expression)
+                self.__tailCall = True
+            elif EVAL_RETURN_EXP in self.__get_local_context().specials:
                 self.__evaluate_expression(element.expression)
-                # Gets function info from current context and
-                # checks if actual expression type matches declared return type.
-                # If not, exception is thrown.
-                if self.__get_local_context(
-                ).specials[EVAL_RETURN_EXP] is not None:
-                    self.__check_type(
-                        self.__get_local_context().specials[EVAL_RETURN_EXP],
-                        self.__peek_result())
 
             self.__return = True
         except InterpreterError as error:
-            raise InterpreterError(error.message, str(element))
+            raise InterpreterError(error.message, str(element), error.position
+                                   or element.position)
 
     def evaluate_assigne_statement(self, element: AssignStatement):
-        key = element.identifier.identifier
-        context = self.__get_local_context()
-        if key not in context.variables:
-            context = self.__get_global_context()
-            if key not in context.variables:
-                raise InterpreterError(f"Variable {key} was not defined",
-                                       str(element))
-
-        self.__evaluate_expression(element.expression)
-        value = self.__get_result()
-
-        variableInfo = context.variables[key]
+        variable = element.identifier
+        variables = self.__contextList[
+            0 if variable.isGlobal else -1].variables
+        if variables[variable.slot] is UNDEFINED:
+            raise InterpreterError(
+                f"Variable {variable.identifier} was not defined",
+                str(element), element.position)
 
-        #check if proper type is being assigne
         try:
-            self.__check_type(variableInfo.type, value)
+            self.__evaluate_expression(element.expression)
         except InterpreterError as error:
-            raise InterpreterError(error.message, str(element))
+            raise InterpreterError(error.message, str(element), error.position
+                                   or element.position)
 
-        context.variables[key] = VariableInfo(variableInfo.type, value)
+        variables[variable.slot] = self.__get_result()
 
     def evaluate_define_statement(self, element: DefineStatement):
-        key = element.identifier
-        if (key in self.__get_local_context().variables) or (
-                key in self.__get_global_context().variables):
-            raise InterpreterError(f"Variable redefinition: {key}.",
-                                   str(element))
+        variables = self.__get_local_context().variables
+        #defining a global variable again is found by type checker
+        if variables[element.slot] is not UNDEFINED:
+            raise InterpreterError(
+                f"Variable redefinition: {element.identifier}.", str(element),
+                element.position)
 
         if element.expression is None:
             value = self.__defaultValue(element.type)
         else:
-            self.__evaluate_expression(element.expression)
+            try:
+                self.__evaluate_expression(element.expression)
+            except InterpreterError as error:
+                raise InterpreterError(error.message, str(element),
+                                       error.position or element.position)
             value = self.__get_result()
 
-        #check if types match
-        try:
-            self.__check_type(element.type, value)
-        except InterpreterError as error:
-            raise InterpreterError(error.message, str(element))
-
-        self.__contextList[-1].variables[key] = VariableInfo(
-            element.type, value)
+        variables[element.slot] = value
 
     def evaluate_if_statement(self, element: IfStatement):
-        if isinstance(element.condition, INode):
-            element.condition.accept(self)
-            value = self.__get_result()
-        else:
-            value = element.condition
-
-        if bool(value):
+        if bool(self.__get_condition_value(element)):
             if isinstance(element.statement, INode):
                 element.statement.accept(self)
         elif element.elseStatement is not None:
@@ -168,13 +273,7 @@ class Interpreter(Visitor):
 
     def evaluate_while_statement(self, element: WhileStatement):
         while True:
-            if isinstance(element.condition, INode):
-                element.condition.accept(self)
-                value = self.__get_result()
-            else:
-                value = element.condition
-
-            if bool(value):
+            if bool(self.__get_condition_value(element)):
                 if isinstance(element.statement, INode):
                     element.statement.accept(self)
             else:
@@ -193,20 +292,12 @@ class Interpreter(Visitor):
                 rightValue = self.__get_result()
             else:
                 rightValue = element.rightExpression
-
-            self.__check_operands_type(leftValue, rightValue)
         except InterpreterError as error:
-            raise InterpreterError(error.message, str(element))
+            raise InterpreterError(error.message, str(element),
+                                   error.position)
 
-        try:
-            if element.operator == '+':
-                self.__results.append(leftValue + rightValue)
-            else:
-                self.__results.append(leftValue - rightValue)
-        except TypeError as error:
-            raise InterpreterError(
-                f"Unsupported operand type(s) for operator: {element.operator}",
-                str(element))
+        self.__results.append(ARITHMETIC_OPERATORS[element.operator](
+            leftValue, rightValue))
 
     def evaluate_subsexpression(self, element: SubExpression):
         try:
@@ -222,36 +313,16 @@ class Interpreter(Visitor):
             else:
                 rightValue = element.rightFactor
         except InterpreterError as error:
-            raise InterpreterError(error.message, str(element))
-
-        if (type(leftValue).__name__ == 'str'):
-            raise InterpreterError(
-                f"Invalid operation: {element.operator}, on string value: {leftValue}"
-            )
-        elif (type(rightValue).__name__ == 'str'):
-            raise InterpreterError(
-                f"Invalid operation: {element.operator}, on string value: {rightValue}"
-            )
+            raise InterpreterError(error.message, str(element), error.position
+                                   or element.position)
 
         if rightValue is None:
             result = leftValue
         else:
-            try:
-                self.__check_operands_type(leftValue, rightValue)
-            except InterpreterError as error:
-                raise InterpreterError(error.message, str(element))
-
-            if element.operator == '*':
-                result = leftValue * rightValue
-            else:
-                result = leftValue / rightValue
-
-            #because Python automaticly converts to float if int/int is fractions
-            if isinstance(leftValue, int):
-                result = math.floor(result)
+            result = self.__apply_operator(element, leftValue, rightValue)
 
         if element.isNegated:
-            result = result * -1
+            result = negate(result)
         self.__results.append(result)
 
     def evaluate_parentheses_expression(self, element: ParenthesesExpression):
@@ -270,22 +341,8 @@ class Interpreter(Visitor):
         elif element.rightCondition is not None:
             rightValue = element.rightCondition
 
-        if element.operator == '&&':
-            self.__results.append(bool(leftValue and rightValue))
-        elif element.operator == '||':
-            self.__results.append(bool(leftValue or rightValue))
-        elif element.operator == '<':
-            self.__results.append(bool(leftValue < rightValue))
-        elif element.operator == '<=':
-            self.__results.append(bool(leftValue <= rightValue))
-        elif element.operator == '>=':
-            self.__results.append(bool(leftValue >= rightValue))
-        elif element.operator == '>':
-            self.__results.append(bool(leftValue > rightValue))
-        elif element.operator == '==':
-            self.__results.append(bool(leftValue == rightValue))
-        elif element.operator == '!=':
-            self.__results.append(bool(leftValue != rightValue))
+        if (operator := CONDITION_OPERATORS.get(element.operator)) is not None:
+            self.__results.append(operator(leftValue, rightValue))
         else:
             raise InterpreterError(
                 f"Invalid operator: {element.operator}. Probably caused by error in parser implementation."
@@ -313,31 +370,28 @@ class Interpreter(Visitor):
         self.__results.append(bool(value))
 
     def evaluate_variable(self, element: Variable) -> None:
-        key = element.identifier
-        if key in self.__get_local_context().variables:
-            value = self.__get_local_context().variables[key].value
-        elif key in self.__get_global_context().variables:
-            value = self.__get_global_context().variables[key].value
-        else:
-            raise InterpreterError(message=f"Undefined variable: {key}.")
+        value = self.__contextList[0 if element.isGlobal else -1].variables[
+            element.slot]
+        if value is UNDEFINED:
+            raise InterpreterError(
+                message=f"Undefined variable: {element.identifier}.")
 
         self.__results.append(value)
 
     def __build_global_context(self, program: Program) -> None:
-        declarationDict = {}
+        declarationSet = set()
         specialsDict = {}
         for declaration in program.defineStatementList:
             key = declaration.identifier
-            if key in declarationDict:
+            if key in declarationSet:
                 raise InterpreterError(
                     f"Multiple definitions of the variable {key}.",
                     f"{declaration.type} {declaration.identifier} = {declaration.expression}"
                 )
             else:
-                declarationDict[key] = VariableInfo(declaration.type,
-                                                    declaration.expression)
+                declarationSet.add(key)
 
-        functionDefDict = self.__import_stdlib()
+        functionDefDict = std.get_function_definitions()
         for functionDef in program.functionDefList:
             key = functionDef.identifier
             if key in functionDefDict:
@@ -351,48 +405,118 @@ class Interpreter(Visitor):
             raise InterpreterError("Not found 'main' function.")
 
         self.__contextList.append(
-            Context(variables=declarationDict,
+            Context(variables=[UNDEFINED] * len(declarationSet),
                     functions=functionDefDict,
                     specials=specialsDict))
 
-    def __build_new_context(self, function: FunctionDef,
-                            element: FunctionCall):
-
-        #check number of call arguments
-        if len(function.parameters) != len(element.arguments):
-            raise InterpreterError(
-                f"Expected {len(function.parameters)} arguments, {len(element.arguments)} was provided.",
-                str(element))
+    def __get_function(self, identifier: str) -> FunctionDef:
+        function = self.__get_global_context().functions[identifier]
+        if identifier in self.__uncheckedFunctions:
+            self.__typeChecker.check_function(function)
+            if self.__optimizer is not None:
+                function = self.__optimizer.optimize_function(function)
+                self.__get_global_context().functions[identifier] = function
+            self.__resolver.resolve_function(function)
+            self.__uncheckedFunctions.discard(identifier)
+
+        return function
+
+    def __optimize_program(self, program: Program) -> Program:
+        #functions of global context are replaced with optimized ones
+        program = self.__optimizer.optimize_program(program,
+                                                    self.__uncheckedFunctions)
+        functions = self.__get_global_context().functions
+        for functionDef in program.functionDefList:
+            functions[functionDef.identifier] = functionDef
+        return program
 
+    def __initialize_global_variables(self, program: Program) -> None:
+        #initializers are evaluated in order, before main is called
+        variables = self.__get_global_context().variables
         try:
-            variablesDict = {}
-            specialsDict = {}
-            #function params to context
-            for i in range(len(function.parameters)):
-                variable = function.parameters[i]
-                argument = element.arguments[i]
-
-                if isinstance(element.arguments[i], INode):
-                    argument.accept(self)
-                    value = self.__get_result()
+            for declaration in program.defineStatementList:
+                if declaration.expression is None:
+                    value = self.__defaultValue(declaration.type)
                 else:
-                    value = argument
+                    self.__evaluate_expression(declaration.expression)
+                    value = self.__get_result()
+                variables[declaration.slot] = value
+        except InterpreterError as error:
+            raise InterpreterRuntimeError(
+                error.message, GLOBAL_SCOPE, self.__sourceHandler,
+                error.position or declaration.position)
+
+    def __call_memoized(self, function: FunctionDef) -> None:
+        #arguments are the first variables of frame
+        arguments = tuple(self.__get_local_context().variables[:len(
+            function.parameters)])
+        if (result := self.__memoCache.get(function.identifier,
+                                           arguments)) is not MISSING:
+            self.__results.append(result)
+            return
 
-                #check if argument type match declared type in function definition
-                self.__check_type(variable.type, value)
+        resultsCount = len(self.__results)
+        function.accept(self)
+        if len(self.__results) > resultsCount:
+            self.__memoCache.store(function.identifier, arguments,
+                                   self.__results[-1])
+
+    def __rebind_parameters(self, element: FunctionCall) -> None:
+        #arguments are evaluated before any parameter is changed,
+        #variables defined in body are undefined again
+        arguments = []
+        for argument in element.arguments:
+            self.__evaluate_expression(argument)
+            arguments.append(self.__get_result())
+        variables = self.__get_local_context().variables
+        variables[:] = arguments + [UNDEFINED] * (len(variables) -
+                                                  len(arguments))
 
-                variablesDict[variable.identifier] = VariableInfo(
-                    variable.type, value)
+    def __build_new_context(self, function: FunctionDef,
+                            element: FunctionCall):
+        #stdlib functions are not resolved, they have only parameters
+        variablesList = [UNDEFINED] * (function.frameSize
+                                       or len(function.parameters))
+        specialsDict = {}
+        try:
+            #parameters take first slots of frame
+            for slot, argument in enumerate(element.arguments):
+                if isinstance(argument, INode):
+                    argument.accept(self)
+                    variablesList[slot] = self.__get_result()
+                else:
+                    variablesList[slot] = argument
         except InterpreterError as error:
-            raise InterpreterError(error.message, str(element))
+            raise InterpreterError(error.message, str(element), error.position
+                                   or element.position)
 
         specialsDict[EVAL_RETURN_EXP] = function.returnType
 
         self.__contextList.append(
-            Context(variables=variablesDict,
+            Context(variables=variablesList,
                     functions={},
                     specials=specialsDict))
 
+    def __get_condition_value(self, element):
+        #condition of if or while statement
+        if not isinstance(element.condition, INode):
+            return element.condition
+
+        try:
+            element.condition.accept(self)
+        except InterpreterError as error:
+            raise InterpreterError(error.message,
+                                   position=error.position or element.position)
+        return self.__get_result()
+
+    def __apply_operator(self, element, leftValue, rightValue):
+        try:
+            return ARITHMETIC_OPERATORS[element.operator](leftValue,
+                                                          rightValue)
+        except ZeroDivisionError:
+            raise InterpreterError("Division by zero.", str(element),
+                                   element.position)
+
     def __get_local_context(self) -> Context:
         return self.__contextList[-1]
 
@@ -402,26 +526,6 @@ class Interpreter(Visitor):
     def __pop_context(self) -> None:
         self.__contextList.pop()
 
-    def __check_type(self, expectedType: str, value):
-        valueType = type(value).__name__
-        if expectedType == 'string' and valueType == 'str':
-            return
-        elif expectedType == 'frc' and valueType == 'Fraction':
-            return
-        #int and float case
-        elif valueType == expectedType:
-            return
-
-        raise InterpreterError(
-            f"Type mismatch. Expected type: {expectedType}, provided type: {valueType}"
-        )
-
-    def __check_operands_type(self, leftOperand, rightOperand):
-        if not type(leftOperand).__name__ == type(rightOperand).__name__:
-            raise InterpreterError(
-                f"Invalid operands types. Got: {type(leftOperand).__name__} and {type(rightOperand).__name__}"
-            )
-
     def __add_result(self, result) -> None:
         self.__results.append(result)
 
@@ -431,9 +535,6 @@ class Interpreter(Visitor):
 
         return self.__results.pop()
 
-    def __peek_result(self):
-        return self.__results[-1]
-
     def __evaluate_expression(self, expression):
         if isinstance(expression, INode):
             expression.accept(self)
@@ -443,71 +544,5 @@ class Interpreter(Visitor):
     def __defaultValue(self, type: str):
         if type == 'int': return 0
         elif type == 'float': return 0.0
-        elif type == 'frc': return std.functions['frc'](1, 1)
+        elif type == 'frc': return std.functions['frc']([1, 1])
         elif type == 'string': return ""
-
-    def __import_stdlib(self) -> dict:
-        functionDefDict = {}
-        functionDefDict['print'] = FunctionDef(
-            identifier='print',
-            parameters=[Parameter(type='string', identifier='number')],
-            statement=None)
-
-        functionDefDict['frc'] = FunctionDef(
-            identifier='frc',
-            parameters=[
-                Parameter(type='int', identifier='numerator'),
-                Parameter(type='int', identifier='denominator')
-            ],
-            statement=None,
-            returnType='frc')
-
-        functionDefDict['int_to_frc'] = FunctionDef(
-            identifier='int_to_frc',
-            parameters=[Parameter(type='int', identifier='number')],
-            statement=None,
-            returnType='frc')
-
-        functionDefDict['int_to_float'] = FunctionDef(
-            identifier='int_to_float',
-            parameters=[Parameter(type='int', identifier='number')],
-            statement=None,
-            returnType='float')
-
-        functionDefDict['frc_to_float'] = FunctionDef(
-            identifier='frc_to_float',
-            parameters=[Parameter(type='frc', identifier='fraction')],
-            statement=None,
-            returnType='float')
-
-        functionDefDict['float_to_int'] = FunctionDef(
-            identifier='float_to_int',
-            parameters=[Parameter(type='float', identifier='number')],
-            statement=None,
-            returnType='int')
-
-        functionDefDict['frc_to_int'] = FunctionDef(
-            identifier='frc_to_int',
-            parameters=[Parameter(type='frc', identifier='fraction')],
-            statement=None,
-            returnType='int')
-
-        functionDefDict['frc_to_string'] = FunctionDef(
-            identifier='frc_to_string',
-            parameters=[Parameter(type='frc', identifier='fraction')],
-            statement=None,
-            returnType='string')
-
-        functionDefDict['float_to_string'] = FunctionDef(
-            identifier='float_to_string',
-            parameters=[Parameter(type='float', identifier='number')],
-            statement=None,
-            returnType='string')
-
-        functionDefDict['int_to_string'] = FunctionDef(
-            identifier='int_to_string',
-            parameters=[Parameter(type='int', identifier='number')],
-            statement=None,
-            returnType='string')
-
-        return functionDefDict
\ No newline at end of file
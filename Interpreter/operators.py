@@ -0,0 +1,33 @@
+import math
+import operator
+
+
+def divide(left, right):
+    #because Python automaticly converts to float if int/int is fractions
+    if isinstance(left, int):
+        return math.floor(left / right)
+    return left / right
+
+
+def negate(value):
+    return value * -1
+
+
+# semantics of operators shared by interpreter and optimization passes
+ARITHMETIC_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': divide
+}
+
+CONDITION_OPERATORS = {
+    '&&': lambda left, right: bool(left and right),
+    '||': lambda left, right: bool(left or right),
+    '<': operator.lt,
+    '<=': operator.le,
+    '>=': operator.ge,
+    '>': operator.gt,
+    '==': operator.eq,
+    '!=': operator.ne
+}
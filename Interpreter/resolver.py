@@ -0,0 +1,133 @@
+from Parser.parser import LazyStatement
+from Parser.types import *
+
+from HelperModules.errorhandler import InterpreterError
+from Interpreter.visitor import Visitor
+
+
+class Resolver(Visitor):
+    #gives every variable an index in frame of its function or in globals,
+    #so interpreter does not look variables up by name
+    def __init__(self) -> None:
+        self.__globalSlots = {}
+        self.__localSlots = None
+        self.__function = None
+        self.__loopDepth = 0
+
+    def resolve_program(self, program: Program,
+                        skippedFunctions: set[str] = frozenset()) -> None:
+        #skipped functions are resolved later with resolve_function
+        self.__globalSlots = {}
+        for declaration in program.defineStatementList:
+            declaration.accept(self)
+
+        for functionDef in program.functionDefList:
+            if functionDef.identifier not in skippedFunctions:
+                functionDef.accept(self)
+
+    def resolve_function(self, functionDef: FunctionDef) -> None:
+        functionDef.accept(self)
+
+    def evaluate_program(self, element: Program):
+        self.resolve_program(element)
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        #parameters take first slots, in order of arguments
+        self.__localSlots = {
+            parameter.identifier: slot
+            for slot, parameter in enumerate(element.parameters)
+        }
+        self.__function = element
+        try:
+            self.__resolve(element.statement)
+            element.frameSize = len(self.__localSlots)
+        finally:
+            self.__localSlots = None
+            self.__function = None
+
+    def evaluate_function_call(self, element: FunctionCall):
+        for argument in element.arguments:
+            self.__resolve(argument)
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        for statement in element.statements:
+            self.__resolve(statement)
+
+    def evaluate_return_statement(self, element: ReturnStatement):
+        self.__resolve(element.expression)
+        #return in loop does not end it, so only other returns end function
+        #and their calls of the same function can reuse its frame
+        expression = element.expression
+        element.isTailCall = (
+            self.__loopDepth == 0 and type(expression) is FunctionCall
+            and expression.identifier == self.__function.identifier)
+
+    def evaluate_assigne_statement(self, element: AssignStatement):
+        self.__resolve(element.identifier)
+        self.__resolve(element.expression)
+
+    def evaluate_define_statement(self, element: DefineStatement):
+        #initializer can not use variable which it defines
+        self.__resolve(element.expression)
+        slots = self.__globalSlots if self.__localSlots is None else (
+            self.__localSlots)
+        #the same name defined in other branch shares the slot
+        element.slot = slots.setdefault(element.identifier, len(slots))
+
+    def evaluate_if_statement(self, element: IfStatement):
+        self.__resolve(element.condition)
+        self.__resolve(element.statement)
+        self.__resolve(element.elseStatement)
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        self.__resolve(element.condition)
+        self.__loopDepth += 1
+        try:
+            self.__resolve(element.statement)
+        finally:
+            self.__loopDepth -= 1
+
+    def evaluate_expression(self, element: Expression):
+        self.__resolve(element.leftExpression)
+        self.__resolve(element.rightExpression)
+
+    def evaluate_subsexpression(self, element: SubExpression):
+        self.__resolve(element.leftFactor)
+        self.__resolve(element.rightFactor)
+
+    def evaluate_parentheses_expression(self, element: ParenthesesExpression):
+        self.__resolve(element.expression)
+
+    def evaluate_condition(self, element: Condition):
+        self.__resolve(element.leftCondition)
+        self.__resolve(element.rightCondition)
+
+    def evaluate_subcondition(self, element: SubCondition):
+        self.__resolve(element.value)
+
+    def evaluate_parentheses_condition(self, element: ParenthesesCondition):
+        self.__resolve(element.value)
+
+    def evaluate_variable(self, element: Variable) -> None:
+        key = element.identifier
+        if self.__localSlots is not None and key in self.__localSlots:
+            element.slot = self.__localSlots[key]
+            element.isGlobal = False
+        elif key in self.__globalSlots:
+            element.slot = self.__globalSlots[key]
+            element.isGlobal = True
+        elif self.__localSlots is not None:
+            #definition was removed as never executed, slot stays undefined
+            #and using it is reported when it is executed
+            element.slot = self.__localSlots.setdefault(
+                key, len(self.__localSlots))
+            element.isGlobal = False
+        else:
+            raise InterpreterError(message=f"Undefined variable: {key}.")
+
+    def __resolve(self, value) -> None:
+        #literals and missing parts of statements have nothing to resolve
+        if isinstance(value, LazyStatement):
+            value = value.statement
+        if isinstance(value, INode):
+            value.accept(self)
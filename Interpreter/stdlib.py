@@ -1,6 +1,8 @@
 import fractions
 import math
 
+from Parser.types import FunctionDef, Parameter
+
 
 def std_print(args: list) -> None:
     print(str(args[0]))
@@ -38,3 +40,76 @@ functions = {
     'float_to_string': cast_string,
     'int_to_string': cast_string
 }
+
+#functions without side effects, result depends only on arguments
+PURE_FUNCTIONS = frozenset(functions) - {'print'}
+#pure functions failing for some arguments, like zero denominator
+FAILING_FUNCTIONS = frozenset(['frc', 'float_to_int'])
+
+
+def get_function_definitions() -> dict:
+    #signatures of functions above, bodies are not needed
+    functionDefDict = {}
+    functionDefDict['print'] = FunctionDef(
+        identifier='print',
+        parameters=[Parameter(type='string', identifier='number')],
+        statement=None)
+
+    functionDefDict['frc'] = FunctionDef(
+        identifier='frc',
+        parameters=[
+            Parameter(type='int', identifier='numerator'),
+            Parameter(type='int', identifier='denominator')
+        ],
+        statement=None,
+        returnType='frc')
+
+    functionDefDict['int_to_frc'] = FunctionDef(
+        identifier='int_to_frc',
+        parameters=[Parameter(type='int', identifier='number')],
+        statement=None,
+        returnType='frc')
+
+    functionDefDict['int_to_float'] = FunctionDef(
+        identifier='int_to_float',
+        parameters=[Parameter(type='int', identifier='number')],
+        statement=None,
+        returnType='float')
+
+    functionDefDict['frc_to_float'] = FunctionDef(
+        identifier='frc_to_float',
+        parameters=[Parameter(type='frc', identifier='fraction')],
+        statement=None,
+        returnType='float')
+
+    functionDefDict['float_to_int'] = FunctionDef(
+        identifier='float_to_int',
+        parameters=[Parameter(type='float', identifier='number')],
+        statement=None,
+        returnType='int')
+
+    functionDefDict['frc_to_int'] = FunctionDef(
+        identifier='frc_to_int',
+        parameters=[Parameter(type='frc', identifier='fraction')],
+        statement=None,
+        returnType='int')
+
+    functionDefDict['frc_to_string'] = FunctionDef(
+        identifier='frc_to_string',
+        parameters=[Parameter(type='frc', identifier='fraction')],
+        statement=None,
+        returnType='string')
+
+    functionDefDict['float_to_string'] = FunctionDef(
+        identifier='float_to_string',
+        parameters=[Parameter(type='float', identifier='number')],
+        statement=None,
+        returnType='string')
+
+    functionDefDict['int_to_string'] = FunctionDef(
+        identifier='int_to_string',
+        parameters=[Parameter(type='int', identifier='number')],
+        statement=None,
+        returnType='string')
+
+    return functionDefDict
@@ -0,0 +1,246 @@
+from Parser.parser import LazyStatement
+from Parser.types import *
+
+from HelperModules.errorhandler import InterpreterError, TypeCheckError
+from Interpreter.visitor import Visitor
+import Interpreter.stdlib as std
+
+# literals are kept in the tree as Python values
+LITERAL_TYPES = {int: 'int', float: 'float', str: 'string'}
+ORDERING_OPERATORS = frozenset(['<', '<=', '>', '>='])
+#value of condition, it is never stored in variable
+CONDITION_TYPE = 'bool'
+GLOBAL_SCOPE = "global scope"
+
+
+class TypeChecker(Visitor):
+    def __init__(self, sourceHandler=None) -> None:
+        self.__sourceHandler = sourceHandler
+        self.__functions = {}
+        self.__globalVariables = {}
+        self.__localVariables = None
+        #variables defined on every path to the checked statement
+        self.__definedVariables = set()
+        self.__returnType = None
+        self.__types = []
+
+    def check_program(self, program: Program) -> set[str]:
+        #returns names of functions which bodies are not parsed yet,
+        #they have to be checked before their first call
+        program.accept(self)
+        return {
+            functionDef.identifier
+            for functionDef in program.functionDefList
+            if isinstance(functionDef.statement, LazyStatement)
+            and not functionDef.statement.isParsed
+        }
+
+    def check_function(self, functionDef: FunctionDef) -> None:
+        functionDef.accept(self)
+
+    def evaluate_program(self, element: Program):
+        self.__functions = std.get_function_definitions()
+        for functionDef in element.functionDefList:
+            self.__functions[functionDef.identifier] = functionDef
+
+        self.__globalVariables = {}
+        try:
+            for declaration in element.defineStatementList:
+                declaration.accept(self)
+        except InterpreterError as error:
+            raise TypeCheckError(error.message, GLOBAL_SCOPE,
+                                 self.__sourceHandler)
+
+        for functionDef in element.functionDefList:
+            if not (isinstance(functionDef.statement, LazyStatement)
+                    and not functionDef.statement.isParsed):
+                functionDef.accept(self)
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        self.__localVariables = {
+            parameter.identifier: parameter.type
+            for parameter in element.parameters
+        }
+        self.__definedVariables = set(self.__localVariables)
+        self.__returnType = element.returnType
+        try:
+            self.__check_statement(element.statement)
+        except InterpreterError as error:
+            raise TypeCheckError(error.message, element.identifier,
+                                 self.__sourceHandler, element.position)
+        finally:
+            self.__localVariables = None
+
+    def evaluate_function_call(self, element: FunctionCall):
+        if (function :=
+                self.__functions.get(element.identifier)) is None:
+            raise InterpreterError(
+                f"Function {element.identifier} is undefined.", str(element))
+
+        if len(function.parameters) != len(element.arguments):
+            raise InterpreterError(
+                f"Expected {len(function.parameters)} arguments, {len(element.arguments)} was provided.",
+                str(element))
+
+        for parameter, argument in zip(function.parameters,
+                                       element.arguments):
+            self.__check_type(parameter.type, self.__get_type(argument),
+                              element)
+
+        self.__types.append(function.returnType)
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        for statement in element.statements:
+            self.__check_statement(statement)
+
+    def evaluate_return_statement(self, element: ReturnStatement):
+        if self.__returnType is None:
+            #returned value is not used, like value of function called
+            #as a statement, so function without return type may be called
+            if isinstance(element.expression, INode):
+                element.expression.accept(self)
+                self.__types.pop()
+        else:
+            self.__check_type(self.__returnType,
+                              self.__get_type(element.expression), element)
+
+    def evaluate_assigne_statement(self, element: AssignStatement):
+        key = element.identifier.identifier
+        if (variableType := self.__get_variable_type(key)) is None:
+            raise InterpreterError(f"Variable {key} was not defined",
+                                   str(element))
+
+        self.__check_type(variableType, self.__get_type(element.expression),
+                          element)
+
+    def evaluate_define_statement(self, element: DefineStatement):
+        key = element.identifier
+        #variable defined only in one branch may be defined again,
+        #but not with another type
+        if (key in self.__globalVariables or key in self.__definedVariables
+                or self.__get_variable_type(key) not in (None, element.type)):
+            raise InterpreterError(f"Variable redefinition: {key}.",
+                                   str(element))
+
+        if element.expression is not None:
+            self.__check_type(element.type,
+                              self.__get_type(element.expression), element)
+
+        if self.__localVariables is None:
+            self.__globalVariables[key] = element.type
+        else:
+            self.__localVariables[key] = element.type
+            self.__definedVariables.add(key)
+
+    def evaluate_if_statement(self, element: IfStatement):
+        self.__get_type(element.condition)
+        definedVariables = set(self.__definedVariables)
+        self.__check_statement(element.statement)
+        thenDefinedVariables = self.__definedVariables
+
+        self.__definedVariables = definedVariables
+        if element.elseStatement is not None:
+            self.__check_statement(element.elseStatement)
+        self.__definedVariables &= thenDefinedVariables
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        self.__get_type(element.condition)
+        definedVariables = set(self.__definedVariables)
+        self.__check_statement(element.statement)
+        #body may be not executed at all
+        self.__definedVariables = definedVariables
+
+    def evaluate_expression(self, element: Expression):
+        leftType = self.__get_type(element.leftExpression)
+        rightType = self.__get_type(element.rightExpression)
+        self.__check_operands_type(leftType, rightType, element)
+
+        if leftType == 'string' and element.operator != '+':
+            raise InterpreterError(
+                f"Unsupported operand type(s) for operator: {element.operator}",
+                str(element))
+
+        self.__types.append(leftType)
+
+    def evaluate_subsexpression(self, element: SubExpression):
+        leftType = self.__get_type(element.leftFactor)
+        if element.rightFactor is not None:
+            rightType = self.__get_type(element.rightFactor)
+            self.__check_operands_type(leftType, rightType, element)
+
+        if leftType == 'string':
+            raise InterpreterError(
+                f"Invalid operation: {element.operator or '-'}, on string value",
+                str(element))
+
+        self.__types.append(leftType)
+
+    def evaluate_parentheses_expression(self, element: ParenthesesExpression):
+        element.expression.accept(self)
+
+    def evaluate_condition(self, element: Condition):
+        leftType = self.__get_type(element.leftCondition)
+        if element.rightCondition is not None:
+            rightType = self.__get_type(element.rightCondition)
+            #only strings or only numbers can be ordered
+            if element.operator in ORDERING_OPERATORS and (
+                    leftType == 'string') != (rightType == 'string'):
+                raise InterpreterError(
+                    f"Invalid operands types. Got: {leftType} and {rightType}",
+                    str(element))
+
+        self.__types.append(CONDITION_TYPE)
+
+    def evaluate_subcondition(self, element: SubCondition):
+        valueType = self.__get_type(element.value)
+        self.__types.append(
+            CONDITION_TYPE if element.isNegated else valueType)
+
+    def evaluate_parentheses_condition(self, element: ParenthesesCondition):
+        self.__get_type(element.value)
+        self.__types.append(CONDITION_TYPE)
+
+    def evaluate_variable(self, element: Variable) -> None:
+        key = element.identifier
+        if (variableType := self.__get_variable_type(key)) is None:
+            raise InterpreterError(message=f"Undefined variable: {key}.")
+
+        self.__types.append(variableType)
+
+    def __get_variable_type(self, key: str):
+        if self.__localVariables is not None and (
+                key in self.__localVariables):
+            return self.__localVariables[key]
+        return self.__globalVariables.get(key)
+
+    def __get_type(self, value) -> str:
+        if not isinstance(value, INode):
+            return LITERAL_TYPES[type(value)]
+
+        value.accept(self)
+        if (valueType := self.__types.pop()) is None:
+            #function without return type is used as a value
+            raise InterpreterError("Expected return value.", str(value))
+        return valueType
+
+    def __check_statement(self, statement) -> None:
+        if isinstance(statement, LazyStatement):
+            statement = statement.statement
+        statement.accept(self)
+        #value of function called as a statement is not used
+        if type(statement) is FunctionCall:
+            self.__types.pop()
+
+    def __check_type(self, expectedType: str, valueType: str,
+                     element: INode) -> None:
+        if valueType != expectedType:
+            raise InterpreterError(
+                f"Type mismatch. Expected type: {expectedType}, provided type: {valueType}",
+                str(element))
+
+    def __check_operands_type(self, leftType: str, rightType: str,
+                              element: INode) -> None:
+        if leftType != rightType:
+            raise InterpreterError(
+                f"Invalid operands types. Got: {leftType} and {rightType}",
+                str(element))
@@ -0,0 +1,119 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable, TokenTypes
+from Lexer.regexlexer import RegexLexer
+from Lexer.tokenstream import TokenStream
+
+Edit = namedtuple("Edit", ["offset", "deletedLength", "insertedText"])
+
+
+def shifted(values: array, delta: int) -> array:
+    if not delta:
+        return values
+    return array(values.typecode, [value + delta for value in values])
+
+
+class IncrementalLexer:
+    def __init__(self, source: str, symbolsTable: SymbolsTable) -> None:
+        self.source = source
+        self.symbolsTable = symbolsTable
+        self.tokenStream = None
+        self.tokenStream = self.__lex(self.source, TokenStream(), 0, (1, 1))
+
+    def __lex(self,
+              source: str,
+              tokenStream: TokenStream,
+              startOffset: int,
+              startPosition: tuple,
+              oldStream: TokenStream = None,
+              edit: Edit = None) -> TokenStream:
+        lexer = RegexLexer(sourceHandler=DirectInputHandler(source),
+                           symbolsTable=self.symbolsTable,
+                           startOffset=startOffset,
+                           startPosition=startPosition)
+        tokenStream.sourceHandler = lexer.sourceHandler
+        while True:
+            token = lexer.get_token()
+            if token.type == TokenTypes.EOF:
+                tokenStream.append(token)
+                return tokenStream
+
+            if oldStream is not None and (oldIndex := self.__find_aligned(
+                    oldStream, edit, token.offset)) is not None:
+                self.__splice(tokenStream, oldStream, oldIndex, token, edit)
+                return tokenStream
+
+            tokenStream.append(token)
+
+    def __find_aligned(self, oldStream: TokenStream, edit: Edit,
+                       offset: int):
+        #behind the edit source text is unchanged, so a token starting at the
+        #same place as before is followed by the same tokens as before
+        if offset < edit.offset + len(edit.insertedText):
+            return None
+
+        oldOffset = offset - len(edit.insertedText) + edit.deletedLength
+        oldIndex = bisect_left(oldStream.offsets, oldOffset)
+        if oldIndex < len(oldStream) - 1 and oldStream.offsets[
+                oldIndex] == oldOffset:
+            return oldIndex
+        return None
+
+    def __splice(self, tokenStream: TokenStream, oldStream: TokenStream,
+                 oldIndex: int, token, edit: Edit) -> None:
+        line, column = token.position
+        oldLine = oldStream.lines[oldIndex]
+        lineDelta = line - oldLine
+        columnDelta = column - oldStream.columns[oldIndex]
+        offsetDelta = len(edit.insertedText) - edit.deletedLength
+
+        #only tokens in the line where the edit ends change their columns
+        lineEnd = bisect_right(oldStream.lines, oldLine, lo=oldIndex)
+
+        tokenStream.types += oldStream.types[oldIndex:]
+        tokenStream.valueIds += oldStream.valueIds[oldIndex:]
+        tokenStream.offsets += shifted(oldStream.offsets[oldIndex:],
+                                       offsetDelta)
+        tokenStream.lines += shifted(oldStream.lines[oldIndex:], lineDelta)
+        tokenStream.columns += shifted(oldStream.columns[oldIndex:lineEnd],
+                                       columnDelta)
+        tokenStream.columns += oldStream.columns[lineEnd:]
+
+    def apply_edit(self, edit: Edit) -> TokenStream:
+        if edit.offset < 0 or edit.deletedLength < 0 or edit.offset + edit.deletedLength > len(
+                self.source):
+            raise ValueError(f"Edit out of source bounds: {edit}.")
+
+        oldSource, oldStream = self.source, self.tokenStream
+        self.source = oldSource[:edit.offset] + edit.insertedText + oldSource[
+            edit.offset + edit.deletedLength:]
+        self.tokenStream = None
+
+        if oldStream is None:
+            #previous source was invalid, there is nothing to reuse
+            self.tokenStream = self.__lex(self.source, TokenStream(), 0,
+                                          (1, 1))
+            return self.tokenStream
+
+        #token before the edit may grow into it ("ab" -> "abc"),
+        #so lexing restarts from the last token starting before the edit
+        restartIndex = bisect_left(oldStream.offsets, edit.offset) - 1
+        tokenStream = TokenStream(internFrom=oldStream)
+        if restartIndex < 0:
+            startOffset, startPosition = 0, (1, 1)
+        else:
+            startOffset = oldStream.offsets[restartIndex]
+            startPosition = (oldStream.lines[restartIndex],
+                             oldStream.columns[restartIndex])
+            tokenStream.types = oldStream.types[:restartIndex]
+            tokenStream.lines = oldStream.lines[:restartIndex]
+            tokenStream.columns = oldStream.columns[:restartIndex]
+            tokenStream.offsets = oldStream.offsets[:restartIndex]
+            tokenStream.valueIds = oldStream.valueIds[:restartIndex]
+
+        self.tokenStream = self.__lex(self.source, tokenStream, startOffset,
+                                      startPosition, oldStream, edit)
+        return self.tokenStream
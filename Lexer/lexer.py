@@ -2,10 +2,12 @@ from HelperModules.sourcehandler import SourceHandler
 from HelperModules.symbols import SymbolsTable, TokenTypes
 from HelperModules.errorhandler import LexerError
 from Lexer.token import Token
+from Lexer.tokenstream import TokenStream
 
 MAX_INT_LITERAL = 2147483647
 MAX_FLOAT_LITERAL = 3.402823466e+38
 MAX_STRING_SIZE = 2**16
+ALLOWED_AFTER_NUMBER = ["=", "<", "<=", ">", ">=", "==", "!=", "+", "-", "*", "/", "(", ")", ";", ","]
 
 class Lexer:
     def __init__(self, sourceHandler: SourceHandler, symbolsTable: SymbolsTable):
@@ -15,7 +17,7 @@ class Lexer:
         self.sourceHandler = sourceHandler
         self.symbolsTable = symbolsTable
         self.currentToken = None
-        self.allowedAfterNumber = ["=", "<", "<=", ">", ">=", "==", "!=", "+", "-", "*", "/", "(", ")", ";", ","]
+        self.allowedAfterNumber = ALLOWED_AFTER_NUMBER
 
         self.sourceHandler.get_next_char()
 
@@ -39,6 +41,7 @@ class Lexer:
                     raise LexerError("Invalid token, identifier length exceeded 2^16 chars.", self.sourceHandler)
             
             #check if builded identifier is a keyword else it is new identifier
+            buffer = self.symbolsTable.intern(buffer)
             if buffer in self.symbolsTable.keywordsDict:
                 return Token(type=self.symbolsTable.keywordsDict[buffer], value=buffer, position=position)
             else:
@@ -71,7 +74,7 @@ class Lexer:
                     if not(self.__get_current_char() in self.allowedAfterNumber or self.__get_current_char().isspace()):
                         raise LexerError("Invalid token", self.sourceHandler)
 
-                    return Token(type=TokenTypes.FLOAT_LITERAL, value=float(buffer), position=position)
+                    return Token(type=TokenTypes.FLOAT_LITERAL, value=self.symbolsTable.intern(float(buffer)), position=position)
                 else:
                     self.__get_next_char()
                     raise LexerError("Invlaid token, expected decimal after '.'", self.sourceHandler)
@@ -80,7 +83,7 @@ class Lexer:
                 if not(self.__get_current_char() in self.allowedAfterNumber or self.__get_current_char().isspace()):
                     raise LexerError("Invalid token", self.sourceHandler)
 
-                return Token(type=TokenTypes.INTEGER_LITERAL, value=int(buffer), position=position)
+                return Token(type=TokenTypes.INTEGER_LITERAL, value=self.symbolsTable.intern(int(buffer)), position=position)
             
         return None
     
@@ -90,6 +93,9 @@ class Lexer:
         if self.__get_current_char() == '\"':
             buffer = ""
             while self.__get_next_char() != '\"':
+                if self.sourceHandler.is_eof():
+                    raise LexerError("Invalid token, unterminated string literal.", self.sourceHandler)
+
                 if self.__get_current_char() == '\\':
                     buffer += self.__get_next_char()
                 else:
@@ -99,7 +105,7 @@ class Lexer:
                     raise LexerError("Invalid token, string literal exceeded 2^16 chars.", self.sourceHandler)
 
             self.__get_next_char()        
-            return Token(type=TokenTypes.STRING_LITERAL, value=buffer, position=position)
+            return Token(type=TokenTypes.STRING_LITERAL, value=self.symbolsTable.intern(buffer), position=position)
 
         return None
 
@@ -154,7 +160,7 @@ class Lexer:
 
     def __discard_comment(self) -> None:
         while self.__get_current_char() == '#':
-            while self.__get_next_char() != '\n':
+            while self.__get_next_char() != '\n' and not self.sourceHandler.is_eof():
                 pass
             self.__get_next_char()
 
@@ -164,6 +170,7 @@ class Lexer:
             self.__discrad_whitespaces()
 
         position = self.__get_position()
+        offset = self.sourceHandler.get_offset()
 
         for try_build_token in [self.__try_build_id, 
                                 self.__try_build_number,
@@ -172,6 +179,7 @@ class Lexer:
                                 self.__try_build_single_char_symbol]:
             if token := try_build_token():
                 token.position = position
+                token.offset = offset
                 self.currentToken = token
                 if verbose:
                     print(token)
@@ -182,4 +190,13 @@ class Lexer:
         if self.__get_current_char():
             raise LexerError("Uknown token", self.sourceHandler)  
         else:
-            return Token(type=TokenTypes.EOF, value="EOF", position=position)    
\ No newline at end of file
+            return Token(type=TokenTypes.EOF, value="EOF", position=position, offset=offset)    
+
+    def tokenize(self) -> TokenStream:
+        tokenStream = TokenStream()
+        tokenStream.sourceHandler = self.sourceHandler
+        while True:
+            token = self.get_token()
+            tokenStream.append(token)
+            if token.type == TokenTypes.EOF:
+                return tokenStream
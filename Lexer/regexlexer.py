@@ -0,0 +1,218 @@
+import copy
+import re
+
+from HelperModules.sourcehandler import SourceHandler
+from HelperModules.symbols import SymbolsTable, TokenTypes
+from HelperModules.errorhandler import LexerError
+from Lexer.lexer import MAX_STRING_SIZE, ALLOWED_AFTER_NUMBER
+from Lexer.token import Token
+from Lexer.tokenstream import TokenStream
+
+#whitespaces and comments are skipped in the same match as the following token
+TOKEN_PATTERN = re.compile(r"""
+    (?:\s+|\#[^\n]*\n?)*
+    (?:
+        (?P<id>[^\W\d]\w*)
+        |(?P<number>0|\d+)
+        |(?P<string>")
+        |(?P<symbol><=|>=|==|!=|->|&&|\|\||[.,!=<>+\-*/;(){}])
+        |(?P<logic>[&|])
+    )?""", re.VERBOSE)
+DECIMAL_PATTERN = re.compile(r"\d+")
+STRING_BODY_PATTERN = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+#strings and comments are matched whole, so braces inside are skipped
+BLOCK_PATTERN = re.compile(r"""
+    "(?:[^"\\]|\\.)*"?
+    |\#[^\n]*
+    |(?P<open>\{)
+    |(?P<close>\})""", re.VERBOSE | re.DOTALL)
+
+
+class RegexLexer:
+    def __init__(self,
+                 sourceHandler: SourceHandler,
+                 symbolsTable: SymbolsTable,
+                 startOffset: int = 0,
+                 startPosition: tuple = (1, 1)):
+        if sourceHandler is None or symbolsTable is None:
+            raise LexerError("SourceHandler was not provided.", None)
+
+        self.sourceHandler = sourceHandler
+        self.symbolsTable = symbolsTable
+        self.currentToken = None
+        self.__symbolsDict = {
+            **symbolsTable.singleCharSymbolsDict,
+            **symbolsTable.doubleCharSymbolsDict
+        }
+
+        self.__text = sourceHandler.read_all()
+        self.__pos = startOffset
+        # line of the current position and offset of the last '\n' before it
+        self.__line, column = startPosition
+        self.__lineStart = startOffset - column
+
+    def __advance(self, end: int) -> None:
+        if newLines := self.__text.count('\n', self.__pos, end):
+            self.__line += newLines
+            self.__lineStart = self.__text.rfind('\n', self.__pos, end)
+        self.__pos = end
+
+    def __get_position(self, offset: int) -> tuple:
+        #the same position as SourceHandler reports after reading char at offset,
+        #after the last char it stays on it
+        offset = min(offset, len(self.__text) - 1)
+        if offset < self.__pos:
+            return (self.__line, max(offset - self.__lineStart, 0))
+
+        newLines = self.__text.count('\n', self.__pos, offset + 1)
+        if newLines:
+            lineStart = self.__text.rfind('\n', self.__pos, offset + 1)
+        else:
+            lineStart = self.__lineStart
+        return (self.__line + newLines, offset - lineStart)
+
+    def __get_char(self, offset: int) -> str:
+        return self.__text[offset] if offset < len(self.__text) else ''
+
+    def __error(self, message: str, offset: int) -> LexerError:
+        return LexerError(message, self.sourceHandler,
+                          self.__get_position(offset))
+
+    def __build_id(self, buffer: str, start: int) -> Token:
+        if not (buffer[0].isalpha() or buffer[0] == '_'):
+            raise self.__error("Uknown token", start)
+
+        if len(buffer) > MAX_STRING_SIZE:
+            raise self.__error(
+                "Invalid token, identifier length exceeded 2^16 chars.",
+                start + MAX_STRING_SIZE)
+
+        self.__pos = start + len(buffer)
+        buffer = self.symbolsTable.intern(buffer)
+        if tokenType := self.symbolsTable.keywordsDict.get(buffer):
+            return Token(type=tokenType, value=buffer)
+        else:
+            return Token(type=TokenTypes.IDENTIFIER, value=buffer)
+
+    def __build_number(self, start: int, end: int) -> Token:
+        if self.__get_char(end) == '.':
+            if not self.__get_char(end + 1).isdecimal():
+                raise self.__error("Invlaid token, expected decimal after '.'",
+                                   end + 2)
+
+            end = DECIMAL_PATTERN.match(self.__text, end + 1).end()
+            nextChar = self.__get_char(end)
+            if not (nextChar in ALLOWED_AFTER_NUMBER or nextChar.isspace()):
+                raise self.__error("Invalid token", end)
+
+            self.__pos = end
+            return Token(type=TokenTypes.FLOAT_LITERAL,
+                         value=self.symbolsTable.intern(
+                             float(self.__text[start:end])))
+
+        nextChar = self.__get_char(end)
+        if not (nextChar in ALLOWED_AFTER_NUMBER or nextChar.isspace()):
+            raise self.__error("Invalid token", end)
+
+        self.__pos = end
+        return Token(type=TokenTypes.INTEGER_LITERAL,
+                     value=self.symbolsTable.intern(int(
+                         self.__text[start:end])))
+
+    def __build_string_literal(self, start: int) -> Token:
+        bodyEnd = STRING_BODY_PATTERN.match(self.__text, start + 1).end()
+        body = self.__text[start + 1:bodyEnd]
+        buffer = ESCAPE_PATTERN.sub(r"\1", body) if '\\' in body else body
+
+        if len(buffer) > MAX_STRING_SIZE:
+            raise self.__error(
+                "Invalid token, string literal exceeded 2^16 chars.",
+                self.__find_string_overflow(start))
+
+        if self.__get_char(bodyEnd) != '\"':
+            raise self.__error("Invalid token, unterminated string literal.",
+                               len(self.__text))
+
+        self.__advance(bodyEnd + 1)
+        return Token(type=TokenTypes.STRING_LITERAL,
+                     value=self.symbolsTable.intern(buffer))
+
+    def __find_string_overflow(self, start: int) -> int:
+        offset = start + 1
+        length = 0
+        while length <= MAX_STRING_SIZE:
+            if self.__text[offset] == '\\':
+                offset += 1
+            length += 1
+            offset += 1
+        return offset - 1
+
+    def get_token(self, verbose: bool = False) -> Token:
+        match = TOKEN_PATTERN.match(self.__text, self.__pos)
+        kind = match.lastgroup
+        start, end = match.span(kind) if kind else (match.end(), match.end())
+        if start != self.__pos:
+            self.__advance(start)
+        position = (self.__line, start - self.__lineStart)
+
+        if kind == 'symbol':
+            self.__pos = end
+            symbol = self.__text[start:end]
+            token = Token(type=self.__symbolsDict[symbol], value=symbol)
+        elif kind == 'id':
+            token = self.__build_id(self.__text[start:end], start)
+        elif kind == 'number':
+            token = self.__build_number(start, end)
+        elif kind == 'string':
+            token = self.__build_string_literal(start)
+        elif kind == 'logic':
+            raise self.__error(
+                f"Invalid token, expected {self.__text[start]}, got {self.__get_char(end)}",
+                end)
+        elif start < len(self.__text):
+            raise self.__error("Uknown token", start)
+        else:
+            return Token(type=TokenTypes.EOF,
+                         value="EOF",
+                         position=self.__get_position(start),
+                         offset=start)
+
+        token.position = position
+        token.offset = start
+        self.currentToken = token
+        if verbose:
+            print(token)
+
+        return token
+
+    def tokenize(self) -> TokenStream:
+        tokenStream = TokenStream()
+        tokenStream.sourceHandler = self.sourceHandler
+        while True:
+            token = self.get_token()
+            tokenStream.append(token)
+            if token.type == TokenTypes.EOF:
+                return tokenStream
+
+    def skip_block(self) -> "RegexLexer":
+        #current token opens a block, returned lexer starts at it and this one
+        #moves behind its closing brace, None when the block is not closed
+        token = self.currentToken
+        depth = 1
+        for match in BLOCK_PATTERN.finditer(self.__text, self.__pos):
+            if match.lastgroup == "open":
+                depth += 1
+            elif match.lastgroup == "close":
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            return None
+
+        blockLexer = copy.copy(self)
+        blockLexer.__pos = token.offset
+        blockLexer.__line, column = token.position
+        blockLexer.__lineStart = token.offset - column
+        self.__advance(match.end())
+        return blockLexer
@@ -1,8 +1,15 @@
 class Token:
-    def __init__(self, type: int, value, position: tuple = (0, 0)):
+    __slots__ = ("type", "value", "position", "offset")
+
+    def __init__(self,
+                 type: int,
+                 value,
+                 position: tuple = (0, 0),
+                 offset: int = 0):
         self.type = type
         self.value = value
         self.position = position
+        self.offset = offset
 
     def __repr__(self):
-        return f"Token: {self.type}, {self.value}"
\ No newline at end of file
+        return f"Token: {self.type}, {self.value}"
@@ -0,0 +1,130 @@
+import re
+from array import array
+
+from HelperModules.symbols import TokenTypes
+from Lexer.token import Token
+
+TOKEN_TYPES = tuple(TokenTypes)
+TOKEN_CODES = {tokenType: code for code, tokenType in enumerate(TOKEN_TYPES)}
+OPEN_BRACE_CODE = TOKEN_CODES[TokenTypes.OPEN_BRACE]
+CLOSE_BRACE_CODE = TOKEN_CODES[TokenTypes.CLOSE_BRACE]
+#searched directly in array of token types
+BRACE_CODES_PATTERN = re.compile(
+    re.escape(bytes([OPEN_BRACE_CODE])) + b'|' +
+    re.escape(bytes([CLOSE_BRACE_CODE])))
+
+
+class TokenStream:
+    def __init__(self, internFrom: "TokenStream" = None) -> None:
+        # struct of arrays, one entry per token
+        self.types = array('B')
+        self.lines = array('I')
+        self.columns = array('I')
+        self.offsets = array('I')
+        self.valueIds = array('I')
+
+        # source of tokens, lines shown in error messages are read from it
+        self.sourceHandler = None
+
+        # interned token values, shared by all tokens with equal value
+        if internFrom is None:
+            self.values = []
+            self.__valueIndex = {}
+        else:
+            #value ids of both streams stay interchangeable
+            self.values = internFrom.values
+            self.__valueIndex = internFrom.__valueIndex
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __intern(self, value) -> int:
+        #type is a part of the key, so 1 and 1.0 are different values
+        key = (value.__class__, value)
+        if (valueId := self.__valueIndex.get(key)) is None:
+            valueId = self.__valueIndex[key] = len(self.values)
+            self.values.append(value)
+
+        return valueId
+
+    def append(self, token: Token) -> None:
+        line, column = token.position
+        self.types.append(TOKEN_CODES[token.type])
+        self.lines.append(line)
+        self.columns.append(column)
+        self.offsets.append(token.offset)
+        self.valueIds.append(self.__intern(token.value))
+
+    def get_token(self, index: int) -> Token:
+        return Token(type=TOKEN_TYPES[self.types[index]],
+                     value=self.values[self.valueIds[index]],
+                     position=(self.lines[index], self.columns[index]),
+                     offset=self.offsets[index])
+
+    def cursor(self) -> "TokenCursor":
+        return TokenCursor(self)
+
+
+class CursorToken(Token):
+    __slots__ = ("_tokenStream", "_index")
+
+    def __init__(self, tokenStream: TokenStream) -> None:
+        self._tokenStream = tokenStream
+        self._index = -1
+        self.type = None
+        self.value = None
+
+    @property
+    def position(self) -> tuple:
+        return (self._tokenStream.lines[self._index],
+                self._tokenStream.columns[self._index])
+
+    @property
+    def offset(self) -> int:
+        return self._tokenStream.offsets[self._index]
+
+
+class TokenCursor:
+    def __init__(self, tokenStream: TokenStream) -> None:
+        self.tokenStream = tokenStream
+        self.sourceHandler = tokenStream.sourceHandler
+        self.currentToken = CursorToken(tokenStream)
+        self.__index = 0
+
+    def get_token(self, verbose: bool = False) -> Token:
+        #returned token is reused by the next call, copy it to keep it
+        token = self.currentToken
+        index = self.__index
+        token._index = index
+        token.type = TOKEN_TYPES[self.tokenStream.types[index]]
+        token.value = self.tokenStream.values[self.tokenStream.valueIds[index]]
+
+        #after EOF cursor stays on it
+        if index + 1 < len(self.tokenStream):
+            self.__index = index + 1
+
+        if verbose:
+            print(token)
+
+        return token
+
+    def skip_block(self) -> "TokenCursor":
+        #current token opens a block, returned cursor starts at it and this one
+        #moves behind its closing brace, None when the block is not closed
+        start = self.currentToken._index
+        depth = 0
+        for match in BRACE_CODES_PATTERN.finditer(self.tokenStream.types,
+                                                  start):
+            if self.tokenStream.types[match.start()] == OPEN_BRACE_CODE:
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    break
+        else:
+            return None
+
+        blockCursor = TokenCursor(self.tokenStream)
+        blockCursor.__index = start
+        self.__index = match.end()
+        return blockCursor
@@ -0,0 +1,144 @@
+from Parser.parser import LazyStatement
+from Parser.types import *
+
+from Optimizer.deadcode import count_nodes
+from Optimizer.loopinvariants import find_changed_names
+from Optimizer.temporaries import ExpressionReplacer, TemporaryTransformer
+from Optimizer.transformer import has_side_effects, iterate_nodes
+
+#names of temporaries can not be written in source code
+TEMPORARY_NAME = "$common{}"
+#nodes computing a value, which is worth keeping in a variable
+EXPRESSION_NODES = (Expression, SubExpression, ParenthesesExpression,
+                    FunctionCall)
+
+
+def get_expression_fields(statement) -> tuple:
+    #fields evaluated once, before statement changes any variable,
+    #nested statements are not a part of them
+    if type(statement) in (AssignStatement, DefineStatement,
+                           ReturnStatement):
+        return ("expression", )
+    if type(statement) is FunctionCall:
+        return ("arguments", )
+    if type(statement) is IfStatement:
+        return ("condition", )
+    return ()
+
+
+class CommonSubexpressionEliminator(TemporaryTransformer):
+    #evaluates expression repeated in statements of a block once, when
+    #variables it reads are not changed between its evaluations, nodes
+    #are compared by their structure
+    def __init__(self) -> None:
+        super().__init__(TEMPORARY_NAME)
+        #numbers of saved evaluations by function names
+        self.eliminatedExpressions = {}
+        self.__eliminated = 0
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        self.__eliminated = 0
+        super().evaluate_function_definition(element)
+        if self.__eliminated:
+            self.eliminatedExpressions[element.identifier] = (
+                self.eliminatedExpressions.get(element.identifier, 0) +
+                self.__eliminated)
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        #expression with index of statement evaluating it first and number
+        #of its evaluations, it is forgotten when its variable is changed
+        available = {}
+        records = []
+        usedRecords = []
+        statements = []
+        for index, statement in enumerate(element.statements):
+            if isinstance(statement, LazyStatement):
+                statement = statement.statement
+            used = {}
+            for field in get_expression_fields(statement):
+                self.__count(getattr(statement, field), index, available,
+                             records, used)
+            usedRecords.append(used)
+            statements.append(self.transform_statement(statement))
+
+            changedNames = find_changed_names(statement)
+            for expression in [
+                    expression for expression in available
+                    if any(node.identifier in changedNames
+                           for node in iterate_nodes(expression)
+                           if type(node) is Variable)
+            ]:
+                del available[expression]
+
+        repeated = [record for record in records if record[2] > 1]
+        if not repeated:
+            self.push(
+                self.rebuild(element,
+                             statements=[
+                                 node for nodes in statements
+                                 for node in nodes
+                             ]))
+            return
+
+        names = {}
+        result = []
+        for index, nodes in enumerate(statements):
+            #smaller expressions may be used by larger ones
+            for record in sorted(
+                (record for record in repeated if record[1] == index),
+                    key=lambda record: count_nodes(record[0])):
+                names[id(record)] = self.new_temporary()
+                self.__eliminated += record[2] - 1
+                result.append(
+                    self.store_temporary(
+                        names[id(record)],
+                        self.__replace(record[0], usedRecords[index], names,
+                                       record[0])))
+
+            for node in nodes:
+                changes = {
+                    field: self.__replace(getattr(node, field),
+                                          usedRecords[index], names)
+                    for field in get_expression_fields(node)
+                }
+                result.append(self.rebuild(node, **changes))
+
+        self.push(self.rebuild(element, statements=result))
+
+    def __count(self, value, index: int, available: dict, records: list,
+                used: dict) -> None:
+        #largest repeated expressions are counted, parts of them are not
+        values = [value]
+        while values:
+            value = values.pop()
+            if isinstance(value, list):
+                values.extend(value)
+                continue
+            if not isinstance(value, INode):
+                continue
+
+            if self.__is_candidate(value):
+                if (record := available.get(value)) is not None:
+                    record[2] += 1
+                    used[value] = record
+                    continue
+                record = [value, index, 1]
+                available[value] = record
+                records.append(record)
+                used[value] = record
+            values.extend(getattr(value, field) for field in value.fields)
+
+    def __is_candidate(self, node: INode) -> bool:
+        return type(node) in EXPRESSION_NODES and self.get_type(
+            node) is not None and not has_side_effects(node) and all(
+                self.is_available(child.identifier)
+                for child in iterate_nodes(node) if type(child) is Variable)
+
+    def __replace(self, value, used: dict, names: dict, root=None):
+        #root of expression kept in temporary is not replaced with it
+        def get_temporary(node: INode):
+            if node is root or (record := used.get(node)) is None:
+                return None
+            return names.get(id(record))
+
+        return ExpressionReplacer(get_temporary).transform(value)
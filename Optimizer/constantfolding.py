@@ -0,0 +1,148 @@
+from collections import Counter
+
+from Parser.types import *
+
+from Interpreter.operators import (ARITHMETIC_OPERATORS,
+                                   CONDITION_OPERATORS, negate)
+from Optimizer.transformer import Transformer, is_literal, iterate_nodes
+import Interpreter.stdlib as std
+
+
+def find_constant_definitions(functionDef: FunctionDef) -> set[int]:
+    #ids of definitions in function body, not nested in if or while, of
+    #variables which are never assigned, they are defined before every use
+    body = functionDef.statement
+    nodes = list(iterate_nodes(body))
+    assigned = {
+        node.identifier.identifier
+        for node in nodes if type(node) is AssignStatement
+    }
+    definitions = Counter(node.identifier for node in nodes
+                          if type(node) is DefineStatement)
+
+    statements = nodes[0].statements if type(
+        nodes[0]) is StatementBlock else [nodes[0]]
+    return {
+        id(statement)
+        for statement in statements if type(statement) is DefineStatement
+        and statement.expression is not None and statement.identifier not in
+        assigned and definitions[statement.identifier] == 1
+    }
+
+
+def is_bool(value) -> bool:
+    return isinstance(value, (bool, Condition, ParenthesesCondition)) or (
+        type(value) is SubCondition and value.isNegated)
+
+
+def as_bool(value):
+    #condition giving bool of value, like ParenthesesCondition does
+    return value if is_bool(value) else ParenthesesCondition(value)
+
+
+class ConstantFolder(Transformer):
+    #evaluates parts of expressions and conditions made of literals and
+    #replaces never assigned local variables with their literal values
+    def __init__(self) -> None:
+        super().__init__()
+        self.__constantDefinitions = set()
+        self.__constants = {}
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        self.__constantDefinitions = find_constant_definitions(element)
+        try:
+            self.push(self.rebuild(element))
+        finally:
+            self.__constantDefinitions = set()
+            self.__constants = {}
+
+    def evaluate_define_statement(self, element: DefineStatement):
+        node = self.rebuild(element)
+        if id(element) in self.__constantDefinitions and is_literal(
+                node.expression):
+            self.__constants[node.identifier] = node.expression
+        self.push(node)
+
+    def evaluate_variable(self, element: Variable) -> None:
+        self.push(self.__constants.get(element.identifier, element))
+
+    def evaluate_function_call(self, element: FunctionCall):
+        node = self.rebuild(element)
+        if node.identifier in std.PURE_FUNCTIONS and all(
+                is_literal(argument) for argument in node.arguments):
+            try:
+                self.push(std.functions[node.identifier](node.arguments))
+                return
+            except (ArithmeticError, ValueError):
+                #error is reported when the call is executed
+                pass
+        self.push(node)
+
+    def evaluate_expression(self, element: Expression):
+        node = self.rebuild(element)
+        if is_literal(node.leftExpression) and is_literal(
+                node.rightExpression):
+            self.push(ARITHMETIC_OPERATORS[node.operator](
+                node.leftExpression, node.rightExpression))
+        else:
+            self.push(node)
+
+    def evaluate_subsexpression(self, element: SubExpression):
+        node = self.rebuild(element)
+        if not is_literal(node.leftFactor) or not (
+                node.rightFactor is None or is_literal(node.rightFactor)):
+            self.push(node)
+            return
+
+        try:
+            value = node.leftFactor
+            if node.rightFactor is not None:
+                value = ARITHMETIC_OPERATORS[node.operator](value,
+                                                            node.rightFactor)
+        except ArithmeticError:
+            #division by zero is reported when it is executed
+            self.push(node)
+            return
+
+        self.push(negate(value) if node.isNegated else value)
+
+    def evaluate_parentheses_expression(self, element: ParenthesesExpression):
+        node = self.rebuild(element)
+        self.push(node.expression
+                  if is_literal(node.expression) else node)
+
+    def evaluate_condition(self, element: Condition):
+        node = self.rebuild(element)
+        left, right = node.leftCondition, node.rightCondition
+        if is_literal(left) and is_literal(right):
+            self.push(CONDITION_OPERATORS[node.operator](left, right))
+        #both sides are always evaluated, so only literal side is dropped
+        elif node.operator == '&&' and is_literal(right) and right:
+            self.push(as_bool(left))
+        elif node.operator == '&&' and is_literal(left) and left:
+            self.push(as_bool(right))
+        elif node.operator == '||' and is_literal(right) and not right:
+            self.push(as_bool(left))
+        elif node.operator == '||' and is_literal(left) and not left:
+            self.push(as_bool(right))
+        else:
+            self.push(node)
+
+    def evaluate_subcondition(self, element: SubCondition):
+        node = self.rebuild(element)
+        if not node.isNegated:
+            #gives value of its part unchanged
+            self.push(node.value)
+        elif is_literal(node.value):
+            self.push(not bool(node.value))
+        else:
+            self.push(node)
+
+    def evaluate_parentheses_condition(self, element: ParenthesesCondition):
+        node = self.rebuild(element)
+        if is_literal(node.value):
+            self.push(bool(node.value))
+        elif is_bool(node.value):
+            self.push(node.value)
+        else:
+            self.push(node)
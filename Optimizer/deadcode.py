@@ -0,0 +1,121 @@
+from collections import Counter
+
+from Parser.types import *
+
+from Optimizer.transformer import (Transformer, has_side_effects, is_literal,
+                                   iterate_nodes)
+
+
+def count_nodes(value) -> int:
+    return sum(1 for _ in iterate_nodes(value))
+
+
+def always_returns(statement) -> bool:
+    #while loop may not run its body, so it is never sure to return
+    if type(statement) is ReturnStatement:
+        return True
+    if type(statement) is StatementBlock:
+        return any(map(always_returns, statement.statements))
+    if type(statement) is IfStatement:
+        return always_returns(statement.statement) and always_returns(
+            statement.elseStatement)
+    return False
+
+
+def find_unused_definitions(functionDef: FunctionDef) -> set[int]:
+    #ids of definitions of variables never used in function, definitions
+    #in loops or of names defined twice may end with redefinition error
+    nodes = list(iterate_nodes(functionDef.statement))
+    usedNames = {node.identifier for node in nodes if type(node) is Variable}
+    definedNames = Counter(node.identifier for node in nodes
+                           if type(node) is DefineStatement)
+    nodesInLoops = {
+        id(node)
+        for loop in nodes if type(loop) is WhileStatement
+        for node in iterate_nodes(loop.statement)
+    }
+    return {
+        id(node)
+        for node in nodes
+        if type(node) is DefineStatement and id(node) not in nodesInLoops
+        and node.identifier not in usedNames
+        and definedNames[node.identifier] == 1
+        and not has_side_effects(node.expression)
+    }
+
+
+class DeadCodeEliminator(Transformer):
+    #removes statements which are never executed or have no effect,
+    #removed statement is replaced with None on the stack
+    def __init__(self) -> None:
+        super().__init__()
+        self.removedNodes = 0
+        self.__unusedDefinitions = set()
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        node = self.rebuild(element, statement=self.__transform_statement(
+            element.statement))
+        #removing a definition can make variables of its initializer unused
+        while unusedDefinitions := find_unused_definitions(node):
+            self.__unusedDefinitions = unusedDefinitions
+            try:
+                node = self.rebuild(node, statement=self.__transform_statement(
+                    node.statement))
+            finally:
+                self.__unusedDefinitions = set()
+        self.push(node)
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        statements = []
+        for index, statement in enumerate(element.statements):
+            if (node := self.transform(statement)) is not None:
+                statements.append(node)
+            if always_returns(node):
+                #following statements are never executed
+                self.__remove(element.statements[index + 1:])
+                break
+        self.push(self.rebuild(element, statements=statements))
+
+    def evaluate_define_statement(self, element: DefineStatement):
+        if id(element) in self.__unusedDefinitions:
+            self.__remove(element)
+            self.push(None)
+        else:
+            super().evaluate_define_statement(element)
+
+    def evaluate_if_statement(self, element: IfStatement):
+        if not is_literal(element.condition):
+            self.push(
+                self.rebuild(
+                    element,
+                    statement=self.__transform_statement(element.statement),
+                    elseStatement=self.transform(element.elseStatement)))
+            return
+
+        #arm of constant condition is executed without the if statement
+        self.removedNodes += 1
+        if element.condition:
+            self.__remove(element.elseStatement)
+            self.push(self.transform(element.statement))
+        else:
+            self.__remove(element.statement)
+            self.push(self.transform(element.elseStatement))
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        if is_literal(element.condition) and not element.condition:
+            self.__remove(element)
+            self.push(None)
+        else:
+            self.push(
+                self.rebuild(element,
+                             statement=self.__transform_statement(
+                                 element.statement)))
+
+    def __transform_statement(self, statement):
+        #statement required by parent node can not be removed, it is emptied
+        if (node := self.transform(statement)) is None:
+            return StatementBlock([])
+        return node
+
+    def __remove(self, value) -> None:
+        self.removedNodes += count_nodes(value)
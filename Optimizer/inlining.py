@@ -0,0 +1,187 @@
+from collections import Counter
+
+from Parser.parser import LazyStatement
+from Parser.types import *
+
+from Optimizer.deadcode import count_nodes
+from Optimizer.transformer import (Transformer, has_side_effects, is_literal,
+                                   iterate_nodes)
+
+#largest number of nodes of inlined expression
+DEFAULT_INLINE_BUDGET = 20
+
+
+def get_return_expression(functionDef: FunctionDef):
+    #expression of function whose body is a single return statement
+    statement = functionDef.statement
+    if isinstance(statement, LazyStatement):
+        if not statement.isParsed:
+            return None
+        statement = statement.statement
+    if type(statement) is StatementBlock and len(statement.statements) == 1:
+        statement = statement.statements[0]
+    if type(statement) is ReturnStatement:
+        return statement.expression
+    return None
+
+
+def get_local_names(functionDef: FunctionDef) -> set[str]:
+    return {parameter.identifier
+            for parameter in functionDef.parameters} | {
+                node.identifier
+                for node in iterate_nodes(functionDef.statement)
+                if type(node) is DefineStatement
+            }
+
+
+class ParameterSubstituter(Transformer):
+    def __init__(self, arguments: dict) -> None:
+        super().__init__()
+        self.__arguments = arguments
+
+    def evaluate_variable(self, element: Variable) -> None:
+        self.push(self.__arguments.get(element.identifier, element))
+
+
+class Inliner(Transformer):
+    #replaces calls of small functions returning a single expression with
+    #that expression, in which parameters are replaced with arguments
+    def __init__(self, budget: int = DEFAULT_INLINE_BUDGET) -> None:
+        super().__init__()
+        self.budget = budget
+        self.inlinedCalls = 0
+        self.__functions = {}
+        self.__expansions = {}
+        self.__expandedFunctions = []
+        self.__recursiveFunctions = set()
+        self.__localNames = set()
+
+    def set_functions(self, functionDefList: list[FunctionDef]) -> None:
+        #only functions returning a value can be used in expressions
+        self.__functions = {
+            functionDef.identifier: functionDef
+            for functionDef in functionDefList
+            if functionDef.returnType is not None
+            and get_return_expression(functionDef) is not None
+        }
+        self.__expansions = {}
+        self.__recursiveFunctions = set()
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        localNames = self.__localNames
+        self.__localNames = get_local_names(element)
+        try:
+            self.push(
+                self.rebuild(element,
+                             statement=self.__transform_statement(
+                                 element.statement)))
+        finally:
+            self.__localNames = localNames
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        self.push(
+            self.rebuild(element,
+                         statements=[
+                             self.__transform_statement(statement)
+                             for statement in element.statements
+                         ]))
+
+    def evaluate_if_statement(self, element: IfStatement):
+        self.push(
+            self.rebuild(element,
+                         statement=self.__transform_statement(
+                             element.statement),
+                         elseStatement=self.__transform_statement(
+                             element.elseStatement)))
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        self.push(
+            self.rebuild(element,
+                         statement=self.__transform_statement(
+                             element.statement)))
+
+    def evaluate_function_call(self, element: FunctionCall):
+        node = self.rebuild(element)
+        if (expression := self.__inline(node)) is None:
+            self.push(node)
+        else:
+            self.inlinedCalls += 1
+            self.push(expression)
+
+    def __transform_statement(self, statement):
+        #value of function called as a statement is not used,
+        #so only its arguments are changed
+        if isinstance(statement, LazyStatement):
+            statement = statement.statement
+        if type(statement) is FunctionCall:
+            return self.rebuild(statement)
+        return self.transform(statement)
+
+    def __inline(self, element: FunctionCall):
+        #literal returned by function takes no nodes of budget
+        if self.budget <= 0:
+            return None
+        if (expansion := self.__expand(element.identifier)) is None:
+            return None
+
+        functionDef, expression = expansion
+        parameters = [
+            parameter.identifier for parameter in functionDef.parameters
+        ]
+        names = {
+            node.identifier
+            for node in iterate_nodes(expression) if type(node) is Variable
+        }
+        #global variable used by function can not be hidden by local one
+        if (names - set(parameters)) & self.__localNames:
+            return None
+
+        #arguments are evaluated before the call, expression evaluates them
+        #where parameters are used, so only arguments without side effects
+        #are moved and only variables or literals are repeated
+        uses = Counter(node.identifier for node in iterate_nodes(expression)
+                       if type(node) is Variable)
+        for parameter, argument in zip(parameters, element.arguments):
+            if not (is_literal(argument) or type(argument) is Variable or
+                    (uses[parameter] <= 1 and not has_side_effects(argument))):
+                return None
+
+        #function called by expression may change global variables, so
+        #arguments reading them would see values changed after the call
+        if has_side_effects(expression) and any(
+                type(node) is Variable and node.identifier not in (
+                    self.__localNames) for node in iterate_nodes(
+                        element.arguments)):
+            return None
+
+        return ParameterSubstituter(dict(zip(
+            parameters, element.arguments))).transform(expression)
+
+    def __expand(self, identifier: str):
+        #expression of function with calls in it inlined, computed once
+        if identifier in self.__expansions:
+            return self.__expansions[identifier]
+        if (functionDef := self.__functions.get(identifier)) is None:
+            return None
+        if identifier in self.__expandedFunctions:
+            #function calls itself directly or through other functions
+            self.__recursiveFunctions.update(self.__expandedFunctions[
+                self.__expandedFunctions.index(identifier):])
+            return None
+
+        #calls inlined into expression are not counted until it is inlined
+        self.__expandedFunctions.append(identifier)
+        localNames, inlinedCalls = self.__localNames, self.inlinedCalls
+        self.__localNames = get_local_names(functionDef)
+        try:
+            expression = self.transform(get_return_expression(functionDef))
+        finally:
+            self.__localNames, self.inlinedCalls = localNames, inlinedCalls
+            self.__expandedFunctions.pop()
+
+        expansion = None
+        if identifier not in self.__recursiveFunctions and count_nodes(
+                expression) <= self.budget:
+            expansion = (functionDef, expression)
+        self.__expansions[identifier] = expansion
+        return expansion
@@ -0,0 +1,53 @@
+from Parser.types import *
+
+from Optimizer.temporaries import ExpressionReplacer, TemporaryTransformer
+from Optimizer.transformer import has_side_effects, iterate_nodes
+
+#names of temporaries can not be written in source code
+TEMPORARY_NAME = "$invariant{}"
+
+
+def find_changed_names(value) -> set[str]:
+    #names of variables assigned or defined in subtree
+    return {
+        node.identifier.identifier
+        if type(node) is AssignStatement else node.identifier
+        for node in iterate_nodes(value)
+        if type(node) in (AssignStatement, DefineStatement)
+    }
+
+
+class LoopInvariantMover(TemporaryTransformer):
+    #computes expressions which do not change in while loop once, before it,
+    #only expressions without side effects are moved, so loop which is not
+    #executed at all gives the same result
+    def __init__(self) -> None:
+        super().__init__(TEMPORARY_NAME)
+        self.hoistedExpressions = 0
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        #variables changed anywhere in the loop are not invariant
+        changedNames = find_changed_names(element)
+        temporaries = {}
+
+        def get_temporary(node: INode):
+            if node not in temporaries:
+                if self.get_type(node) is None or has_side_effects(
+                        node) or not all(
+                            child.identifier not in changedNames
+                            and self.is_available(child.identifier)
+                            for child in iterate_nodes(node)
+                            if type(child) is Variable):
+                    return None
+                temporaries[node] = self.new_temporary()
+            return temporaries[node]
+
+        node = ExpressionReplacer(get_temporary).transform(element)
+        self.hoistedExpressions += len(temporaries)
+        statements = [
+            self.store_temporary(name, expression)
+            for expression, name in temporaries.items()
+        ]
+
+        #loops inside are transformed after invariants of this one are moved
+        self.push(statements + [self.transform_loop(node)])
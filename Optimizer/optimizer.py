@@ -0,0 +1,67 @@
+from collections import namedtuple
+
+from Parser.types import *
+
+from Optimizer.commonsubexpressions import CommonSubexpressionEliminator
+from Optimizer.constantfolding import ConstantFolder
+from Optimizer.deadcode import DeadCodeEliminator
+from Optimizer.inlining import Inliner, DEFAULT_INLINE_BUDGET
+from Optimizer.loopinvariants import LoopInvariantMover
+
+OptimizerStats = namedtuple("OptimizerStats", [
+    "removedNodes", "inlinedCalls", "hoistedExpressions",
+    "eliminatedExpressions"
+])
+
+
+class Optimizer:
+    #runs optimization passes over type checked program,
+    #every pass gets a tree rebuilt by the previous one
+    def __init__(self, inlineBudget: int = DEFAULT_INLINE_BUDGET) -> None:
+        self.deadCodeEliminator = DeadCodeEliminator()
+        self.inliner = Inliner(inlineBudget)
+        self.loopInvariantMover = LoopInvariantMover()
+        self.commonSubexpressionEliminator = CommonSubexpressionEliminator()
+        #dead code is found after conditions are folded,
+        #inlined arguments are folded again before loops are optimized
+        self.passes = [
+            ConstantFolder(), self.deadCodeEliminator, self.inliner,
+            ConstantFolder(), self.deadCodeEliminator,
+            self.loopInvariantMover, self.commonSubexpressionEliminator
+        ]
+
+    def optimize_program(self, program: Program,
+                         skippedFunctions: set[str] = frozenset()) -> Program:
+        #skipped functions are optimized later with optimize_function
+        #and their bodies are not inlined
+        self.inliner.set_functions(program.functionDefList)
+        self.loopInvariantMover.set_program(program, skippedFunctions)
+        self.commonSubexpressionEliminator.set_program(program,
+                                                       skippedFunctions)
+        functionDefList = [
+            functionDef if functionDef.identifier in skippedFunctions else
+            self.optimize_function(functionDef)
+            for functionDef in program.functionDefList
+        ]
+        defineStatementList = [
+            self.__run_passes(declaration)
+            for declaration in program.defineStatementList
+        ]
+        return Program(functionDefList=functionDefList,
+                       defineStatementList=defineStatementList)
+
+    def optimize_function(self, functionDef: FunctionDef) -> FunctionDef:
+        return self.__run_passes(functionDef)
+
+    def __run_passes(self, node: INode) -> INode:
+        for optimizationPass in self.passes:
+            node = optimizationPass.transform(node)
+        return node
+
+    def get_stats(self) -> OptimizerStats:
+        return OptimizerStats(
+            removedNodes=self.deadCodeEliminator.removedNodes,
+            inlinedCalls=self.inliner.inlinedCalls,
+            hoistedExpressions=self.loopInvariantMover.hoistedExpressions,
+            eliminatedExpressions=dict(
+                self.commonSubexpressionEliminator.eliminatedExpressions))
@@ -0,0 +1,105 @@
+from Parser.types import *
+
+from Optimizer.inlining import get_local_names
+from Optimizer.transformer import iterate_nodes
+import Interpreter.stdlib as std
+
+
+def find_changed_globals(program: Program,
+                         skippedFunctions: set[str] = frozenset()) -> set[str]:
+    #names of global variables assigned in any function,
+    #skipped function may change any of them
+    globalNames = {
+        declaration.identifier
+        for declaration in program.defineStatementList
+    }
+    if skippedFunctions:
+        return globalNames
+
+    changedGlobals = set()
+    for functionDef in program.functionDefList:
+        localNames = get_local_names(functionDef)
+        changedGlobals.update(
+            node.identifier.identifier
+            for node in iterate_nodes(functionDef.statement)
+            if type(node) is AssignStatement
+            and node.identifier.identifier not in localNames)
+    return changedGlobals & globalNames
+
+
+def find_pure_functions(program: Program,
+                        skippedFunctions: set[str] = frozenset()) -> set[str]:
+    #names of functions whose result depends only on their arguments,
+    #they do not print, change globals or read globals changed by others,
+    #bodies of skipped functions are unknown, so they are never pure
+    changedGlobals = find_changed_globals(program, skippedFunctions)
+    localNames = {}
+    calledFunctions = {}
+    for functionDef in program.functionDefList:
+        if functionDef.identifier in skippedFunctions:
+            continue
+        nodes = list(iterate_nodes(functionDef.statement))
+        localNames[functionDef.identifier] = get_local_names(functionDef)
+        calledFunctions[functionDef.identifier] = (nodes, {
+            node.identifier
+            for node in nodes if type(node) is FunctionCall
+        })
+
+    pureFunctions = set()
+    for identifier, (nodes, _) in calledFunctions.items():
+        names = localNames[identifier]
+        if not any(
+                type(node) is AssignStatement and node.identifier.identifier
+                not in names or type(node) is Variable and node.identifier
+                not in names and node.identifier in changedGlobals
+                for node in nodes):
+            pureFunctions.add(identifier)
+
+    #functions calling impure ones are removed until none is left,
+    #so recursive functions stay pure
+    changed = True
+    while changed:
+        changed = False
+        for identifier in list(pureFunctions):
+            if not all(name in pureFunctions or name in std.PURE_FUNCTIONS
+                       for name in calledFunctions[identifier][1]):
+                pureFunctions.discard(identifier)
+                changed = True
+
+    return pureFunctions
+
+
+def find_dependencies(program: Program, identifier: str) -> list:
+    #definitions of functions and global variables which can change
+    #result of function, the function itself is the first of them
+    functionDefs = {
+        functionDef.identifier: functionDef
+        for functionDef in program.functionDefList
+    }
+    dependencies = [functionDefs[identifier]]
+    usesGlobals = False
+    names = {identifier}
+    index = 0
+    while index < len(dependencies):
+        node = dependencies[index]
+        index += 1
+        if type(node) is FunctionDef:
+            localNames = get_local_names(node)
+            nodes = list(iterate_nodes(node.statement))
+        else:
+            localNames = set()
+            nodes = list(iterate_nodes(node.expression))
+
+        if not usesGlobals and any(
+                type(child) is Variable and child.identifier not in localNames
+                for child in nodes):
+            #initializers of globals may call other functions
+            usesGlobals = True
+            dependencies.extend(program.defineStatementList)
+        for child in nodes:
+            if type(child) is FunctionCall and child.identifier in (
+                    functionDefs) and child.identifier not in names:
+                names.add(child.identifier)
+                dependencies.append(functionDefs[child.identifier])
+
+    return dependencies
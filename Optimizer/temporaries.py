@@ -0,0 +1,229 @@
+from fractions import Fraction
+
+from Parser.parser import LazyStatement
+from Parser.types import *
+
+from Interpreter.typechecker import LITERAL_TYPES
+from Optimizer.inlining import get_local_names
+from Optimizer.purity import find_changed_globals
+from Optimizer.transformer import Transformer, iterate_nodes
+import Interpreter.stdlib as std
+
+#values created by folding have types too
+VALUE_TYPES = {**LITERAL_TYPES, Fraction: 'frc'}
+
+
+class ExpressionReplacer(Transformer):
+    #replaces largest expressions for which get_temporary gives a name
+    #with variables of that name
+    def __init__(self, get_temporary) -> None:
+        super().__init__()
+        self.__get_temporary = get_temporary
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        self.push(
+            self.rebuild(element,
+                         statements=[
+                             self.__transform_statement(statement)
+                             for statement in element.statements
+                         ]))
+
+    def evaluate_if_statement(self, element: IfStatement):
+        #temporaries are named in order of evaluation
+        self.push(
+            self.rebuild(element,
+                         condition=self.transform(element.condition),
+                         statement=self.__transform_statement(
+                             element.statement),
+                         elseStatement=self.__transform_statement(
+                             element.elseStatement)))
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        self.push(
+            self.rebuild(element,
+                         condition=self.transform(element.condition),
+                         statement=self.__transform_statement(
+                             element.statement)))
+
+    def evaluate_function_call(self, element: FunctionCall):
+        self.__replace(element, super().evaluate_function_call)
+
+    def evaluate_expression(self, element: Expression):
+        self.__replace(element, super().evaluate_expression)
+
+    def evaluate_subsexpression(self, element: SubExpression):
+        self.__replace(element, super().evaluate_subsexpression)
+
+    def evaluate_parentheses_expression(self, element: ParenthesesExpression):
+        self.__replace(element, super().evaluate_parentheses_expression)
+
+    def __replace(self, element: INode, evaluate) -> None:
+        if (name := self.__get_temporary(element)) is not None:
+            self.push(Variable(name))
+        else:
+            evaluate(element)
+
+    def __transform_statement(self, statement):
+        #value of function called as a statement is not used,
+        #so only its arguments can be replaced
+        if isinstance(statement, LazyStatement):
+            statement = statement.statement
+        if type(statement) is FunctionCall:
+            return self.rebuild(statement)
+        return self.transform(statement)
+
+
+class TemporaryTransformer(Transformer):
+    #base of passes keeping values of expressions in temporaries, it knows
+    #types of variables and which of them are defined on every path to the
+    #transformed statement, statement may be replaced with list of them
+    def __init__(self, temporaryName: str) -> None:
+        super().__init__()
+        self.temporaryName = temporaryName
+        self.__globalTypes = {}
+        self.__changedGlobals = set()
+        self.__returnTypes = {}
+        self.__variableTypes = {}
+        self.__localNames = set()
+        self.__definedNames = set()
+        #temporaries used in loops are defined at start of function
+        self.__declarations = []
+        self.__temporaries = 0
+        self.__loopDepth = 0
+
+    def set_program(self, program: Program,
+                    skippedFunctions: set[str] = frozenset()) -> None:
+        self.__globalTypes = {
+            declaration.identifier: declaration.type
+            for declaration in program.defineStatementList
+        }
+        self.__changedGlobals = find_changed_globals(program, skippedFunctions)
+        self.__returnTypes = {
+            identifier: functionDef.returnType
+            for identifier, functionDef in
+            std.get_function_definitions().items()
+        }
+        self.__returnTypes.update(
+            (functionDef.identifier, functionDef.returnType)
+            for functionDef in program.functionDefList)
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        self.__localNames = get_local_names(element)
+        self.__variableTypes = dict(self.__globalTypes)
+        self.__variableTypes.update(
+            (parameter.identifier, parameter.type)
+            for parameter in element.parameters)
+        self.__variableTypes.update(
+            (node.identifier, node.type)
+            for node in iterate_nodes(element.statement)
+            if type(node) is DefineStatement)
+        self.__definedNames = {
+            parameter.identifier
+            for parameter in element.parameters
+        }
+        self.__declarations = []
+        self.__temporaries = 0
+
+        statements = self.transform_statement(element.statement)
+        if self.__declarations:
+            if len(statements) == 1 and type(
+                    statements[0]) is StatementBlock:
+                statements = statements[0].statements
+            statements = self.__declarations + statements
+        self.push(self.rebuild(element, statement=self.join(statements)))
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        statements = []
+        for statement in element.statements:
+            statements.extend(self.transform_statement(statement))
+        self.push(self.rebuild(element, statements=statements))
+
+    def evaluate_define_statement(self, element: DefineStatement):
+        super().evaluate_define_statement(element)
+        self.__definedNames.add(element.identifier)
+
+    def evaluate_if_statement(self, element: IfStatement):
+        definedNames = set(self.__definedNames)
+        statement = self.join(self.transform_statement(element.statement))
+        thenDefinedNames = self.__definedNames
+
+        self.__definedNames = set(definedNames)
+        elseStatement = element.elseStatement
+        if elseStatement is not None:
+            elseStatement = self.join(
+                self.transform_statement(elseStatement))
+            self.__definedNames &= thenDefinedNames
+        else:
+            self.__definedNames = definedNames
+        self.push(
+            self.rebuild(element,
+                         statement=statement,
+                         elseStatement=elseStatement))
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        self.push(self.transform_loop(element))
+
+    def transform_statement(self, statement) -> list:
+        if isinstance(statement, LazyStatement):
+            statement = statement.statement
+        node = self.transform(statement)
+        return node if isinstance(node, list) else [node]
+
+    def transform_loop(self, element: WhileStatement) -> WhileStatement:
+        #body may be not executed, so its definitions are forgotten
+        definedNames = set(self.__definedNames)
+        self.__loopDepth += 1
+        try:
+            return self.rebuild(element,
+                                statement=self.join(
+                                    self.transform_statement(
+                                        element.statement)))
+        finally:
+            self.__loopDepth -= 1
+            self.__definedNames = definedNames
+
+    def join(self, statements: list):
+        if len(statements) == 1:
+            return statements[0]
+        return StatementBlock(statements)
+
+    def is_available(self, identifier: str) -> bool:
+        #local variable has to be defined, global one can not be changed
+        #by any function
+        if identifier in self.__localNames:
+            return identifier in self.__definedNames
+        return identifier in self.__globalTypes and (
+            identifier not in self.__changedGlobals)
+
+    def new_temporary(self) -> str:
+        name = self.temporaryName.format(self.__temporaries)
+        self.__temporaries += 1
+        return name
+
+    def store_temporary(self, name: str, expression):
+        #temporary defined in a loop would be defined again in its next
+        #iteration, so it is only assigned there
+        valueType = self.get_type(expression)
+        self.__variableTypes[name] = valueType
+        self.__localNames.add(name)
+        self.__definedNames.add(name)
+        if self.__loopDepth == 0:
+            return DefineStatement(valueType, name, expression)
+
+        self.__declarations.append(DefineStatement(valueType, name))
+        return AssignStatement(Variable(name), expression)
+
+    def get_type(self, value):
+        if not isinstance(value, INode):
+            return VALUE_TYPES.get(type(value))
+        if type(value) is Variable:
+            return self.__variableTypes.get(value.identifier)
+        if type(value) is FunctionCall:
+            return self.__returnTypes.get(value.identifier)
+        if type(value) is Expression:
+            return self.get_type(value.leftExpression)
+        if type(value) is SubExpression:
+            return self.get_type(value.leftFactor)
+        if type(value) is ParenthesesExpression:
+            return self.get_type(value.expression)
+        return None
@@ -0,0 +1,139 @@
+from Parser.ast import INode
+from Parser.parser import LazyStatement
+from Parser.types import *
+
+from Interpreter.visitor import Visitor
+import Interpreter.stdlib as std
+
+
+def iterate_nodes(value):
+    #every node of subtree, parents before children
+    values = [value]
+    while values:
+        value = values.pop()
+        if isinstance(value, LazyStatement):
+            value = value.statement
+        if isinstance(value, list):
+            values.extend(reversed(value))
+        elif isinstance(value, INode):
+            yield value
+            values.extend(
+                getattr(value, field) for field in reversed(value.fields))
+
+
+def is_literal(value) -> bool:
+    return value is not None and not isinstance(value, INode)
+
+
+def is_unchanged(value, oldValue) -> bool:
+    if isinstance(value, list) and isinstance(oldValue, list):
+        return len(value) == len(oldValue) and all(
+            item is oldItem for item, oldItem in zip(value, oldValue))
+    return value is oldValue
+
+
+def is_nonzero_literal(value) -> bool:
+    return is_literal(value) and value != 0
+
+
+def has_side_effects(value) -> bool:
+    #true when evaluation may print, not end or fail, like calls of user
+    #functions or division by variable, reading variables is not an effect
+    for node in iterate_nodes(value):
+        if type(node) is FunctionCall:
+            if node.identifier not in std.PURE_FUNCTIONS or (
+                    node.identifier in std.FAILING_FUNCTIONS
+                    and not all(map(is_nonzero_literal, node.arguments))):
+                return True
+        elif type(node) is SubExpression and node.operator == '/' and (
+                not is_nonzero_literal(node.rightFactor)):
+            return True
+    return False
+
+
+class Transformer(Visitor):
+    #rebuilds tree bottom up, optimization passes override methods of nodes
+    #they change, nodes without changes in their subtree are reused
+    def __init__(self) -> None:
+        self.__nodes = []
+
+    def transform(self, value):
+        if isinstance(value, LazyStatement):
+            value = value.statement
+        if isinstance(value, list):
+            items = [self.transform(item) for item in value]
+            return value if is_unchanged(items, value) else items
+        if not isinstance(value, INode):
+            return value
+
+        value.accept(self)
+        return self.__nodes.pop()
+
+    def push(self, value) -> None:
+        self.__nodes.append(value)
+
+    def rebuild(self, element: INode, **changes) -> INode:
+        #copy of node with transformed or changed fields
+        values = {
+            field: changes[field]
+            if field in changes else self.transform(getattr(element, field))
+            for field in element.fields
+        }
+        if all(
+                is_unchanged(values[field], getattr(element, field))
+                for field in element.fields):
+            return element
+
+        node = element.__class__(**values)
+        for name in element.__slots__:
+            if name not in element.fields:
+                setattr(node, name, getattr(element, name))
+        return node
+
+    def evaluate_program(self, element: Program):
+        self.push(self.rebuild(element))
+
+    def evaluate_function_definition(self, element: FunctionDef):
+        self.push(self.rebuild(element))
+
+    def evaluate_function_call(self, element: FunctionCall):
+        self.push(self.rebuild(element))
+
+    def evaluate_statement_block(self, element: StatementBlock):
+        self.push(self.rebuild(element))
+
+    def evaluate_return_statement(self, element: ReturnStatement):
+        self.push(self.rebuild(element))
+
+    def evaluate_assigne_statement(self, element: AssignStatement):
+        self.push(self.rebuild(element))
+
+    def evaluate_define_statement(self, element: DefineStatement):
+        self.push(self.rebuild(element))
+
+    def evaluate_if_statement(self, element: IfStatement):
+        self.push(self.rebuild(element))
+
+    def evaluate_while_statement(self, element: WhileStatement):
+        self.push(self.rebuild(element))
+
+    def evaluate_expression(self, element: Expression):
+        self.push(self.rebuild(element))
+
+    def evaluate_subsexpression(self, element: SubExpression):
+        self.push(self.rebuild(element))
+
+    def evaluate_parentheses_expression(self, element: ParenthesesExpression):
+        self.push(self.rebuild(element))
+
+    def evaluate_condition(self, element: Condition):
+        self.push(self.rebuild(element))
+
+    def evaluate_subcondition(self, element: SubCondition):
+        self.push(self.rebuild(element))
+
+    def evaluate_parentheses_condition(self, element: ParenthesesCondition):
+        self.push(self.rebuild(element))
+
+    def evaluate_variable(self, element: Variable) -> None:
+        self.push(self.rebuild(element))
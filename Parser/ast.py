@@ -1,12 +1,86 @@
 from abc import ABC, abstractmethod
-import pickle
+import hashlib
+
+#marks end of node or list while digest is computed
+END = object()
+
+
+def values_equal(left, right) -> bool:
+    #type is compared too, so literals 1 and 1.0 are different
+    if left.__class__ is not right.__class__:
+        return False
+
+    if isinstance(left, (list, tuple)):
+        return len(left) == len(right) and all(
+            values_equal(leftItem, rightItem)
+            for leftItem, rightItem in zip(left, right))
+
+    return left == right
+
+
+def value_hash(value) -> int:
+    if isinstance(value, (list, tuple)):
+        return hash(tuple(value_hash(item) for item in value))
+    return hash(value)
+
+
+def structure_digest(value) -> str:
+    #hash of tree which is the same in every process, source positions and
+    #attributes set by later stages are not a part of it
+    digest = hashlib.sha256()
+    values = [value]
+    while values:
+        value = values.pop()
+        if value is END:
+            digest.update(b")")
+        elif isinstance(value, INode):
+            digest.update(f"({value.__class__.__name__}".encode())
+            values.append(END)
+            values.extend(
+                getattr(value, field) for field in reversed(value.fields))
+        elif isinstance(value, (list, tuple)):
+            digest.update(b"(")
+            values.append(END)
+            values.extend(reversed(value))
+        else:
+            #type is a part of literal, so 1 and 1.0 are different
+            digest.update(f"({value.__class__.__name__} {value!r})".encode(
+                'utf-8', errors='surrogatepass'))
+    return digest.hexdigest()
 
 
 class INode(ABC):
+    # names of attributes making up the structure of node,
+    # source positions are not a part of it
+    fields = ()
+    __slots__ = ("_hash", )
+
     def __eq__(self, other) -> bool:
-        return isinstance(
-            other,
-            self.__class__) and pickle.dumps(self) == pickle.dumps(other)
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__ or hash(self) != hash(other):
+            return False
+
+        return all(
+            values_equal(getattr(self, field), getattr(other, field))
+            for field in self.fields)
+
+    def __hash__(self) -> int:
+        #computed once, so node can not be changed after it was hashed
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.__class__.__name__, ) + tuple(
+                value_hash(getattr(self, field)) for field in self.fields))
+            return self._hash
+
+    def __getstate__(self) -> dict:
+        #string hashes differ between processes, so cached hash is not kept
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @abstractmethod
     def accept(self, visitor) -> None:
@@ -14,4 +88,4 @@ class INode(ABC):
 
     @abstractmethod
     def __repr__(self) -> str:
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,244 @@
+import os
+import re
+from collections import namedtuple
+
+from HelperModules.errorhandler import ParserError
+from HelperModules.symbols import SymbolsTable, TokenTypes
+
+GRAMMAR_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                            "grammar.ebnf")
+
+# nodes of right hand side of grammar rule
+Alternative = namedtuple("Alternative", ["items"])
+Sequence = namedtuple("Sequence", ["items"])
+Optional = namedtuple("Optional", ["item"])
+Repetition = namedtuple("Repetition", ["item"])
+Terminal = namedtuple("Terminal", ["value"])
+RuleReference = namedtuple("RuleReference", ["name"])
+
+EBNF_TOKEN_PATTERN = re.compile(r"""
+    \s+|\(\*.*?\*\)
+    |(?P<name>[^\W\d]\w*)
+    |"(?P<double>[^"]*)"|'(?P<single>[^']*)'
+    |(?P<symbol>[=,|;\[\]{}()])""", re.VERBOSE | re.DOTALL)
+#file keeps older versions of grammar below the separator line
+VERSION_SEPARATOR_PATTERN = re.compile(r"^-{3,}\s*$", re.MULTILINE)
+
+START_RULE = "program"
+#rules describing tokens are not expanded, lexer recognises them
+LEXICAL_RULES = {
+    "identifier": frozenset([TokenTypes.IDENTIFIER]),
+    "number":
+    frozenset([TokenTypes.INTEGER_LITERAL, TokenTypes.FLOAT_LITERAL]),
+    "stringLiteral": frozenset([TokenTypes.STRING_LITERAL])
+}
+
+
+class EbnfReader:
+    def __init__(self, text: str) -> None:
+        self.__tokens = []
+        offset = 0
+        while offset < len(text):
+            match = EBNF_TOKEN_PATTERN.match(text, offset)
+            if match is None:
+                raise ParserError(
+                    f"Grammar error.\nUnexpected char {text[offset]!r}.")
+            if match.lastgroup == "name":
+                self.__tokens.append(RuleReference(match.group("name")))
+            elif match.lastgroup in ("double", "single"):
+                self.__tokens.append(Terminal(match.group(match.lastgroup)))
+            elif match.lastgroup == "symbol":
+                self.__tokens.append(match.group("symbol"))
+            offset = match.end()
+        self.__index = 0
+
+    def __peek(self):
+        if self.__index < len(self.__tokens):
+            return self.__tokens[self.__index]
+        return None
+
+    def __consume(self, expected: str = None):
+        token = self.__peek()
+        if token is None or (expected is not None and token != expected):
+            raise ParserError(
+                f"Grammar error.\nExpected {expected!r}, got {token!r}.")
+        self.__index += 1
+        return token
+
+    def __read_alternative(self):
+        items = [self.__read_sequence()]
+        while self.__peek() == '|':
+            self.__consume()
+            items.append(self.__read_sequence())
+        return items[0] if len(items) == 1 else Alternative(tuple(items))
+
+    def __read_sequence(self):
+        items = [self.__read_item()]
+        while self.__peek() == ',':
+            self.__consume()
+            items.append(self.__read_item())
+        return items[0] if len(items) == 1 else Sequence(tuple(items))
+
+    def __read_item(self):
+        token = self.__consume()
+        if isinstance(token, (Terminal, RuleReference)):
+            return token
+
+        closing = {'(': ')', '[': ']', '{': '}'}.get(token)
+        if closing is None:
+            raise ParserError(f"Grammar error.\nUnexpected {token!r}.")
+        item = self.__read_alternative()
+        self.__consume(closing)
+        if token == '[':
+            return Optional(item)
+        elif token == '{':
+            return Repetition(item)
+        return item
+
+    def read_rules(self) -> dict:
+        rules = {}
+        while self.__peek() is not None:
+            name = self.__consume()
+            if not isinstance(name, RuleReference):
+                raise ParserError(
+                    f"Grammar error.\nExpected rule name, got {name!r}.")
+            self.__consume('=')
+            rules[name.name] = self.__read_alternative()
+            self.__consume(';')
+        return rules
+
+
+class Grammar:
+    def __init__(self, rules: dict,
+                 symbolsTable: SymbolsTable = None) -> None:
+        symbolsTable = symbolsTable or SymbolsTable()
+        self.rules = rules
+        self.terminalsDict = {
+            **symbolsTable.keywordsDict,
+            **symbolsTable.singleCharSymbolsDict,
+            **symbolsTable.doubleCharSymbolsDict
+        }
+        self.firstSets = {}
+        self.nullableRules = set()
+        self.__compute_first_sets()
+
+    @classmethod
+    def from_file(cls, path: str = GRAMMAR_PATH) -> "Grammar":
+        #only the current version of grammar is used
+        with open(path, encoding="utf-8") as file:
+            text = VERSION_SEPARATOR_PATTERN.split(file.read())[0]
+        return cls(EbnfReader(text).read_rules())
+
+    def __compute_first_sets(self) -> None:
+        #rules reference each other, sets grow until nothing changes
+        parserRules = self.__find_parser_rules(START_RULE)
+        for name in parserRules:
+            self.firstSets[name] = frozenset()
+
+        changed = True
+        while changed:
+            changed = False
+            for name in parserRules:
+                first, nullable = self.__first(self.rules[name])
+                if first != self.firstSets[name] or (
+                        nullable and name not in self.nullableRules):
+                    self.firstSets[name] = first
+                    if nullable:
+                        self.nullableRules.add(name)
+                    changed = True
+
+    def __find_parser_rules(self, name: str) -> list[str]:
+        #rules describing chars of tokens are reachable only through
+        #lexical rules, so they are skipped
+        found = [name]
+        nodes = [self.rules[name]]
+        while nodes:
+            node = nodes.pop()
+            if isinstance(node, RuleReference):
+                if node.name not in self.rules:
+                    raise ParserError(
+                        f"Grammar error.\nUnknown rule {node.name!r}.")
+                if node.name not in LEXICAL_RULES and node.name not in found:
+                    found.append(node.name)
+                    nodes.append(self.rules[node.name])
+            elif isinstance(node, Terminal):
+                if node.value not in self.terminalsDict:
+                    raise ParserError(
+                        f"Grammar error.\nUnknown terminal {node.value!r}.")
+            elif isinstance(node, (Optional, Repetition)):
+                nodes.append(node.item)
+            else:
+                nodes.extend(node.items)
+        return found
+
+    def __first(self, node) -> tuple:
+        #returns set of token types starting node and whether it can be empty
+        if isinstance(node, Terminal):
+            return frozenset([self.terminalsDict[node.value]]), False
+        elif isinstance(node, RuleReference):
+            if node.name in LEXICAL_RULES:
+                return LEXICAL_RULES[node.name], False
+            return self.firstSets.get(node.name, frozenset()), (
+                node.name in self.nullableRules)
+        elif isinstance(node, (Optional, Repetition)):
+            return self.__first(node.item)[0], True
+        elif isinstance(node, Alternative):
+            first, nullable = frozenset(), False
+            for item in node.items:
+                itemFirst, itemNullable = self.__first(item)
+                first |= itemFirst
+                nullable = nullable or itemNullable
+            return first, nullable
+        else:
+            first = frozenset()
+            for item in node.items:
+                itemFirst, itemNullable = self.__first(item)
+                first |= itemFirst
+                if not itemNullable:
+                    return first, False
+            return first, True
+
+    def first(self, name: str) -> frozenset:
+        if name in LEXICAL_RULES:
+            return LEXICAL_RULES[name]
+        return self.firstSets[name]
+
+    def get_alternatives(self, name: str) -> tuple:
+        #alternatives of the rule, also when they are repeated like in program
+        node = self.rules[name]
+        while isinstance(node, (Optional, Repetition)):
+            node = node.item
+        return node.items if isinstance(node, Alternative) else (node, )
+
+    def dispatch_table(self, name: str) -> dict:
+        #maps token type to labels of alternatives starting with it,
+        #more than one label means the rule is not LL(1) for that token
+        table = {}
+        for alternative in self.get_alternatives(name):
+            label = get_label(alternative)
+            for tokenType in self.__first(alternative)[0]:
+                table[tokenType] = table.get(tokenType, ()) + (label, )
+        return table
+
+
+def get_label(node) -> str:
+    #alternative is named after its first rule or terminal
+    while isinstance(node, (Sequence, Optional, Repetition, Alternative)):
+        node = node.items[0] if hasattr(node, "items") else node.item
+    return node.name if isinstance(node, RuleReference) else node.value
+
+
+def bind_dispatch_table(table: dict, handlers: dict) -> dict:
+    #conflicting alternatives have to be handled by the same function
+    dispatch = {}
+    for tokenType, labels in table.items():
+        if missing := [label for label in labels if label not in handlers]:
+            raise ParserError(
+                f"Grammar error.\nNo parsing method for {missing}.")
+
+        boundHandlers = {handlers[label] for label in labels}
+        if len(boundHandlers) != 1:
+            raise ParserError(f"Grammar error.\nAlternatives {labels} "
+                              f"starting with {tokenType} are ambiguous.")
+        dispatch[tokenType] = boundHandlers.pop()
+    return dispatch
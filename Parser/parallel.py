@@ -0,0 +1,117 @@
+import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from HelperModules.errorhandler import IError, ParserError
+from HelperModules.sourcehandler import SourceHandler, DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.regexlexer import RegexLexer
+from Parser.parser import Parser
+from Parser.types import Program
+
+# part of the source with absolute position of its first char
+Chunk = namedtuple("Chunk", ["offset", "position", "text"])
+ChunkResult = namedtuple("ChunkResult", ["program", "failed"])
+
+#strings and comments are matched whole, so braces and 'fn' inside are skipped
+BOUNDARY_PATTERN = re.compile(r"""
+    "(?:[^"\\]|\\.)*"?
+    |\#[^\n]*
+    |(?P<open>\{)
+    |(?P<close>\})
+    |(?P<function>(?<!\w)fn(?!\w))""", re.VERBOSE | re.DOTALL)
+
+CHUNKS_PER_WORKER = 4
+
+
+def find_function_offsets(source: str) -> list[int]:
+    #offsets of 'fn' keywords starting top level definitions
+    offsets = []
+    depth = 0
+    for match in BOUNDARY_PATTERN.finditer(source):
+        kind = match.lastgroup
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            depth = max(depth - 1, 0)
+        elif kind == "function" and depth == 0:
+            offsets.append(match.start())
+
+    return offsets
+
+
+def split_source(source: str, chunksCount: int) -> list[Chunk]:
+    #neighbouring definitions are grouped into chunks of similar size
+    boundaries = [0]
+    chunkSize = len(source) / chunksCount
+    for offset in find_function_offsets(source):
+        if offset - boundaries[-1] >= chunkSize:
+            boundaries.append(offset)
+
+    chunks = []
+    line = 1
+    for start, end in zip(boundaries, boundaries[1:] + [len(source)]):
+        line += source.count('\n', chunks[-1].offset if chunks else 0, start)
+        column = start - source.rfind('\n', 0, start)
+        chunks.append(Chunk(start, (line, column), source[start:end]))
+
+    return chunks
+
+
+def parse_chunk(chunk: Chunk) -> ChunkResult:
+    #runs in worker process, failed chunk is parsed again by the caller
+    lexer = RegexLexer(sourceHandler=DirectInputHandler(chunk.text),
+                       symbolsTable=SymbolsTable(),
+                       startPosition=chunk.position)
+    try:
+        return ChunkResult(Parser(lexer=lexer).try_parse_program(), False)
+    except IError:
+        return ChunkResult(None, True)
+
+
+class ParallelParser:
+    def __init__(self,
+                 sourceHandler: SourceHandler,
+                 symbolsTable: SymbolsTable,
+                 workers: int = None) -> None:
+        if sourceHandler is None or symbolsTable is None:
+            raise ParserError("SourceHandler was not provided.")
+
+        self.sourceHandler = sourceHandler
+        self.symbolsTable = symbolsTable
+        self.workers = workers or os.cpu_count()
+
+    def __parse_rest(self, source: str, chunk: Chunk) -> Program:
+        #positions and error messages are the same as in sequential parsing
+        lexer = RegexLexer(sourceHandler=DirectInputHandler(source),
+                           symbolsTable=self.symbolsTable,
+                           startOffset=chunk.offset,
+                           startPosition=chunk.position)
+        return Parser(lexer=lexer).try_parse_program()
+
+    def try_parse_program(self) -> Program:
+        if not (source := self.sourceHandler.read_all()):
+            return None
+
+        chunks = split_source(source, self.workers * CHUNKS_PER_WORKER)
+        programs = []
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for chunk, result in zip(chunks, executor.map(parse_chunk,
+                                                          chunks)):
+                if result.failed:
+                    executor.shutdown(cancel_futures=True)
+                    programs.append(self.__parse_rest(source, chunk))
+                    break
+                programs.append(result.program)
+
+        functionDefList = []
+        defineStatementList = []
+        for program in programs:
+            if program is not None:
+                functionDefList += program.functionDefList
+                defineStatementList += program.defineStatementList
+
+        if not functionDefList and not defineStatementList:
+            return None
+        return Program(functionDefList, defineStatementList)
@@ -2,16 +2,99 @@ from HelperModules.errorhandler import ParserError
 from HelperModules.symbols import TokenTypes
 from Lexer.lexer import Lexer
 from Lexer.token import Token
+from Lexer.regexlexer import RegexLexer
+from Lexer.tokenstream import TokenCursor
+from Parser.ast import INode
+from Parser.grammar import Grammar, bind_dispatch_table
 from Parser.types import *
-from typing import Optional
+from collections import namedtuple
+from typing import Optional, Union
+
+GRAMMAR = Grammar.from_file()
+TYPE_KEYWORDS = GRAMMAR.first("type")
+
+#nested rules parsed with Python recursion, deeper ones use explicit stack
+MAX_RECURSION_DEPTH = 50
+MAX_NESTING_DEPTH = 2**21
+
+# binary operator of expression, higher precedence binds stronger
+Operator = namedtuple("Operator", ["precedence", "errorMessage"])
+
+ADDITIVE = 1
+MULTIPLICATIVE = 2
+EXPRESSION_OPERATORS = {
+    TokenTypes.PLUS:
+    Operator(ADDITIVE,
+             "Expected expression after operator ( \'+\' or \'-\')."),
+    TokenTypes.MINUS:
+    Operator(ADDITIVE,
+             "Expected expression after operator ( \'+\' or \'-\')."),
+    TokenTypes.MULTIPLY:
+    Operator(MULTIPLICATIVE,
+             "Expected factor after operator ( \'*\' or \'/\')."),
+    TokenTypes.DIVIDE:
+    Operator(MULTIPLICATIVE,
+             "Expected factor after operator ( \'*\' or \'/\').")
+}
+CONDITION_OPERATORS = frozenset([
+    TokenTypes.LESS, TokenTypes.LESS_OR_EQUAL, TokenTypes.EQUAL,
+    TokenTypes.GREATER, TokenTypes.GREATER_OR_EQUAL, TokenTypes.NOT_EQUAL,
+    TokenTypes.AND, TokenTypes.OR
+])
+LITERAL_TYPES = frozenset([
+    TokenTypes.INTEGER_LITERAL, TokenTypes.FLOAT_LITERAL,
+    TokenTypes.STRING_LITERAL
+])
+#type keywords are also names of cast functions
+IDENTIFIER_TYPES = GRAMMAR.first("identifier") | TYPE_KEYWORDS
+
+
+class LazyStatement(INode):
+    #function body is parsed when it is used for the first time
+    fields = ("statement", )
+    __slots__ = ("lexer", "_statement")
+
+    def __init__(self, lexer: Union[RegexLexer, TokenCursor]) -> None:
+        #lexer starts at the body and is not used by anything else
+        self.lexer = lexer
+        self._statement = None
+
+    @property
+    def statement(self):
+        if self._statement is None:
+            self._statement = Parser(lexer=self.lexer).try_parse_statement()
+            self.lexer = None
+        return self._statement
+
+    @property
+    def isParsed(self) -> bool:
+        return self._statement is not None
+
+    def __getstate__(self) -> dict:
+        #lexer may hold an open file, so body is parsed before pickling
+        return {"lexer": None, "_statement": self.statement}
+
+    def __repr__(self):
+        return repr(self.statement)
+
+    def accept(self, visitor) -> None:
+        self.statement.accept(visitor)
 
 
 class Parser:
-    def __init__(self, lexer: Lexer) -> None:
+    def __init__(self,
+                 lexer: Union[Lexer, TokenCursor],
+                 lazy: bool = False) -> None:
         if lexer is None:
             raise ParserError("Lexer module not provided.")
 
-        self.lexer: Lexer = lexer
+        self.lexer: Union[Lexer, TokenCursor] = lexer
+        self.sourceHandler = lexer.sourceHandler
+        #bodies of functions are parsed when they are called
+        if lazy and not hasattr(lexer, "skip_block"):
+            raise ParserError("Lazy parsing needs lexer able to skip blocks.")
+        self.lazy = lazy
+        self.__depth = 0
         self.currentToken: Token = self.lexer.get_token()
 
     def __get_next_token(self) -> Token:
@@ -21,13 +104,17 @@ class Parser:
     def __get_current_token(self) -> Token:
         return self.currentToken
 
+    def __error(self, message: str) -> ParserError:
+        return ParserError(message=message,
+                           currentToken=self.__get_current_token(),
+                           sourceHandler=self.sourceHandler)
+
     def __token_required(self, tokenTypes: list[TokenTypes]) -> bool:
         if self.__get_current_token().type in tokenTypes:
             return True
         else:
-            raise ParserError(
-                message=f'Expected one of: {str(*tokenTypes, )}.',
-                currentToken=self.__get_current_token())
+            raise self.__error(
+                message=f'Expected one of: {str(*tokenTypes, )}.')
 
     def __token_required_consume(self, tokenTypes: list[TokenTypes]) -> bool:
         result = self.__token_required(tokenTypes)
@@ -44,18 +131,15 @@ class Parser:
         return result
 
     def __try_parse_type(self) -> Optional[str]:
-        lexerToken = self.__get_current_token()
-        if lexerToken.value in ["int", "float", "frc", "string"]:
-            self.__get_next_token()
-            return lexerToken.value
-        else:
+        if not self.__get_current_token().type in TYPE_KEYWORDS:
             return None
 
+        result = self.__get_current_token().value
+        self.__get_next_token()
+        return result
+
     def __try_parse_literal(self):
-        if not self.__get_current_token().type in [
-                TokenTypes.INTEGER_LITERAL, TokenTypes.FLOAT_LITERAL,
-                TokenTypes.STRING_LITERAL
-        ]:
+        if not self.__get_current_token().type in LITERAL_TYPES:
             return None
 
         result = self.__get_current_token().value
@@ -65,14 +149,16 @@ class Parser:
     def __try_parse_identifier(self) -> Optional[str]:
         lexerToken = self.__get_current_token()
         if lexerToken.type == TokenTypes.IDENTIFIER:
+            value = lexerToken.value
             self.__get_next_token()
-            return lexerToken.value
+            return value
         elif (type := self.__try_parse_type()) is not None:
             return type
         else:
             return None
 
     def __try_parse_function_call_or_identifier(self):
+        position = self.__get_current_token().position
         if (identifier := self.__try_parse_identifier()) is None:
             return None
 
@@ -80,23 +166,26 @@ class Parser:
             return Variable(identifier)
         else:
             self.__get_next_token()
-            arguments = self.__try_parse_arguments()
+            arguments = yield self.__try_parse_arguments()
             if self.__token_required_consume(
                     tokenTypes=[TokenTypes.CLOSE_PARENTHESES]):
-                return FunctionCall(identifier=identifier, arguments=arguments)
+                return FunctionCall(identifier=identifier,
+                                    arguments=arguments,
+                                    position=position)
 
-    def __try_parse_arguments(self) -> list:
+    def __try_parse_arguments(self):
         argumentsList = []
-        if (argument := self.__try_parse_expression()) is not None:
+        argument = yield from self.__try_parse_expression()
+        if argument is not None:
             argumentsList.append(argument)
 
         while self.__get_current_token().type == TokenTypes.COMMA:
             self.__get_next_token()
-            if (argument := self.__try_parse_expression()) is not None:
+            argument = yield from self.__try_parse_expression()
+            if argument is not None:
                 argumentsList.append(argument)
             else:
-                raise ParserError(message="Expected expression after \',\'.",
-                                  currentToken=self.__get_current_token())
+                raise self.__error(message="Expected expression after \',\'.")
 
         return argumentsList
 
@@ -105,8 +194,7 @@ class Parser:
             return None
 
         if (identifier := self.__try_parse_identifier()) is None:
-            raise ParserError(message="Expected identifier after type.",
-                              currentToken=self.__get_current_token())
+            raise self.__error(message="Expected identifier after type.")
 
         return Parameter(type, identifier)
 
@@ -119,91 +207,90 @@ class Parser:
             if (parameter := self.__try_parse_single_parameter()) is not None:
                 parametersList.append(parameter)
             else:
-                raise ParserError(message="Expected parameter after \',\'.",
-                                  currentToken=self.__get_current_token())
+                raise self.__error(message="Expected parameter after \',\'.")
 
         return parametersList
 
     def __try_parse_factor(self):
-        for try_parse in [
-                self.__try_parse_literal,
-                self.__try_parse_function_call_or_identifier,
-                self.__try_parse_parentheses_expression
-        ]:
-            if (result := try_parse()) is not None:
-                return result
+        tokenType = self.currentToken.type
+        if tokenType in LITERAL_TYPES:
+            return self.__try_parse_literal()
+        elif tokenType in IDENTIFIER_TYPES:
+            return (yield from self.__try_parse_function_call_or_identifier())
+        elif tokenType == TokenTypes.OPEN_PARENTHESES:
+            return (yield from self.__try_parse_parentheses_expression())
+        else:
+            return None
 
-        return None
+    def __try_parse_subexpression(self):
+        return (yield from self.__try_parse_expression(
+            minPrecedence=MULTIPLICATIVE))
 
-    def __try_parse_subexpression(self) -> Optional[SubExpression]:
+    def __try_parse_expression(self, minPrecedence: int = ADDITIVE):
+        #precedence climbing, operators binding weaker than minPrecedence
+        #are left for the caller
         isNegated = False
-        if self.__get_current_token().type == TokenTypes.MINUS:
+        if minPrecedence <= MULTIPLICATIVE and (self.currentToken.type
+                                                == TokenTypes.MINUS):
             isNegated = True
             self.__get_next_token()
 
-        if (left := self.__try_parse_factor()) is None:
+        if (left := (yield from self.__try_parse_factor())) is None:
             if isNegated:
-                raise ParserError(message="Expected factor after \'-\'.",
-                                  currentToken=self.__get_current_token())
+                raise self.__error(message="Expected factor after \'-\'.")
             else:
                 return None
 
-        if isNegated and self.__get_current_token().type not in [
-                TokenTypes.MULTIPLY, TokenTypes.DIVIDE
-        ]:
-            return SubExpression(leftFactor=left, isNegated=isNegated)
-
-        while operator := self.__try_parse_operator(
-                possibleOperators=[TokenTypes.MULTIPLY, TokenTypes.DIVIDE]):
-            if (right := self.__try_parse_factor()) is None:
-                raise ParserError(
-                    message="Expected factor after operator ( \'*\' or \'/\').",
-                    currentToken=self.__get_current_token())
-
-            left = SubExpression(leftFactor=left,
-                                 operator=operator,
-                                 rightFactor=right,
-                                 isNegated=isNegated)
-
-        return left
-
-    def __try_parse_expression(self) -> Optional[Expression]:
-        if (left := self.__try_parse_subexpression()) is None:
-            return None
-
-        while operator := self.__try_parse_operator(
-                possibleOperators=[TokenTypes.PLUS, TokenTypes.MINUS]):
-            if (right := self.__try_parse_subexpression()) is None:
-                raise ParserError(
-                    message=
-                    "Expected expression after operator ( \'+\' or \'-\').",
-                    currentToken=self.__get_current_token())
+        operator = EXPRESSION_OPERATORS.get(self.currentToken.type)
+        if isNegated and (operator is None
+                          or operator.precedence != MULTIPLICATIVE):
+            left = SubExpression(leftFactor=left, isNegated=isNegated)
+
+        while operator is not None and operator.precedence >= minPrecedence:
+            operatorValue = self.currentToken.value
+            #division is the only operator which can fail, positions of
+            #other ones are not kept
+            position = (self.currentToken.position
+                        if self.currentToken.type == TokenTypes.DIVIDE else
+                        None)
+            self.__get_next_token()
+            if (right := (yield from self.__try_parse_expression(
+                    operator.precedence + 1))) is None:
+                raise self.__error(message=operator.errorMessage)
+
+            if operator.precedence == MULTIPLICATIVE:
+                left = SubExpression(leftFactor=left,
+                                     operator=operatorValue,
+                                     rightFactor=right,
+                                     isNegated=isNegated,
+                                     position=position)
+            else:
+                left = Expression(leftExpression=left,
+                                  operator=operatorValue,
+                                  rightExpression=right)
 
-            left = Expression(leftExpression=left,
-                              operator=operator,
-                              rightExpression=right)
+            operator = EXPRESSION_OPERATORS.get(self.currentToken.type)
 
         return left
 
-    def __try_parse_parentheses_expression(self) -> Optional[Expression]:
+    def __try_parse_parentheses_expression(self):
         if self.__get_current_token().type != TokenTypes.OPEN_PARENTHESES:
             return None
 
         self.__get_next_token()
-        if (expression := self.__try_parse_expression()) is None:
-            raise ParserError(message="Expected expression after \'(\'.",
-                              currentToken=self.__get_current_token())
+        if (expression := (yield self.__try_parse_expression())) is None:
+            raise self.__error(message="Expected expression after \'(\'.")
 
         if not self.__token_required(
                 tokenTypes=[TokenTypes.CLOSE_PARENTHESES]):
-            raise ParserError(message="Expected \')\' after expression",
-                              currentToken=self.__get_current_token())
+            raise self.__error(message="Expected \')\' after expression")
 
         self.__get_next_token()
         return expression
 
     def __try_parse_assign_or_function_call(self):
-        result = self.__try_parse_function_call_or_identifier()
+        position = self.__get_current_token().position
+        result = yield from self.__try_parse_function_call_or_identifier()
         if result is None:
             return None
         elif type(result) is FunctionCall:
@@ -212,21 +299,19 @@ class Parser:
 
         #result is type Variable
         self.__token_required_consume(tokenTypes=[TokenTypes.ASSIGNMENT])
-        if (expression := self.__try_parse_expression()) is None:
-            raise ParserError(message="Expected expression after \'=\'.",
-                              currentToken=self.__get_current_token())
+        if (expression := (yield from self.__try_parse_expression())) is None:
+            raise self.__error(message="Expected expression after \'=\'.")
 
         self.__token_required_consume(tokenTypes=[TokenTypes.SEMICOLON])
-        return AssignStatement(result, expression)
+        return AssignStatement(result, expression, position)
 
     def __try_parse_parentheses_condition(self):
         if self.__get_current_token().type != TokenTypes.OPEN_PARENTHESES:
             return None
 
         self.__get_next_token()
-        if (condition := self.__try_parse_condition()) is None:
-            raise ParserError(message="Expected condition after \'(\'.",
-                              currentToken=self.__get_current_token())
+        if (condition := (yield self.__try_parse_condition())) is None:
+            raise self.__error(message="Expected condition after \'(\'.")
 
         self.__token_required_consume(
             tokenTypes=[TokenTypes.CLOSE_PARENTHESES])
@@ -239,33 +324,29 @@ class Parser:
             self.__get_next_token()
 
         if self.__get_current_token().type != TokenTypes.OPEN_PARENTHESES:
-            condition = self.__try_parse_expression()
+            condition = yield from self.__try_parse_expression()
         else:
-            condition = self.__try_parse_parentheses_condition()
+            condition = yield from self.__try_parse_parentheses_condition()
 
         if condition is None:
             if isNegated:
-                raise ParserError(message="Expected condition after \'!\'.",
-                                  currentToken=self.__get_current_token())
+                raise self.__error(message="Expected condition after \'!\'.")
             else:
                 return None
 
         return SubCondition(value=condition, isNegated=isNegated)
 
     def __try_parse_condition(self):
-        if (left := self.__try_parse_subcondition()) is None:
+        if (left := (yield from self.__try_parse_subcondition())) is None:
             return None
 
-        if operator := self.__try_parse_operator(possibleOperators=[
-                TokenTypes.LESS, TokenTypes.LESS_OR_EQUAL, TokenTypes.EQUAL,
-                TokenTypes.GREATER, TokenTypes.GREATER_OR_EQUAL,
-                TokenTypes.NOT_EQUAL, TokenTypes.AND, TokenTypes.OR
-        ]):
-            if (right := self.__try_parse_subcondition()) is None:
-                raise ParserError(
+        if operator := self.__try_parse_operator(
+                possibleOperators=CONDITION_OPERATORS):
+            if (right := (yield from self.__try_parse_subcondition())) is None:
+                raise self.__error(
                     message=
-                    "Expected parenthesis condition or expression after logical operator.",
-                    currentToken=self.__get_current_token())
+                    "Expected parenthesis condition or expression after logical operator."
+                )
 
             left = Condition(leftCondition=left,
                              operator=operator,
@@ -277,93 +358,88 @@ class Parser:
         if self.__get_current_token().type != TokenTypes.IF:
             return None
 
+        position = self.__get_current_token().position
         self.__get_next_token()
         self.__token_required_consume(tokenTypes=[TokenTypes.OPEN_PARENTHESES])
-        if (condition := self.__try_parse_condition()) is None:
-            raise ParserError(message="Expected condition after \'(\'.",
-                              currentToken=self.__get_current_token())
+        if (condition := (yield from self.__try_parse_condition())) is None:
+            raise self.__error(message="Expected condition after \'(\'.")
 
         self.__token_required_consume(
             tokenTypes=[TokenTypes.CLOSE_PARENTHESES])
-        if (statement := self.__try_parse_statement()) is None:
-            raise ParserError(message="Expected statement.",
-                              currentToken=self.__get_current_token())
+        if (statement := (yield self.__try_parse_statement())) is None:
+            raise self.__error(message="Expected statement.")
 
         if self.__get_current_token().type == TokenTypes.ELSE:
             self.__get_next_token()
-            if (elseStatement := self.__try_parse_statement()) is None:
-                raise ParserError(
-                    message="Expected statement after \'else\' keyword.",
-                    currentToken=self.__get_current_token())
-            return IfStatement(condition, statement, elseStatement)
+            if (elseStatement := (yield self.__try_parse_statement())) is None:
+                raise self.__error(
+                    message="Expected statement after \'else\' keyword.")
+            return IfStatement(condition, statement, elseStatement, position)
 
-        return IfStatement(condition, statement)
+        return IfStatement(condition, statement, position=position)
 
     def __try_parse_while_statement(self):
         if self.__get_current_token().type != TokenTypes.WHILE:
             return None
 
+        position = self.__get_current_token().position
         self.__get_next_token()
         self.__token_required_consume(tokenTypes=[TokenTypes.OPEN_PARENTHESES])
-        if (condition := self.__try_parse_condition()) is None:
-            raise ParserError(message="Expected condition after \'(\'.",
-                              currentToken=self.__get_current_token())
+        if (condition := (yield from self.__try_parse_condition())) is None:
+            raise self.__error(message="Expected condition after \'(\'.")
 
         self.__token_required_consume(
             tokenTypes=[TokenTypes.CLOSE_PARENTHESES])
-        if (statement := self.__try_parse_statement()) is None:
-            raise ParserError(message="Expected statement.",
-                              currentToken=self.__get_current_token())
+        if (statement := (yield self.__try_parse_statement())) is None:
+            raise self.__error(message="Expected statement.")
 
-        return WhileStatement(condition, statement)
+        return WhileStatement(condition, statement, position)
 
-    def __try_parse_return_statement(self) -> ReturnStatement:
+    def __try_parse_return_statement(self):
         if self.__get_current_token().type != TokenTypes.RETURN:
             return None
 
+        position = self.__get_current_token().position
         self.__get_next_token()
-        if (expression := self.__try_parse_expression()) is None:
-            raise ParserError(
-                message="Expected expression after \'return\' keyword.",
-                currentToken=self.__get_current_token())
+        if (expression := (yield from self.__try_parse_expression())) is None:
+            raise self.__error(
+                message="Expected expression after \'return\' keyword.")
 
         self.__token_required_consume(tokenTypes=[TokenTypes.SEMICOLON])
-        return ReturnStatement(expression)
-
-    def __try_parse_define_statement(self) -> Optional[DefineStatement]:
-        if type := self.__try_parse_type():
-            if identifier := self.__try_parse_identifier():
-                if self.__get_current_token().type == TokenTypes.ASSIGNMENT:
-                    self.__get_next_token()
-                    assignement = self.__try_parse_expression()
-                    if assignement is None:
-                        raise ParserError(
-                            message="Expected expression after \'=\'.",
-                            currentToken=self.__get_current_token())
-
-                    defineStatement = DefineStatement(type, identifier,
-                                                      assignement)
-                else:
-                    defineStatement = DefineStatement(type, identifier)
-
-                self.__token_required_consume(
-                    tokenTypes=[TokenTypes.SEMICOLON])
-                return defineStatement
+        return ReturnStatement(expression, position)
 
-            else:
-                raise ParserError(message="Expected identifier after type.",
-                                  currentToken=self.__get_current_token())
-        else:
+    def __try_parse_define_statement(self):
+        position = self.__get_current_token().position
+        if (type := self.__try_parse_type()) is None:
             return None
 
-    def __try_parse_function_definition(self) -> Optional[FunctionDef]:
+        if (identifier := self.__try_parse_identifier()) is None:
+            raise self.__error(message="Expected identifier after type.")
+
+        if self.__get_current_token().type == TokenTypes.ASSIGNMENT:
+            self.__get_next_token()
+            assignement = yield from self.__try_parse_expression()
+            if assignement is None:
+                raise self.__error(message="Expected expression after \'=\'.")
+
+            defineStatement = DefineStatement(type, identifier, assignement,
+                                              position)
+        else:
+            defineStatement = DefineStatement(type,
+                                              identifier,
+                                              position=position)
+
+        self.__token_required_consume(tokenTypes=[TokenTypes.SEMICOLON])
+        return defineStatement
+
+    def __try_parse_function_definition(self):
         if self.__get_current_token().type != TokenTypes.FUNCTION:
             return None
 
+        position = self.__get_current_token().position
         self.__get_next_token()
         if (identifier := self.__try_parse_identifier()) is None:
-            raise ParserError(message="Expected identifier after \'fn\'.",
-                              currentToken=self.__get_current_token())
+            raise self.__error(message="Expected identifier after \'fn\'.")
 
         self.__token_required_consume(tokenTypes=[TokenTypes.OPEN_PARENTHESES])
         parameters = self.__try_parse_parameters()
@@ -374,60 +450,134 @@ class Parser:
         if self.__get_current_token().type == TokenTypes.RETURN_SIGN:
             self.__get_next_token()
             if (returnType := self.__try_parse_type()) is None:
-                raise ParserError(
-                    message="Expected type after return sign \'->\'.",
-                    currentToken=self.__get_current_token())
-
-        if (statement := self.__try_parse_statement()) is None:
-            raise ParserError(
-                message="Expected statement after function declaration",
-                currentToken=self.__get_current_token())
+                raise self.__error(
+                    message="Expected type after return sign \'->\'.")
+
+        statement = None
+        if self.lazy and self.__get_current_token(
+        ).type == TokenTypes.OPEN_BRACE:
+            #not closed block is parsed now to report the error
+            statement = self.__skip_statement_block()
+        if statement is None:
+            statement = yield self.__try_parse_statement()
+        if statement is None:
+            raise self.__error(
+                message="Expected statement after function declaration")
 
         return FunctionDef(identifier=identifier,
                            parameters=parameters,
                            statement=statement,
-                           returnType=returnType)
+                           returnType=returnType,
+                           position=position)
 
-    def __try_parse_statement(self):
-        for try_parse in [
-                self.__try_parse_define_statement,
-                self.__try_parse_assign_or_function_call,
-                self.__try_parse_if_statement,
-                self.__try_parse_while_statement,
-                self.__try_parse_return_statement
-        ]:
-            if (statement := try_parse()) is not None:
-                return statement
-
-        self.__token_required_consume(tokenTypes=[TokenTypes.OPEN_BRACE])
+    def __skip_statement_block(self) -> Optional[LazyStatement]:
+        #only braces are matched, tokens of the body are parsed on first use
+        if (blockLexer := self.lexer.skip_block()) is None:
+            return None
+
+        self.__get_next_token()
+        return LazyStatement(blockLexer)
+
+    def __try_parse_statement_block(self):
+        if self.__get_current_token().type != TokenTypes.OPEN_BRACE:
+            return None
+
+        self.__get_next_token()
         statements = []
         while self.__get_current_token().type != TokenTypes.CLOSE_BRACE:
-            if (statement := self.__try_parse_statement()) is None:
-                raise ParserError(message="Expected statement.",
-                                  currentToken=self.__get_current_token())
+            if (statement := (yield self.__try_parse_statement())) is None:
+                raise self.__error(message="Expected statement.")
 
             statements.append(statement)
 
         self.__token_required_consume(tokenTypes=[TokenTypes.CLOSE_BRACE])
         return StatementBlock(statements)
 
+    def __try_parse_statement(self):
+        try_parse = self.__statementDispatch.get(
+            self.__get_current_token().type)
+        if try_parse is None:
+            #no statement starts with current token, block is the last option
+            self.__token_required(tokenTypes=[TokenTypes.OPEN_BRACE])
+
+        return (yield from try_parse(self))
+
+    def __parse(self, rule):
+        #rules are generators, they yield generators of nested statements,
+        #parentheses and arguments and get back their results, other rules
+        #are delegated to with yield from, nesting is run with Python
+        #recursion up to MAX_RECURSION_DEPTH levels and deeper with
+        #explicit stack
+        if self.__depth >= MAX_RECURSION_DEPTH:
+            return self.__parse_iteratively(rule)
+
+        self.__depth += 1
+        try:
+            result = None
+            while True:
+                try:
+                    nested = rule.send(result)
+                except StopIteration as stop:
+                    return stop.value
+                result = self.__parse(nested)
+        finally:
+            self.__depth -= 1
+
+    def __parse_iteratively(self, rule):
+        stack = [rule]
+        result = None
+        while True:
+            try:
+                nested = stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                if not stack:
+                    return stop.value
+                result = stop.value
+            else:
+                if self.__depth + len(stack) >= MAX_NESTING_DEPTH:
+                    raise self.__error(message="Program is nested too deep.")
+                stack.append(nested)
+                result = None
+
+    def try_parse_statement(self):
+        return self.__parse(self.__try_parse_statement())
+
     def try_parse_program(self) -> Optional[Program]:
         self.__functionDefList = []
         self.__defineStatementList = []
 
         while self.__get_current_token().type != TokenTypes.EOF:
-            if result := self.__try_parse_function_definition():
+            try_parse = self.__programDispatch.get(
+                self.__get_current_token().type)
+            if try_parse is None:
+                raise self.__error(message="Invalid token.")
+
+            if type(result := self.__parse(try_parse(self))) is FunctionDef:
                 self.__functionDefList.append(result)
-            elif result := self.__try_parse_define_statement():
+            else:
                 self.__defineStatementList.append(result)
 
-            if ((not bool(self.__functionDefList)) or
-                (not bool(self.__defineStatementList))) and result is None:
-                raise ParserError(message="Invalid token.",
-                                  currentToken=self.__get_current_token())
-
         if (not bool(self.__functionDefList)) and (not bool(
                 self.__defineStatementList)):
             return None
         else:
             return Program(self.__functionDefList, self.__defineStatementList)
+
+    #rule is chosen by the current token from FIRST sets of grammar.ebnf,
+    #import fails when the grammar has a rule without parsing method
+    __statementDispatch = bind_dispatch_table(
+        GRAMMAR.dispatch_table("statement"), {
+            "defineStatement": __try_parse_define_statement,
+            "assignStatement": __try_parse_assign_or_function_call,
+            "functionCall": __try_parse_assign_or_function_call,
+            "ifStatement": __try_parse_if_statement,
+            "whileStatement": __try_parse_while_statement,
+            "returnStatement": __try_parse_return_statement,
+            "{": __try_parse_statement_block
+        })
+    __programDispatch = bind_dispatch_table(
+        GRAMMAR.dispatch_table("program"), {
+            "functionDef": __try_parse_function_definition,
+            "defineStatement": __try_parse_define_statement
+        })
@@ -5,6 +5,9 @@ Parameter = namedtuple("Parameter", ["type", "identifier"])
 
 
 class Program(INode):
+    fields = ("functionDefList", "defineStatementList")
+    __slots__ = fields
+
     def __init__(self, functionDefList: list,
                  defineStatementList: list) -> None:
         self.functionDefList = functionDefList
@@ -21,15 +24,23 @@ class Program(INode):
 
 
 class FunctionDef(INode):
+    fields = ("identifier", "parameters", "statement", "returnType")
+    #position of node in source and frameSize set by resolver are not
+    #a part of structure, the same holds for other nodes below
+    __slots__ = fields + ("position", "frameSize")
+
     def __init__(self,
                  identifier: str,
                  parameters: list[Parameter],
                  statement,
-                 returnType: str = None) -> None:
+                 returnType: str = None,
+                 position: tuple = None) -> None:
         self.identifier = identifier
         self.parameters = parameters
         self.statement = statement
         self.returnType = returnType
+        self.position = position
+        self.frameSize = None
 
     def __repr__(self):
         identifier = f"identifier:{self.identifier}\n"
@@ -43,9 +54,16 @@ class FunctionDef(INode):
 
 
 class FunctionCall(INode):
-    def __init__(self, identifier: str, arguments: list) -> None:
+    fields = ("identifier", "arguments")
+    __slots__ = fields + ("position", )
+
+    def __init__(self,
+                 identifier: str,
+                 arguments: list,
+                 position: tuple = None) -> None:
         self.identifier = identifier
         self.arguments = arguments
+        self.position = position
 
     def __repr__(self):
         identifier = f"identifier:{self.identifier}\n"
@@ -65,6 +83,9 @@ class FunctionCall(INode):
 
 
 class StatementBlock(INode):
+    fields = ("statements", )
+    __slots__ = fields
+
     def __init__(self, statements: list) -> None:
         self.statements = statements
 
@@ -77,8 +98,14 @@ class StatementBlock(INode):
 
 
 class ReturnStatement(INode):
-    def __init__(self, expression) -> None:
+    fields = ("expression", )
+    #isTailCall is set by resolver, it is not a part of structure
+    __slots__ = fields + ("position", "isTailCall")
+
+    def __init__(self, expression, position: tuple = None) -> None:
         self.expression = expression
+        self.position = position
+        self.isTailCall = False
 
     def __repr__(self):
         expression = f"expression:{self.expression}\n"
@@ -92,9 +119,16 @@ class ReturnStatement(INode):
 
 
 class AssignStatement(INode):
-    def __init__(self, identifier, expression) -> None:
+    fields = ("identifier", "expression")
+    __slots__ = fields + ("position", )
+
+    def __init__(self,
+                 identifier,
+                 expression,
+                 position: tuple = None) -> None:
         self.identifier = identifier
         self.expression = expression
+        self.position = position
 
     def __repr__(self):
         identifier = f"identifier:{self.identifier}\n"
@@ -110,10 +144,19 @@ class AssignStatement(INode):
 
 
 class DefineStatement(INode):
-    def __init__(self, type, identifier, expression=None) -> None:
+    fields = ("type", "identifier", "expression")
+    __slots__ = fields + ("position", "slot")
+
+    def __init__(self,
+                 type,
+                 identifier,
+                 expression=None,
+                 position: tuple = None) -> None:
         self.type = type
         self.identifier = identifier
         self.expression = expression
+        self.position = position
+        self.slot = None
 
     def __repr__(self):
         type = f"type:{self.type}\n"
@@ -131,10 +174,18 @@ class DefineStatement(INode):
 
 
 class IfStatement(INode):
-    def __init__(self, condition, statement, elseStatement=None) -> None:
+    fields = ("condition", "statement", "elseStatement")
+    __slots__ = fields + ("position", )
+
+    def __init__(self,
+                 condition,
+                 statement,
+                 elseStatement=None,
+                 position: tuple = None) -> None:
         self.condition = condition
         self.statement = statement
         self.elseStatement = elseStatement
+        self.position = position
 
     def __repr__(self):
         condition = f"condition:{self.condition}\n"
@@ -147,9 +198,16 @@ class IfStatement(INode):
 
 
 class WhileStatement(INode):
-    def __init__(self, condition, statement) -> None:
+    fields = ("condition", "statement")
+    __slots__ = fields + ("position", )
+
+    def __init__(self,
+                 condition,
+                 statement,
+                 position: tuple = None) -> None:
         self.condition = condition
         self.statement = statement
+        self.position = position
 
     def __repr__(self):
         condition = f"condition:{self.condition}\n"
@@ -161,6 +219,9 @@ class WhileStatement(INode):
 
 
 class Expression(INode):
+    fields = ("leftExpression", "operator", "rightExpression")
+    __slots__ = fields
+
     def __init__(self,
                  leftExpression,
                  operator=None,
@@ -176,24 +237,32 @@ class Expression(INode):
         return "\n    Expression:\n" + operator + leftExpression + rightExpression
 
     def __str__(self) -> str:
-        return "{le} {op} {re}".format(le=str(self.leftExpression),
-                                       op=str(self.operator or ''),
-                                       re=str(self.rightExpression or ''))
+        #literal zero is a right operand too
+        rightExpression = self.rightExpression
+        return "{le} {op} {re}".format(
+            le=str(self.leftExpression),
+            op=str(self.operator or ''),
+            re=str('' if rightExpression is None else rightExpression))
 
     def accept(self, visitor) -> None:
         visitor.evaluate_expression(self)
 
 
 class SubExpression(INode):
+    fields = ("leftFactor", "operator", "rightFactor", "isNegated")
+    __slots__ = fields + ("position", )
+
     def __init__(self,
                  leftFactor,
                  operator=None,
                  rightFactor=None,
-                 isNegated: bool = False) -> None:
+                 isNegated: bool = False,
+                 position: tuple = None) -> None:
         self.leftFactor = leftFactor
         self.rightFactor = rightFactor
         self.operator = operator
         self.isNegated = isNegated
+        self.position = position
 
     def __repr__(self):
         leftFactor = f"left factor:{self.leftFactor}\n"
@@ -203,15 +272,20 @@ class SubExpression(INode):
         return "\n    Multiplicative expression:\n" + isNegated + operator + leftFactor + rightFactor
 
     def __str__(self) -> str:
-        return "{lf} {op} {rf}".format(lf=str(self.leftFactor),
-                                       op=str(self.operator or ''),
-                                       rf=str(self.rightFactor or ''))
+        rightFactor = self.rightFactor
+        return "{lf} {op} {rf}".format(
+            lf=str(self.leftFactor),
+            op=str(self.operator or ''),
+            rf=str('' if rightFactor is None else rightFactor))
 
     def accept(self, visitor) -> None:
         visitor.evaluate_subsexpression(self)
 
 
 class ParenthesesExpression(INode):
+    fields = ("expression", )
+    __slots__ = fields
+
     def __init__(self, expression) -> None:
         self.expression = expression
 
@@ -226,8 +300,14 @@ class ParenthesesExpression(INode):
 
 
 class Variable(INode):
+    fields = ("identifier", )
+    #index of variable in frame of function or in globals
+    __slots__ = fields + ("slot", "isGlobal")
+
     def __init__(self, identifier: str) -> None:
         self.identifier = identifier
+        self.slot = None
+        self.isGlobal = False
 
     def __repr__(self):
         return f"\n    Variable:{self.identifier}\n"
@@ -240,6 +320,9 @@ class Variable(INode):
 
 
 class Condition(INode):
+    fields = ("leftCondition", "operator", "rightCondition")
+    __slots__ = fields
+
     def __init__(self,
                  leftCondition,
                  operator=None,
@@ -259,6 +342,9 @@ class Condition(INode):
 
 
 class SubCondition(INode):
+    fields = ("value", "isNegated")
+    __slots__ = fields
+
     def __init__(self, value, isNegated: bool = False) -> None:
         self.value = value
         self.isNegated = isNegated
@@ -272,6 +358,9 @@ class SubCondition(INode):
 
 
 class ParenthesesCondition(INode):
+    fields = ("value", )
+    __slots__ = fields
+
     def __init__(self, value) -> None:
         self.value = value
 
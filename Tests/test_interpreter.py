@@ -1,10 +1,16 @@
+import contextlib
+import io
 import unittest
 from HelperModules.symbols import SymbolsTable
 from HelperModules.sourcehandler import DirectInputHandler
 from HelperModules.errorhandler import *
 from Lexer.lexer import Lexer
+from Lexer.regexlexer import RegexLexer
 from Parser.parser import Parser
+from Parser.types import ReturnStatement
 from Interpreter.interpreter import Interpreter
+from Interpreter.resolver import Resolver
+from Optimizer.transformer import iterate_nodes
 
 
 def build_interpreter(sourceCode: str) -> Interpreter:
@@ -112,6 +118,236 @@ class InterpreterPositiveTestSuite(unittest.TestCase):
         self.assertEqual(result, 34)
 
 
+class InterpreterLazyParsingTestSuite(unittest.TestCase):
+    def build_lazy_interpreter(self, sourceCode: str) -> Interpreter:
+        lexer = RegexLexer(sourceHandler=DirectInputHandler(sourceCode),
+                           symbolsTable=SymbolsTable())
+        return Interpreter(Parser(lexer=lexer, lazy=True))
+
+    def test_not_called_function_is_not_parsed(self):
+        sourceCode = ("fn broken() { int a = ; }"
+                      "fn twice(int a) -> int { return a * 2; }"
+                      "fn main() -> int { return twice(21); }")
+        interpreter = self.build_lazy_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), 42)
+
+    def test_error_in_called_function(self):
+        sourceCode = ("fn broken() { int a = ; }"
+                      "fn main() { broken(); }")
+        interpreter = self.build_lazy_interpreter(sourceCode)
+        self.assertRaises(ParserError, interpreter.interpret)
+
+    def test_main_with_variables(self):
+        sourceCode = ("fn main() -> int { int a = 21; return a * 2; }")
+        interpreter = self.build_lazy_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), 42)
+
+    def test_type_error_in_called_function(self):
+        sourceCode = ("fn broken() -> int { return \"a\"; }"
+                      "fn main() -> int { return broken(); }")
+        interpreter = self.build_lazy_interpreter(sourceCode)
+        self.assertRaises(TypeCheckError, interpreter.interpret)
+
+
+class TypeCheckerTestSuite(unittest.TestCase):
+    def test_error_reported_before_execution(self):
+        sourceCode = ("fn main() {"
+                      "print(\"started\");"
+                      "int i = 0;"
+                      "while (i > 0) i = 1.0;"
+                      "}")
+        interpreter = build_interpreter(sourceCode)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertRaises(TypeCheckError, interpreter.interpret)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_error_in_not_called_function(self):
+        sourceCode = ("fn unused(float a) -> int return a;"
+                      "fn main() -> int return 0;")
+        interpreter = build_interpreter(sourceCode)
+        self.assertRaises(TypeCheckError, interpreter.interpret)
+
+    def test_arguments_of_stdlib_function(self):
+        sourceCode = ("fn main() print(int_to_string(1.5));")
+        interpreter = build_interpreter(sourceCode)
+        self.assertRaises(TypeCheckError, interpreter.interpret)
+
+    def test_value_of_function_without_return_type(self):
+        sourceCode = ("fn f() {}" "fn main() -> int return f();")
+        interpreter = build_interpreter(sourceCode)
+        self.assertRaises(TypeCheckError, interpreter.interpret)
+
+    def test_return_call_in_function_without_return_type(self):
+        sourceCode = ("fn hello() print(\"hi\");"
+                      "fn wrap() { return hello(); }"
+                      "fn main() wrap();")
+        interpreter = build_interpreter(sourceCode)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            interpreter.interpret()
+        self.assertEqual(output.getvalue(), "hi\n")
+
+    def test_string_operations(self):
+        sourceCode = ("fn main() -> int {"
+                      "string s = \"a\";"
+                      "s = s * s;"
+                      "return 0;"
+                      "}")
+        interpreter = build_interpreter(sourceCode)
+        self.assertRaises(TypeCheckError, interpreter.interpret)
+
+    def test_global_initializer(self):
+        sourceCode = ("int g = 1.0;" "fn main() {}")
+        interpreter = build_interpreter(sourceCode)
+        self.assertRaises(TypeCheckError, interpreter.interpret)
+
+    def test_definitions_in_branches(self):
+        sourceCode = ("fn main() -> int {"
+                      "int c = 0;"
+                      "if (c) { int x = 1; } else { int x = 2; c = x; }"
+                      "return c;"
+                      "}")
+        interpreter = build_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), 2)
+
+    def test_global_initializers_evaluated(self):
+        sourceCode = ("int g = 2 * 3;"
+                      "string s;"
+                      "fn main() -> string return int_to_string(g) + s;")
+        interpreter = build_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), "6")
+
+
+class ResolverTestSuite(unittest.TestCase):
+    def test_recursive_calls_have_own_frames(self):
+        sourceCode = ("fn fib(int n) -> int {"
+                      "if (n < 2) return n;"
+                      "int a = fib(n - 1);"
+                      "int b = fib(n - 2);"
+                      "return a + b;"
+                      "}"
+                      "fn main() -> int return fib(10);")
+        interpreter = build_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), 55)
+
+    def test_parameter_hides_global_variable(self):
+        sourceCode = ("int n = 1;"
+                      "fn f(int n) -> int { n = n + 1; return n; }"
+                      "fn main() -> int return f(5) + n;")
+        interpreter = build_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), 7)
+
+    def test_redefinition_in_loop(self):
+        sourceCode = ("fn main() {"
+                      "int i = 0;"
+                      "while (i < 2) { int j = i; i = i + 1; }"
+                      "}")
+        interpreter = build_interpreter(sourceCode)
+        self.assertRaises(InterpreterRuntimeError, interpreter.interpret)
+
+    def test_variable_defined_in_not_executed_branch(self):
+        sourceCode = ("fn main() -> int {"
+                      "int c = 0;"
+                      "if (c) int x = 1;"
+                      "x = 2;"
+                      "return c;"
+                      "}")
+        interpreter = build_interpreter(sourceCode)
+        self.assertRaises(InterpreterRuntimeError, interpreter.interpret)
+
+
+class TailCallTestSuite(unittest.TestCase):
+    def test_deep_tail_recursion(self):
+        sourceCode = ("fn sum(int n, int acc) -> int {"
+                      "if (n == 0) return acc;"
+                      "return sum(n - 1, acc + n);"
+                      "}"
+                      "fn main() -> int return sum(100000, 0);")
+        interpreter = build_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True),
+                         5000050000)
+
+    def test_arguments_use_previous_parameters(self):
+        sourceCode = ("fn f(int n, int a, int b) -> int {"
+                      "if (n == 0) return a;"
+                      "return f(n - 1, b, a);"
+                      "}"
+                      "fn main() -> int return f(3, 1, 2);")
+        interpreter = build_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), 2)
+
+    def test_body_variables_are_defined_again(self):
+        sourceCode = ("fn f(int n) -> int {"
+                      "int m = n - 1;"
+                      "if (m < 0) return n;"
+                      "return f(m);"
+                      "}"
+                      "fn main() -> int return f(5);")
+        interpreter = build_interpreter(sourceCode)
+        self.assertEqual(interpreter.interpret(returnResult=True), 0)
+
+    def test_tail_calls_are_marked(self):
+        lexer = Lexer(sourceHandler=DirectInputHandler(
+            "fn f(int n) -> int {"
+            "while (n > 10) return f(n - 1);"
+            "if (n > 5) return f(n - 1);"
+            "if (n > 0) return 1 + f(n - 1);"
+            "return g(n);"
+            "}"
+            "fn g(int n) -> int return n;"),
+                      symbolsTable=SymbolsTable())
+        program = Parser(lexer=lexer).try_parse_program()
+        Resolver().resolve_program(program)
+        returns = [
+            node for node in iterate_nodes(program.functionDefList[0])
+            if type(node) is ReturnStatement
+        ]
+        self.assertEqual([node.isTailCall for node in returns],
+                         [False, True, False, False])
+
+
+class RuntimeErrorPositionTestSuite(unittest.TestCase):
+    def get_error(self, sourceCode: str) -> str:
+        interpreter = build_interpreter(sourceCode)
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(InterpreterRuntimeError) as context:
+                interpreter.interpret()
+        return str(context.exception)
+
+    def test_division_by_zero(self):
+        error = self.get_error("fn f(int a) -> int {\n"
+                               "    int b = 2;\n"
+                               "    print(\"x\");\n"
+                               "    return b / a;\n"
+                               "}\n"
+                               "fn main() -> int return f(0);\n")
+        self.assertIn("function: f.", error)
+        self.assertIn("line:4, column:14", error)
+        self.assertIn("Division by zero.", error)
+
+    def test_invalid_conversion(self):
+        error = self.get_error("fn main() {\n"
+                               "    int d = 0;\n"
+                               "    print(frc_to_string(frc(1, d)));\n"
+                               "}\n")
+        self.assertIn("line:3, column:25", error)
+
+    def test_condition_of_if_statement(self):
+        error = self.get_error("fn main() {\n"
+                               "    int c = 0;\n"
+                               "    if (c) int x = 1;\n"
+                               "    if (x) print(\"x\");\n"
+                               "}\n")
+        self.assertIn("line:4, column:5", error)
+
+    def test_global_initializer(self):
+        error = self.get_error("int a = 0;\n"
+                               "int b = 1 / a;\n"
+                               "fn main() {}\n")
+        self.assertIn("line:2, column:11", error)
+
+
 class InterpreterTestStdLib(unittest.TestCase):
     def test_print(self):
         sourceCode = ("fn main() -> int {"
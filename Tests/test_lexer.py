@@ -1,8 +1,11 @@
+import random
 import unittest
 from HelperModules.sourcehandler import FileHandler, DirectInputHandler
 from HelperModules.symbols import SymbolsTable, TokenTypes
 from HelperModules.errorhandler import LexerError
+from Lexer.incremental import IncrementalLexer, Edit
 from Lexer.lexer import Lexer, MAX_STRING_SIZE
+from Lexer.regexlexer import RegexLexer
 from Lexer.token import Token
 
 
@@ -146,3 +149,174 @@ class LexerTestSuit(unittest.TestCase):
 
         while lexer.get_token(verbose=True).type != TokenTypes.EOF:
             pass
+
+
+def lex_all(lexerClass, input: str) -> list:
+    lexer = lexerClass(sourceHandler=DirectInputHandler(input),
+                       symbolsTable=SymbolsTable())
+    tokens = []
+    try:
+        while (token := lexer.get_token()).type != TokenTypes.EOF:
+            tokens.append((token.type, token.value, token.position))
+        tokens.append((token.type, token.value, token.position))
+    except LexerError as error:
+        tokens.append(str(error))
+    return tokens
+
+
+class RegexLexerParityTestSuite(unittest.TestCase):
+    def assert_parity(self, input: str):
+        self.assertEqual(lex_all(RegexLexer, input), lex_all(Lexer, input))
+
+    def test_no_source_handler(self):
+        self.assertRaises(LexerError, RegexLexer, None, None)
+
+    def test_source_files(self):
+        for path in [
+                "Tests/lexer/empty_file.txt", "Tests/lexer/tokens.txt",
+                "Tests/grammar/fibonacci.txt", "Tests/grammar/casting.txt",
+                "Tests/grammar/conditions.txt", "Tests/acceptance/power.txt",
+                "Tests/acceptance/simple.txt"
+        ]:
+            with open(path) as file:
+                self.assert_parity(file.read())
+
+    def test_positions(self):
+        self.assert_parity("fn main()\n{\n\t# comment\n  return \"a\nb\";\n}\n")
+
+    def test_errors(self):
+        for input in [
+                "12newVal", "15.", "15.2.", "15.x;", "1", "00", "|&", "&-",
+                "&", "@15_elem", "a\n  @", "\"abc", "\"abc\\",
+                "a" * (MAX_STRING_SIZE + 1),
+                "\"" + "\\a" * (MAX_STRING_SIZE + 1) + "\""
+        ]:
+            self.assert_parity(input)
+
+
+class TokenStreamTestSuite(unittest.TestCase):
+    def test_tokenize(self):
+        path = "Tests/acceptance/power.txt"
+        for lexerClass in [Lexer, RegexLexer]:
+            expectedLexer = build_lexer_file(path)
+            tokenStream = lexerClass(sourceHandler=FileHandler(path),
+                                     symbolsTable=SymbolsTable()).tokenize()
+
+            for index in range(len(tokenStream)):
+                expectedToken = expectedLexer.get_token()
+                token = tokenStream.get_token(index)
+                self.assertEqual(token.type, expectedToken.type)
+                self.assertEqual(token.value, expectedToken.value)
+                self.assertEqual(token.position, expectedToken.position)
+
+            self.assertEqual(token.type, TokenTypes.EOF)
+
+    def test_interned_values(self):
+        tokenStream = build_lexer_direct("a = a + 1; b = 1.0 + 1;").tokenize()
+        self.assertEqual(len(tokenStream), 13)
+        self.assertEqual(tokenStream.values, ["a", "=", "+", 1, ";", "b", 1.0, "EOF"])
+
+    def test_cursor(self):
+        tokenStream = build_lexer_direct("fn main()\n  return 1;").tokenize()
+        cursor = tokenStream.cursor()
+
+        for index in range(len(tokenStream)):
+            token = cursor.get_token()
+            expectedToken = tokenStream.get_token(index)
+            self.assertEqual(token.type, expectedToken.type)
+            self.assertEqual(token.value, expectedToken.value)
+            self.assertEqual(token.position, expectedToken.position)
+
+        self.assertEqual(cursor.get_token().type, TokenTypes.EOF)
+
+
+def stream_tokens(tokenStream) -> list:
+    tokens = []
+    for index in range(len(tokenStream)):
+        token = tokenStream.get_token(index)
+        tokens.append((token.type, token.value, token.position, token.offset))
+    return tokens
+
+
+class IncrementalLexerTestSuite(unittest.TestCase):
+    def assert_full_lexer_result(self, incrementalLexer, edit: Edit):
+        source = incrementalLexer.source
+        source = source[:edit.offset] + edit.insertedText + source[
+            edit.offset + edit.deletedLength:]
+        try:
+            expected = stream_tokens(build_lexer_direct(source).tokenize())
+        except LexerError:
+            self.assertRaises(LexerError, incrementalLexer.apply_edit, edit)
+            return False
+
+        self.assertEqual(stream_tokens(incrementalLexer.apply_edit(edit)),
+                         expected)
+        return True
+
+    def test_simple_edits(self):
+        incrementalLexer = IncrementalLexer("fn main() {\n  int a = 1;\n}",
+                                            SymbolsTable())
+        for edit in [
+                Edit(16, 0, "bc"),
+                Edit(16, 3, "x y"),
+                Edit(0, 0, "# comment\n"),
+                Edit(14, 0, "\"str\" "),
+                Edit(16, 2, "\n\n"),
+                Edit(len(incrementalLexer.source) - 1, 0, "return 0;")
+        ]:
+            self.assertTrue(
+                self.assert_full_lexer_result(incrementalLexer, edit))
+
+    def test_recovery_after_error(self):
+        incrementalLexer = IncrementalLexer("a = \"text\";", SymbolsTable())
+        self.assertFalse(
+            self.assert_full_lexer_result(incrementalLexer, Edit(9, 1, "")))
+        self.assertTrue(
+            self.assert_full_lexer_result(incrementalLexer, Edit(9, 0, "\"")))
+
+    def test_invalid_edit(self):
+        incrementalLexer = IncrementalLexer("a = 1;", SymbolsTable())
+        self.assertRaises(ValueError, incrementalLexer.apply_edit,
+                          Edit(5, 2, ""))
+
+    def test_random_edits(self):
+        generator = random.Random(2021)
+        with open("Tests/acceptance/power.txt") as file:
+            source = file.read()
+        pieces = [
+            "a", " ", "\n", "(", ")", "+", "-", ">", "=", "fn ", ";", "{",
+            "}", "x y", "&&", " 1 ", "0.5 ", "# c\n", "\"s\" ", "\""
+        ]
+
+        incrementalLexer = IncrementalLexer(source, SymbolsTable())
+        for i in range(300):
+            offset = generator.randint(0, len(incrementalLexer.source))
+            deletedLength = generator.randint(
+                0, min(3,
+                       len(incrementalLexer.source) - offset))
+            insertedText = "".join(
+                generator.choice(pieces)
+                for j in range(generator.randint(0, 2)))
+            edit = Edit(offset, deletedLength, insertedText)
+
+            if not self.assert_full_lexer_result(incrementalLexer, edit):
+                incrementalLexer = IncrementalLexer(source, SymbolsTable())
+
+
+class InterningTestSuite(unittest.TestCase):
+    def test_identifiers_and_literals_interned(self):
+        for lexerClass in [Lexer, RegexLexer]:
+            symbolsTable = SymbolsTable()
+            lexer = lexerClass(sourceHandler=DirectInputHandler(
+                "tmpRes = tmpRes + 1000 * 1000.0 + 1000; \"ab\" \"ab\""),
+                               symbolsTable=symbolsTable)
+            values = []
+            while (token := lexer.get_token()).type != TokenTypes.EOF:
+                values.append(token.value)
+
+            self.assertIs(values[0], values[2])
+            self.assertIs(values[4], values[8])
+            self.assertIsNot(values[4], values[6])
+            self.assertEqual(type(values[6]), float)
+            self.assertIs(values[10], values[11])
+            self.assertEqual(symbolsTable.get_intern_stats(), (3, 4, 3 / 7))
@@ -0,0 +1,70 @@
+import contextlib
+import io
+import unittest
+from HelperModules.memocache import MISSING, MemoCache
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.lexer import Lexer
+from Parser.parser import Parser
+from Interpreter.interpreter import Interpreter
+
+FIBONACCI = ("fn fibonacci(int n) -> int {"
+             "if (n <= 1) return n;"
+             "return fibonacci(n - 1) + fibonacci(n - 2);"
+             "}"
+             "fn main() -> int return fibonacci(20);")
+
+
+def interpret(source: str, memoCache: MemoCache = None) -> tuple:
+    #result and printed output of program
+    parser = Parser(lexer=Lexer(sourceHandler=DirectInputHandler(source),
+                                symbolsTable=SymbolsTable()))
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = Interpreter(parser,
+                             memoCache=memoCache).interpret(returnResult=True)
+    return result, output.getvalue()
+
+
+class MemoCacheTestSuite(unittest.TestCase):
+    def test_stored_result(self):
+        memoCache = MemoCache()
+        self.assertIs(memoCache.get("f", (1, )), MISSING)
+        memoCache.store("f", (1, ), 2)
+        self.assertEqual(memoCache.get("f", (1, )), 2)
+        self.assertIs(memoCache.get("g", (1, )), MISSING)
+        self.assertEqual(memoCache.get_stats(), (1, 2, 1 / 3))
+
+    def test_least_recently_used_result_is_evicted(self):
+        memoCache = MemoCache(maxSize=2)
+        memoCache.store("f", (1, ), 1)
+        memoCache.store("f", (2, ), 2)
+        memoCache.get("f", (1, ))
+        memoCache.store("f", (3, ), 3)
+        self.assertIs(memoCache.get("f", (2, )), MISSING)
+        self.assertEqual(memoCache.get("f", (1, )), 1)
+        self.assertEqual(memoCache.get("f", (3, )), 3)
+
+    def test_functions_have_separate_limits(self):
+        memoCache = MemoCache(maxSize=1)
+        memoCache.store("f", (1, ), 1)
+        memoCache.store("g", (1, ), 2)
+        self.assertEqual(memoCache.get("f", (1, )), 1)
+        self.assertEqual(memoCache.get("g", (1, )), 2)
+
+    def test_memoized_recursive_function(self):
+        memoCache = MemoCache()
+        self.assertEqual(interpret(FIBONACCI, memoCache), interpret(FIBONACCI))
+        #every argument is computed once
+        self.assertEqual(memoCache.misses, 21)
+
+    def test_impure_function_is_not_memoized(self):
+        source = ("int calls = 0;"
+                  "fn f(int a) -> int { print(\"f\"); return a; }"
+                  "fn g(int a) -> int { calls = calls + 1; return calls; }"
+                  "fn main() -> int return f(1) + f(1) + g(1) + g(1);")
+        memoCache = MemoCache()
+        result, output = interpret(source, memoCache)
+        self.assertEqual(result, 5)
+        self.assertEqual(output.splitlines()[:2], ["f", "f"])
+        self.assertEqual(memoCache.get_stats().hits + memoCache.misses, 0)
@@ -0,0 +1,578 @@
+import contextlib
+import fractions
+import io
+import unittest
+from HelperModules.errorhandler import InterpreterRuntimeError
+from HelperModules.sourcehandler import DirectInputHandler, FileHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.lexer import Lexer
+from Parser.parser import Parser
+from Parser.types import *
+from Interpreter.interpreter import Interpreter
+from Optimizer.commonsubexpressions import CommonSubexpressionEliminator
+from Optimizer.constantfolding import ConstantFolder
+from Optimizer.deadcode import DeadCodeEliminator
+from Optimizer.inlining import Inliner
+from Optimizer.loopinvariants import LoopInvariantMover
+from Optimizer.purity import find_dependencies, find_pure_functions
+from Optimizer.optimizer import Optimizer
+
+
+def build_parser(sourceHandler) -> Parser:
+    return Parser(
+        lexer=Lexer(sourceHandler=sourceHandler, symbolsTable=SymbolsTable()))
+
+
+def parse(sourceCode: str) -> Program:
+    return build_parser(DirectInputHandler(sourceCode)).try_parse_program()
+
+
+def fold_main(sourceCode: str):
+    program = ConstantFolder().transform(parse(sourceCode))
+    return program.functionDefList[-1].statement
+
+
+def interpret(sourceHandler, optimizer: Optimizer = None) -> tuple:
+    #result and printed output of program
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = Interpreter(build_parser(sourceHandler),
+                             optimizer=optimizer).interpret(returnResult=True)
+    return result, output.getvalue()
+
+
+class ConstantFoldingTestSuite(unittest.TestCase):
+    def test_literal_arithmetic(self):
+        statement = fold_main("fn main() -> int return 7 / 2 * 3 - 1;")
+        self.assertEqual(statement, ReturnStatement(8))
+
+    def test_int_division_is_floored(self):
+        statement = fold_main("fn main() -> int return -7 / 2;")
+        self.assertEqual(statement, ReturnStatement(-3))
+
+    def test_float_arithmetic(self):
+        statement = fold_main("fn main() -> float return 7.0 / 2.0;")
+        self.assertEqual(statement, ReturnStatement(3.5))
+
+    def test_string_concatenation(self):
+        statement = fold_main("fn main() -> string return \"a\" + \"b\";")
+        self.assertEqual(statement, ReturnStatement("ab"))
+
+    def test_frc_functions(self):
+        statement = fold_main(
+            "fn main() -> frc return frc(1, 3) * int_to_frc(3) / frc(2, 1);")
+        self.assertEqual(statement,
+                         ReturnStatement(fractions.Fraction(1, 2)))
+
+    def test_print_is_not_folded(self):
+        statement = fold_main("fn main() print(\"a\");")
+        self.assertEqual(statement, FunctionCall("print", ["a"]))
+
+    def test_division_by_zero_is_not_folded(self):
+        statement = fold_main("fn main() -> int return 1 / 0;")
+        self.assertEqual(statement,
+                         ReturnStatement(SubExpression(1, '/', 0)))
+
+    def test_constant_propagation(self):
+        statement = fold_main("fn main() -> int {"
+                              "int exponent = 100;"
+                              "int half = exponent / 2;"
+                              "return half + exponent;"
+                              "}")
+        self.assertEqual(statement.statements[-1], ReturnStatement(150))
+
+    def test_assigned_variable_is_not_propagated(self):
+        statement = fold_main("fn main() -> int {"
+                              "int a = 1;"
+                              "a = a + 1;"
+                              "return a;"
+                              "}")
+        self.assertEqual(statement.statements[-1],
+                         ReturnStatement(Variable("a")))
+
+    def test_variable_defined_in_branch_is_not_propagated(self):
+        statement = fold_main("fn main() -> int {"
+                              "if (1) { int a = 1; print(\"a\"); }"
+                              "return 0;"
+                              "}")
+        self.assertEqual(statement.statements[0].statement.statements[0],
+                         DefineStatement("int", "a", 1))
+
+    def test_condition_with_true_literal(self):
+        statement = fold_main("fn main() {"
+                              "int i = 0;"
+                              "while ((i < 10000) && 1) i = i + 1;"
+                              "}")
+        self.assertEqual(statement.statements[1].condition,
+                         Condition(Variable("i"), '<', 10000))
+
+    def test_literal_condition(self):
+        statement = fold_main("fn main() {"
+                              "if (!(1 < 2) || (2 == 2)) print(\"a\");"
+                              "}")
+        self.assertIs(statement.statements[0].condition, True)
+
+    def test_example_programs_give_the_same_results(self):
+        for path in ["Tests/grammar/casting.txt", "Tests/grammar/fibonacci.txt"]:
+            with self.subTest(path=path):
+                self.assertEqual(
+                    interpret(FileHandler(path), Optimizer()),
+                    interpret(FileHandler(path)))
+
+    def test_folded_nodes_keep_positions(self):
+        sourceCode = ("fn main() -> int {\n"
+                      "    int b = 2 * 3;\n"
+                      "    int a = 0;\n"
+                      "    return b / a;\n"
+                      "}\n")
+        with self.assertRaises(InterpreterRuntimeError) as context:
+            interpret(DirectInputHandler(sourceCode), Optimizer())
+        self.assertIn("line:4, column:14", str(context.exception))
+
+
+class DeadCodeEliminationTestSuite(unittest.TestCase):
+    def eliminate(self, sourceCode: str) -> tuple:
+        #body of main and number of removed nodes
+        deadCodeEliminator = DeadCodeEliminator()
+        program = deadCodeEliminator.transform(
+            ConstantFolder().transform(parse(sourceCode)))
+        return (program.functionDefList[-1].statement,
+                deadCodeEliminator.removedNodes)
+
+    def test_statements_after_return(self):
+        statement, removedNodes = self.eliminate("fn main() -> int {"
+                                                 "return 1;"
+                                                 "print(\"a\");"
+                                                 "}")
+        self.assertEqual(statement, StatementBlock([ReturnStatement(1)]))
+        self.assertEqual(removedNodes, 1)
+
+    def test_statements_after_if_returning_in_both_arms(self):
+        statement, _ = self.eliminate("fn main(int a) -> int {"
+                                      "if (a) return 1; else return 2;"
+                                      "return 3;"
+                                      "}")
+        self.assertEqual(len(statement.statements), 1)
+        statement, _ = self.eliminate("fn main() -> int {"
+                                      "int a = 0;"
+                                      "a = 1;"
+                                      "if (a) return 1;"
+                                      "return 3;"
+                                      "}")
+        self.assertEqual(len(statement.statements), 4)
+
+    def test_if_with_constant_condition(self):
+        statement, removedNodes = self.eliminate(
+            "fn main() {"
+            "if (1 > 2) print(\"a\"); else print(\"b\");"
+            "}")
+        self.assertEqual(statement, StatementBlock([FunctionCall("print",
+                                                                 ["b"])]))
+        self.assertEqual(removedNodes, 2)
+
+    def test_while_with_false_condition(self):
+        statement, removedNodes = self.eliminate(
+            "fn main() { while (0) { print(\"a\"); } }")
+        self.assertEqual(statement, StatementBlock([]))
+        self.assertEqual(removedNodes, 3)
+
+    def test_unused_definitions(self):
+        statement, removedNodes = self.eliminate("fn main() {"
+                                                 "float a = 2.0;"
+                                                 "float b = a * 2.0;"
+                                                 "print(\"c\");"
+                                                 "}")
+        self.assertEqual(statement, StatementBlock([FunctionCall("print",
+                                                                 ["c"])]))
+        self.assertEqual(removedNodes, 2)
+
+    def test_definitions_with_side_effects_are_kept(self):
+        statement, removedNodes = self.eliminate("fn f() -> int return 1;"
+                                                 "fn main(int a) {"
+                                                 "int b = f();"
+                                                 "int c = 1 / a;"
+                                                 "}")
+        self.assertEqual(len(statement.statements), 2)
+        self.assertEqual(removedNodes, 0)
+
+    def test_definition_in_loop_is_kept(self):
+        statement, _ = self.eliminate("fn main() {"
+                                      "int i = 0;"
+                                      "while (i < 2) { int a = 1; i = i + 1; }"
+                                      "}")
+        self.assertEqual(len(statement.statements[1].statement.statements), 2)
+
+    def test_variable_of_removed_branch(self):
+        sourceCode = ("fn main() -> int {"
+                      "if (0) { int a = 1; }"
+                      "a = 2;"
+                      "return a;"
+                      "}")
+        self.assertRaises(InterpreterRuntimeError, interpret,
+                          DirectInputHandler(sourceCode), Optimizer())
+
+
+class InliningTestSuite(unittest.TestCase):
+    def inline(self, sourceCode: str, budget: int = 20) -> tuple:
+        #body of main and number of inlined calls
+        inliner = Inliner(budget)
+        program = parse(sourceCode)
+        inliner.set_functions(program.functionDefList)
+        program = inliner.transform(program)
+        return program.functionDefList[-1].statement, inliner.inlinedCalls
+
+    def test_single_return_function(self):
+        statement, inlinedCalls = self.inline(
+            "fn twice(int a) -> int { return a + a; }"
+            "fn main(int b) -> int return twice(b);")
+        self.assertEqual(statement,
+                         ReturnStatement(Expression(Variable("b"), "+",
+                                                    Variable("b"))))
+        self.assertEqual(inlinedCalls, 1)
+
+    def test_nested_calls(self):
+        statement, inlinedCalls = self.inline(
+            "fn inc(int a) -> int return a + 1;"
+            "fn incTwice(int a) -> int return inc(inc(a));"
+            "fn main() -> int return incTwice(1);")
+        self.assertEqual(
+            statement,
+            ReturnStatement(Expression(Expression(1, "+", 1), "+", 1)))
+        self.assertEqual(inlinedCalls, 3)
+
+    def test_global_arguments_of_function_with_side_effects(self):
+        sourceCode = ("int g = 1;"
+                      "fn bump() -> int { g = g + 10; return 0; }"
+                      "fn f(int a) -> int return bump() + a;"
+                      "fn main() -> int {"
+                      "int r = f(g);"
+                      "print(int_to_string(r));"
+                      "return r;"
+                      "}")
+        _, inlinedCalls = self.inline(sourceCode)
+        self.assertEqual(inlinedCalls, 0)
+        self.assertEqual(
+            interpret(DirectInputHandler(sourceCode), Optimizer()),
+            interpret(DirectInputHandler(sourceCode)))
+
+    def test_local_arguments_of_function_with_side_effects(self):
+        _, inlinedCalls = self.inline(
+            "int g = 1;"
+            "fn bump() -> int { g = g + 10; return 0; }"
+            "fn f(int a) -> int return bump() + a;"
+            "fn main(int b) -> int return f(b);")
+        self.assertEqual(inlinedCalls, 1)
+
+    def test_recursive_functions_are_not_inlined(self):
+        statement, inlinedCalls = self.inline(
+            "fn f(int a) -> int return f(a);"
+            "fn main() -> int return f(1);")
+        self.assertEqual(statement, ReturnStatement(FunctionCall("f", [1])))
+        self.assertEqual(inlinedCalls, 0)
+
+    def test_budget(self):
+        sourceCode = ("fn f(int a) -> int return a * a + a;"
+                      "fn main() -> int return f(1);")
+        self.assertEqual(self.inline(sourceCode, budget=4)[1], 0)
+        self.assertEqual(self.inline(sourceCode, budget=5)[1], 1)
+        self.assertEqual(self.inline("fn f() -> int return 1;"
+                                     "fn main() -> int return f();",
+                                     budget=0)[1], 0)
+
+    def test_functions_with_statements_are_not_inlined(self):
+        _, inlinedCalls = self.inline("fn f(int a) -> int {"
+                                      "print(\"a\");"
+                                      "return a;"
+                                      "}"
+                                      "fn main() -> int return f(1);")
+        self.assertEqual(inlinedCalls, 0)
+
+    def test_call_as_statement_is_not_inlined(self):
+        statement, inlinedCalls = self.inline(
+            "fn f(int a) -> int return a;"
+            "fn main() { f(1); }")
+        self.assertEqual(statement, StatementBlock([FunctionCall("f", [1])]))
+        self.assertEqual(inlinedCalls, 0)
+
+    def test_arguments_with_side_effects(self):
+        #argument used twice or with side effects would change the output
+        _, inlinedCalls = self.inline(
+            "fn twice(int a) -> int return a + a;"
+            "fn g() -> int { print(\"g\"); return 1; }"
+            "fn main(int b) -> int return twice(b * 2) + twice(g());")
+        self.assertEqual(inlinedCalls, 0)
+        _, inlinedCalls = self.inline(
+            "fn once(int a) -> int return a + 1;"
+            "fn main(int b) -> int return once(b * 2);")
+        self.assertEqual(inlinedCalls, 1)
+
+    def test_global_hidden_by_local_variable(self):
+        _, inlinedCalls = self.inline("int g = 1;"
+                                      "fn f() -> int return g;"
+                                      "fn main(int g) -> int return f();")
+        self.assertEqual(inlinedCalls, 0)
+
+    def test_inlined_programs_give_the_same_results(self):
+        for sourceCode in [
+                "fn modulo(int n, int d) -> int return n - d * (n / d);"
+                "fn main() -> int {"
+                "int i = 7;"
+                "print(int_to_string(modulo(i, 3)));"
+                "return modulo(i * 5, 4);"
+                "}",
+                "fn half(float a) -> float return a / 2.0;"
+                "fn count() -> int { print(\"c\"); return 3; }"
+                "fn pick(int a, int b) -> int return b - a;"
+                "fn main() -> int {"
+                "print(float_to_string(half(3.0)));"
+                "return pick(count(), count() * 2);"
+                "}"
+        ]:
+            with self.subTest(sourceCode=sourceCode):
+                self.assertEqual(
+                    interpret(DirectInputHandler(sourceCode), Optimizer()),
+                    interpret(DirectInputHandler(sourceCode)))
+
+
+class PurityAnalysisTestSuite(unittest.TestCase):
+    def test_pure_functions(self):
+        program = parse("int g = 2;"
+                        "int h = 0;"
+                        "fn constant() -> int return g;"
+                        "fn changed() -> int return h;"
+                        "fn writes() { h = 1; }"
+                        "fn prints() { print(\"a\"); }"
+                        "fn local(int a) -> string { int b = a; b = b + 1;"
+                        "return int_to_string(b) + \"\"; }"
+                        "fn calls() -> int { prints(); return 1; }"
+                        "fn recursive(int a) -> int return recursive(a - 1);"
+                        "fn main() { }")
+        self.assertEqual(find_pure_functions(program),
+                         {"constant", "local", "recursive", "main"})
+
+    def test_skipped_functions(self):
+        program = parse("int g = 2;"
+                        "fn constant() -> int return g;"
+                        "fn skipped() { }"
+                        "fn calls() { skipped(); }"
+                        "fn pure(int a) -> int return a;"
+                        "fn main() { }")
+        self.assertEqual(find_pure_functions(program, {"skipped"}),
+                         {"pure", "main"})
+
+    def test_dependencies(self):
+        program = parse("int g = f(1);"
+                        "fn f(int a) -> int return a;"
+                        "fn h(int a) -> int return a + g;"
+                        "fn k(int a) -> int return h(a) + f(a);"
+                        "fn main() { }")
+        self.assertEqual(
+            [node.identifier for node in find_dependencies(program, "k")],
+            ["k", "h", "f", "g"])
+        self.assertEqual(
+            [node.identifier for node in find_dependencies(program, "f")],
+            ["f"])
+
+
+class LoopInvariantMotionTestSuite(unittest.TestCase):
+    def hoist(self, sourceCode: str) -> tuple:
+        #body of last function and number of hoisted expressions
+        loopInvariantMover = LoopInvariantMover()
+        program = parse(sourceCode)
+        loopInvariantMover.set_program(program)
+        program = loopInvariantMover.transform(program)
+        return (program.functionDefList[-1].statement,
+                loopInvariantMover.hoistedExpressions)
+
+    def test_invariant_expressions_are_hoisted(self):
+        statement, hoistedExpressions = self.hoist(
+            "fn main(int n) -> int {"
+            "int i = 0;"
+            "while (i < n * 2) { i = i + n * 2 + frc_to_int(int_to_frc(n)); }"
+            "return i;"
+            "}")
+        self.assertEqual(statement.statements[1],
+                         DefineStatement("int", "$invariant0",
+                                         SubExpression(Variable("n"), "*",
+                                                       2)))
+        self.assertEqual(statement.statements[3].condition.rightCondition,
+                         SubCondition(Variable("$invariant0")))
+        self.assertEqual(hoistedExpressions, 2)
+
+    def test_changed_variables_are_not_hoisted(self):
+        _, hoistedExpressions = self.hoist(
+            "int g = 1;"
+            "fn f() { g = 2; }"
+            "fn main(int n) {"
+            "int a = 1;"
+            "while (n) { n = n - g * 2; a = a + 1; print(int_to_string(a)); }"
+            "}")
+        self.assertEqual(hoistedExpressions, 0)
+
+    def test_expressions_with_side_effects_are_not_hoisted(self):
+        _, hoistedExpressions = self.hoist(
+            "fn f(int a) -> int return a;"
+            "fn main(int n) {"
+            "int i = 0;"
+            "while (i < 2) {"
+            "i = i + f(n) + n / i + frc_to_int(frc(n, 2));"
+            "}"
+            "}")
+        self.assertEqual(hoistedExpressions, 0)
+
+    def test_variable_defined_in_branch_is_not_hoisted(self):
+        _, hoistedExpressions = self.hoist("fn main(int n) {"
+                                           "if (n) { int a = 1; }"
+                                           "while (n) { n = n - a * 2; }"
+                                           "}")
+        self.assertEqual(hoistedExpressions, 0)
+
+    def test_nested_loop_assigns_temporary(self):
+        statement, hoistedExpressions = self.hoist(
+            "fn main(int n) {"
+            "int i = 0;"
+            "int j = 0;"
+            "while (i < n) { while (j < i * 2) { j = j + 1; } i = i + 1; }"
+            "}")
+        self.assertEqual(statement.statements[0],
+                         DefineStatement("int", "$invariant0"))
+        self.assertEqual(statement.statements[3].statement.statements[0],
+                         AssignStatement(Variable("$invariant0"),
+                                         SubExpression(Variable("i"), "*",
+                                                       2)))
+        self.assertEqual(hoistedExpressions, 1)
+
+    def test_hoisted_programs_give_the_same_results(self):
+        for sourceCode in [
+                "fn f(int n, float x) -> float {"
+                "int i = 0;"
+                "float s = 0.0;"
+                "while (i < n * 3) {"
+                "s = s + x * int_to_float(n) - int_to_float(i);"
+                "i = i + 1;"
+                "}"
+                "return s;"
+                "}"
+                "fn main() -> int {"
+                "print(float_to_string(f(0, 1.5)));"
+                "print(float_to_string(f(4, 1.5)));"
+                "return 0;"
+                "}",
+                "fn main() -> int {"
+                "int i = 0;"
+                "int total = 0;"
+                "int j = 0;"
+                "while (i < 3) {"
+                "j = 0;"
+                "while (j < i * 2) { total = total + i * 10; j = j + 1; }"
+                "i = i + 1;"
+                "}"
+                "return total;"
+                "}"
+        ]:
+            with self.subTest(sourceCode=sourceCode):
+                self.assertEqual(
+                    interpret(DirectInputHandler(sourceCode), Optimizer()),
+                    interpret(DirectInputHandler(sourceCode)))
+
+
+class CommonSubexpressionEliminationTestSuite(unittest.TestCase):
+    def eliminate(self, sourceCode: str) -> tuple:
+        #body of last function and numbers of eliminated evaluations
+        eliminator = CommonSubexpressionEliminator()
+        program = parse(sourceCode)
+        eliminator.set_program(program)
+        program = eliminator.transform(program)
+        return (program.functionDefList[-1].statement,
+                eliminator.eliminatedExpressions)
+
+    def test_repeated_expression(self):
+        statement, eliminatedExpressions = self.eliminate(
+            "fn main(float a, float b) -> float {"
+            "float c = a * b + 1.0;"
+            "return c + a * b;"
+            "}")
+        self.assertEqual(
+            statement,
+            StatementBlock([
+                DefineStatement(
+                    "float", "$common0",
+                    SubExpression(Variable("a"), "*", Variable("b"))),
+                DefineStatement(
+                    "float", "c",
+                    Expression(Variable("$common0"), "+", 1.0)),
+                ReturnStatement(
+                    Expression(Variable("c"), "+", Variable("$common0")))
+            ]))
+        self.assertEqual(eliminatedExpressions, {"main": 1})
+
+    def test_largest_expressions_are_reused(self):
+        statement, eliminatedExpressions = self.eliminate(
+            "fn main(int a) {"
+            "print(int_to_string(a * 2) + int_to_string(a * 2));"
+            "}")
+        self.assertEqual(len(statement.statements), 2)
+        self.assertEqual(statement.statements[0].expression,
+                         FunctionCall("int_to_string",
+                                      [SubExpression(Variable("a"), "*", 2)]))
+        self.assertEqual(eliminatedExpressions, {"main": 1})
+
+    def test_changed_variable(self):
+        _, eliminatedExpressions = self.eliminate(
+            "fn main(int a) -> int {"
+            "int b = a * 2;"
+            "if (b) { a = 1; }"
+            "return a * 2;"
+            "}")
+        self.assertEqual(eliminatedExpressions, {})
+
+    def test_expressions_with_side_effects(self):
+        _, eliminatedExpressions = self.eliminate(
+            "fn f(int a) -> int return a;"
+            "fn main(int a) -> int {"
+            "int b = f(a) + a / b;"
+            "return f(a) + a / b;"
+            "}")
+        self.assertEqual(eliminatedExpressions, {})
+
+    def test_temporary_in_loop_is_assigned(self):
+        statement, _ = self.eliminate("fn main(int a) {"
+                                      "int i = 0;"
+                                      "while (i < a) {"
+                                      "i = i + a * 2;"
+                                      "print(int_to_string(i * 3 - a * 2));"
+                                      "}"
+                                      "}")
+        self.assertEqual(statement.statements[0],
+                         DefineStatement("int", "$common0"))
+        self.assertEqual(statement.statements[2].statement.statements[0],
+                         AssignStatement(Variable("$common0"),
+                                         SubExpression(Variable("a"), "*",
+                                                       2)))
+
+    def test_programs_give_the_same_results(self):
+        for sourceCode in [
+                "fn f(float a, float b) -> string {"
+                "float c = a * b + 1.0;"
+                "print(float_to_string(a * b));"
+                "a = 2.0;"
+                "print(float_to_string(a * b) + float_to_string(a * b));"
+                "if (a * b > 1.0) { return float_to_string(c * c); }"
+                "return float_to_string(a * b);"
+                "}"
+                "fn main() -> string return f(1.0, 2.0) + f(0.5, 0.25);",
+                "fn main() -> int {"
+                "int i = 0;"
+                "int s = 0;"
+                "while (i < 5) {"
+                "s = s + i * i;"
+                "i = i + 1;"
+                "s = s - i * i;"
+                "}"
+                "return s;"
+                "}"
+        ]:
+            with self.subTest(sourceCode=sourceCode):
+                self.assertEqual(
+                    interpret(DirectInputHandler(sourceCode), Optimizer()),
+                    interpret(DirectInputHandler(sourceCode)))
@@ -1,13 +1,26 @@
+import glob
+import pickle
 import unittest
+from unittest import mock
 from HelperModules.symbols import SymbolsTable, TokenTypes
 from HelperModules.sourcehandler import FileHandler, DirectInputHandler
 from HelperModules.errorhandler import ParserError
 from Lexer.lexer import Lexer
+from Lexer.regexlexer import RegexLexer
 from Lexer.token import Token
-from Parser.parser import Parser
+from Parser.parser import Parser, LazyStatement
+from Parser.parallel import ParallelParser, find_function_offsets, split_source
+from Parser.grammar import EbnfReader, Grammar, bind_dispatch_table
+from Parser.ast import INode
 from Parser.types import *
 
 
+def parse_rule(parser: Parser, rule: str):
+    #rules are generators run by parser
+    return parser._Parser__parse(
+        getattr(parser, "_Parser__try_parse_" + rule)())
+
+
 class ParserUnitTestSuitPovitive(unittest.TestCase):
     #Positive tests
     def test_simple_return_statement(self):
@@ -15,7 +28,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                       symbolsTable=SymbolsTable())
 
         parser = Parser(lexer=lexer)
-        parserObject = parser._Parser__try_parse_return_statement()
+        parserObject = parse_rule(parser, "return_statement")
         self.assertEqual(parserObject, ReturnStatement(5))
 
     def test_simple_assignemt(self):
@@ -23,7 +36,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                       symbolsTable=SymbolsTable())
 
         parser = Parser(lexer=lexer)
-        parserObject = parser._Parser__try_parse_assign_or_function_call()
+        parserObject = parse_rule(parser, "assign_or_function_call")
         self.assertEqual(parserObject, AssignStatement(Variable("sampleVar"),
                                                        0))
 
@@ -36,8 +49,8 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
 
         parserOne = Parser(lexer=lexerOne)
         parserTwo = Parser(lexer=lexerTwo)
-        parserObjectOne = parserOne._Parser__try_parse_define_statement()
-        parserObjectTwo = parserTwo._Parser__try_parse_define_statement()
+        parserObjectOne = parse_rule(parserOne, "define_statement")
+        parserObjectTwo = parse_rule(parserTwo, "define_statement")
         self.assertEqual(parserObjectOne, DefineStatement("frc", "testFrc"))
         self.assertEqual(parserObjectTwo,
                          DefineStatement("float", "testFloat", float(0.15)))
@@ -66,7 +79,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
         lexer = Lexer(sourceHandler=DirectInputHandler(""),
                       symbolsTable=SymbolsTable())
         parser = Parser(lexer=lexer)
-        parserObject = parser._Parser__try_parse_arguments()
+        parserObject = parse_rule(parser, "arguments")
         self.assertFalse(parserObject)
 
     def test_simple_arguments(self):
@@ -74,7 +87,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
             sourceHandler=DirectInputHandler("0, 0.01, \"stringLiteral\""),
             symbolsTable=SymbolsTable())
         parser = Parser(lexer=lexer)
-        parserObject = parser._Parser__try_parse_arguments()
+        parserObject = parse_rule(parser, "arguments")
         self.assertEqual(parserObject, [int(0), float(0.01), "stringLiteral"])
 
     def test_factor(self):
@@ -91,7 +104,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
             Variable("testExpr")
         ]
         for i in range(len(expectedObjects)):
-            parserObject = parser._Parser__try_parse_factor()
+            parserObject = parse_rule(parser, "factor")
             self.assertEqual(parserObject, expectedObjects[i])
 
     def test_simple_subexpression(self):
@@ -112,7 +125,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                           rightFactor=4)
         ]
         for i in range(len(expectedObjects)):
-            parserObject = parser._Parser__try_parse_subexpression()
+            parserObject = parse_rule(parser, "subexpression")
             self.assertEqual(parserObject, expectedObjects[i])
 
     def test_simple_expression(self):
@@ -139,7 +152,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                                                      rightFactor=2))
         ]
         for i in range(len(expectedObjects)):
-            parserObject = parser._Parser__try_parse_expression()
+            parserObject = parse_rule(parser, "expression")
             self.assertEqual(parserObject, expectedObjects[i])
 
     def test_expression(self):
@@ -167,7 +180,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                                    operator='-',
                                    rightExpression=2)
                     ])))
-        parserObject = parser._Parser__try_parse_expression()
+        parserObject = parse_rule(parser, "expression")
         self.assertEqual(parserObject.leftFactor, expectedObject.leftFactor)
         self.assertEqual(parserObject.rightFactor.leftExpression,
                          expectedObject.rightFactor.leftExpression)
@@ -182,7 +195,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
         parser = Parser(lexer=lexer)
         expectedObject = SubCondition(
             value=Expression(1, '-', FunctionCall("ret_one_fun", list())))
-        parserObject = parser._Parser__try_parse_subcondition()
+        parserObject = parse_rule(parser, "subcondition")
         self.assertEqual(parserObject, expectedObject)
 
     def test_simple_and_condition(self):
@@ -193,7 +206,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
             SubCondition(value=1), "&&",
             SubCondition(value=FunctionCall(identifier="ret_one_fun",
                                             arguments=list())))
-        parserObject = parser._Parser__try_parse_condition()
+        parserObject = parse_rule(parser, "condition")
         self.assertEqual(parserObject, expectedObject)
 
     def test_simple_operator_condition(self):
@@ -202,7 +215,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
         parser = Parser(lexer=lexer)
         expectedObject = Condition(SubCondition(value=1), "<",
                                    SubCondition(value=5))
-        parserObject = parser._Parser__try_parse_condition()
+        parserObject = parse_rule(parser, "condition")
         self.assertEqual(parserObject, expectedObject)
 
     def test_parentheses_condition(self):
@@ -211,7 +224,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
         parser = Parser(lexer=lexer)
         expectedObject = Condition(SubCondition(value=1), "<",
                                    SubCondition(value=5))
-        parserObject = parser._Parser__try_parse_parentheses_condition()
+        parserObject = parse_rule(parser, "parentheses_condition")
         self.assertEqual(parserObject, expectedObject)
 
     def test_condition(self):
@@ -225,7 +238,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
             "&&",
             SubCondition(value=Condition(SubCondition(
                 value=1), "<", SubCondition(value=5))))
-        parserObject = parser._Parser__try_parse_condition()
+        parserObject = parse_rule(parser, "condition")
         self.assertEqual(parserObject, expectedObject)
 
     def test_one_line_statement_define(self):
@@ -233,7 +246,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                       symbolsTable=SymbolsTable())
         parser = Parser(lexer=lexer)
         expectedObject = DefineStatement("int", 'i', 0)
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_one_line_statement_assign(self):
@@ -241,7 +254,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                       symbolsTable=SymbolsTable())
         parser = Parser(lexer=lexer)
         expectedObject = AssignStatement(Variable('i'), 0)
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_one_line_statement_function_call(self):
@@ -249,7 +262,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                       symbolsTable=SymbolsTable())
         parser = Parser(lexer=lexer)
         expectedObject = FunctionCall("fun_call", [0, 0, 7])
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_one_line_statement_return(self):
@@ -259,7 +272,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
         parser = Parser(lexer=lexer)
         expectedObject = ReturnStatement(
             Expression(FunctionCall("fun_call", [0, 0, 7]), '+', 1))
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_statement_block(self):
@@ -275,7 +288,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                                                   operator='+',
                                                   rightExpression=1))
         ])
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_one_line_if_statement(self):
@@ -289,7 +302,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                 rightCondition=SubCondition(value=Variable('b'))),
             statement=ReturnStatement(expression=Variable('a')))
 
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_if_else_statement(self):
@@ -305,7 +318,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
             statement=ReturnStatement(expression=Variable('a')),
             elseStatement=ReturnStatement(expression=Variable('b')))
 
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_if_statement(self):
@@ -327,7 +340,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                 ReturnStatement(expression=Variable('a'))
             ]))
 
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_else_if_statement(self):
@@ -353,7 +366,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                 statement=StatementBlock(
                     [ReturnStatement(expression=Variable('b'))])))
 
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_while_statement(self):
@@ -374,7 +387,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                                     rightExpression=1))
             ]))
 
-        parserObject = parser._Parser__try_parse_statement()
+        parserObject = parse_rule(parser, "statement")
         self.assertEqual(parserObject, expectedObject)
 
     def test_one_line_function_definition(self):
@@ -396,7 +409,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
                                                arguments=[Variable('f')]))
                                    ]))
 
-        parserObject = parser._Parser__try_parse_function_definition()
+        parserObject = parse_rule(parser, "function_definition")
         self.assertEqual(parserObject.identifier, expectedObject.identifier)
         self.assertEqual(parserObject.parameters, expectedObject.parameters)
         self.assertEqual(parserObject.statement, expectedObject.statement)
@@ -420,7 +433,7 @@ class ParserUnitTestSuitPovitive(unittest.TestCase):
             ]),
             returnType='frc')
 
-        parserObject = parser._Parser__try_parse_function_definition()
+        parserObject = parse_rule(parser, "function_definition")
         self.assertEqual(parserObject.identifier, expectedObject.identifier)
         self.assertEqual(parserObject.parameters, expectedObject.parameters)
         self.assertEqual(parserObject.statement, expectedObject.statement)
@@ -581,4 +594,449 @@ class ParserAcceptanceTestsSuit(unittest.TestCase):
             symbolsTable=SymbolsTable())
         parser = Parser(lexer=lexer)
         parserObject = parser.try_parse_program()
-        self.assertIsNotNone(parserObject)
\ No newline at end of file
+        self.assertIsNotNone(parserObject)
+
+class ParserTokenStreamTestSuite(unittest.TestCase):
+    def test_program_from_cursor(self):
+        for path in [
+                "Tests/grammar/fibonacci.txt", "Tests/grammar/casting.txt",
+                "Tests/acceptance/power.txt"
+        ]:
+            tokenStream = Lexer(sourceHandler=FileHandler(path),
+                                symbolsTable=SymbolsTable()).tokenize()
+            expectedObject = Parser(lexer=Lexer(
+                sourceHandler=FileHandler(path),
+                symbolsTable=SymbolsTable())).try_parse_program()
+            parserObject = Parser(
+                lexer=tokenStream.cursor()).try_parse_program()
+            self.assertEqual(parserObject, expectedObject)
+
+    def test_error_from_cursor(self):
+        tokenStream = Lexer(sourceHandler=DirectInputHandler(
+            "fn fun(int i, frc f) -> frc {\n return frc(i) + f}"),
+                            symbolsTable=SymbolsTable()).tokenize()
+        parser = Parser(lexer=tokenStream.cursor())
+        with self.assertRaises(ParserError) as context:
+            parser.try_parse_program()
+        self.assertIn("line:2, column:19", str(context.exception))
+
+
+PARALLEL_SOURCE = """int a = 1;
+fn first() { string s = "} fn fake() {"; } # fn comment {
+int fn_second = 2;
+fn second(int fnx) -> int {
+    { return fnx; }
+}  fn third() return 0; int b = 2;
+fn main() -> int return second(a) + third();
+"""
+
+
+class ParallelParserTestSuite(unittest.TestCase):
+    def parse(self, parser):
+        try:
+            return repr(parser.try_parse_program())
+        except ParserError as error:
+            return str(error)
+
+    def test_function_offsets(self):
+        self.assertEqual(
+            [PARALLEL_SOURCE[offset:offset + 8]
+             for offset in find_function_offsets(PARALLEL_SOURCE)],
+            ["fn first", "fn secon", "fn third", "fn main("])
+
+    def test_chunk_positions(self):
+        chunks = split_source(PARALLEL_SOURCE, 100)
+        self.assertEqual([chunk.position for chunk in chunks],
+                         [(1, 1), (2, 1), (4, 1), (6, 4), (7, 1)])
+        self.assertEqual("".join(chunk.text for chunk in chunks),
+                         PARALLEL_SOURCE)
+
+    def test_same_program_as_sequential(self):
+        for source in [PARALLEL_SOURCE, "", "# only comment"]:
+            sequential = Parser(lexer=Lexer(
+                sourceHandler=DirectInputHandler(source),
+                symbolsTable=SymbolsTable())).try_parse_program()
+            parallel = ParallelParser(
+                sourceHandler=DirectInputHandler(source),
+                symbolsTable=SymbolsTable(),
+                workers=2).try_parse_program()
+            self.assertEqual(repr(parallel), repr(sequential))
+
+    def test_absolute_function_positions(self):
+        program = ParallelParser(sourceHandler=DirectInputHandler(
+            PARALLEL_SOURCE * 3),
+                                 symbolsTable=SymbolsTable(),
+                                 workers=2).try_parse_program()
+        self.assertEqual(
+            [function.position for function in program.functionDefList][-4:],
+            [(16, 1), (18, 1), (20, 4), (21, 1)])
+
+    def test_same_error_as_sequential(self):
+        source = PARALLEL_SOURCE * 3
+        source = source[:len(source) // 2] + "int;" + source[len(source) //
+                                                             2:]
+        sequential = Parser(lexer=Lexer(
+            sourceHandler=DirectInputHandler(source),
+            symbolsTable=SymbolsTable()))
+        parallel = ParallelParser(sourceHandler=DirectInputHandler(source),
+                                  symbolsTable=SymbolsTable(),
+                                  workers=2)
+        expectedError = self.parse(sequential)
+        self.assertIn("Where: line:11, column:20", expectedError)
+        self.assertEqual(self.parse(parallel), expectedError)
+
+
+def parse_program(source: str) -> Program:
+    return Parser(lexer=Lexer(sourceHandler=DirectInputHandler(source),
+                              symbolsTable=SymbolsTable())).try_parse_program()
+
+
+class NodeEqualityTestSuite(unittest.TestCase):
+    def test_equal_trees(self):
+        with open("Tests/acceptance/power.txt") as file:
+            source = file.read()
+        left, right = parse_program(source), parse_program(source)
+        self.assertIsNot(left, right)
+        self.assertEqual(left, right)
+        self.assertEqual(hash(left), hash(right))
+
+    def test_different_trees(self):
+        left = parse_program("fn main() -> int return a + 1;")
+        for source in [
+                "fn main() -> int return a + 1.0;",
+                "fn main() -> int return a - 1;",
+                "fn main() -> float return a + 1;",
+                "fn main() -> int return a + b;",
+                "fn main(int a) -> int return a + 1;"
+        ]:
+            self.assertNotEqual(left, parse_program(source))
+
+    def test_position_is_not_compared(self):
+        self.assertEqual(parse_program("fn main() return 0;"),
+                         parse_program("\n\n   fn main() return 0;"))
+
+    def test_nodes_as_dict_keys(self):
+        expressions = {}
+        for source in ["a * (b + 1)", "a * (b + 1)", "a * (b + 2)"]:
+            expression = parse_program(
+                f"fn main() return {source};").functionDefList[0].statement
+            expressions[expression] = expressions.get(expression, 0) + 1
+        self.assertEqual(sorted(expressions.values()), [1, 2])
+
+    def test_cached_hash_not_pickled(self):
+        program = parse_program("fn main() return 0;")
+        hash(program)
+        self.assertFalse(hasattr(pickle.loads(pickle.dumps(program)), "_hash"))
+
+    def test_nodes_have_no_dict(self):
+        program = parse_program("int g = 1; fn main() -> int {"
+                                "while (g < 2) g = g + 1; return -g * 2; }")
+        nodes = [program]
+        while nodes:
+            node = nodes.pop()
+            self.assertFalse(hasattr(node, "__dict__"), node.__class__)
+            for field in node.fields:
+                value = getattr(node, field)
+                values = value if isinstance(value, list) else [value]
+                nodes += [
+                    value for value in values if isinstance(value, INode)
+                ]
+
+        statement = program.functionDefList[0].statement.statements[1]
+        self.assertEqual(str(statement), "return g * 2;")
+        self.assertIn("Negation:Yes", repr(statement.expression))
+
+
+def parse_expression(source: str):
+    parser = Parser(lexer=Lexer(sourceHandler=DirectInputHandler(source),
+                                symbolsTable=SymbolsTable()))
+    return parse_rule(parser, "expression")
+
+
+class ExpressionPrecedenceTestSuite(unittest.TestCase):
+    def test_precedence_and_associativity(self):
+        a, b, c = Variable('a'), Variable('b'), Variable('c')
+        for source, expectedObject in [
+            ("a - b - c",
+             Expression(leftExpression=Expression(
+                 leftExpression=a, operator='-', rightExpression=b),
+                        operator='-',
+                        rightExpression=c)),
+            ("a + b * c / a",
+             Expression(leftExpression=a,
+                        operator='+',
+                        rightExpression=SubExpression(leftFactor=SubExpression(
+                            leftFactor=b, operator='*', rightFactor=c),
+                                                      operator='/',
+                                                      rightFactor=a))),
+            ("a * b - c",
+             Expression(leftExpression=SubExpression(
+                 leftFactor=a, operator='*', rightFactor=b),
+                        operator='-',
+                        rightExpression=c)),
+            ("a * (b - c)",
+             SubExpression(leftFactor=a,
+                           operator='*',
+                           rightFactor=Expression(
+                               leftExpression=b,
+                               operator='-',
+                               rightExpression=c))),
+        ]:
+            self.assertEqual(parse_expression(source), expectedObject)
+
+    def test_negation(self):
+        a, b, c = Variable('a'), Variable('b'), Variable('c')
+        for source, expectedObject in [
+            ("-a", SubExpression(leftFactor=a, isNegated=True)),
+            ("-a * b / c",
+             SubExpression(leftFactor=SubExpression(leftFactor=a,
+                                                    operator='*',
+                                                    rightFactor=b,
+                                                    isNegated=True),
+                           operator='/',
+                           rightFactor=c,
+                           isNegated=True)),
+            ("a - -b * c",
+             Expression(leftExpression=a,
+                        operator='-',
+                        rightExpression=SubExpression(leftFactor=b,
+                                                      operator='*',
+                                                      rightFactor=c,
+                                                      isNegated=True))),
+            ("-a + b",
+             Expression(leftExpression=SubExpression(leftFactor=a,
+                                                     isNegated=True),
+                        operator='+',
+                        rightExpression=b)),
+        ]:
+            self.assertEqual(parse_expression(source), expectedObject)
+
+    def test_errors(self):
+        for source, message in [
+            ("a * -b", "Expected factor after operator"),
+            ("a + ;", "Expected expression after operator"),
+            ("- ;", "Expected factor after \'-\'."),
+        ]:
+            with self.assertRaises(ParserError) as context:
+                parse_expression(source)
+            self.assertIn(message, str(context.exception))
+
+
+class GrammarTestSuite(unittest.TestCase):
+    def test_first_sets_of_current_grammar(self):
+        grammar = Grammar.from_file()
+        self.assertNotIn("statementBlock", grammar.rules)
+        self.assertEqual(
+            grammar.first("type"),
+            {
+                TokenTypes.INTEGER, TokenTypes.FLOAT, TokenTypes.FRACTION,
+                TokenTypes.STRING
+            })
+        self.assertEqual(
+            grammar.first("subCondition"),
+            {
+                TokenTypes.NEGATION, TokenTypes.MINUS,
+                TokenTypes.OPEN_PARENTHESES, TokenTypes.IDENTIFIER,
+                TokenTypes.INTEGER_LITERAL, TokenTypes.FLOAT_LITERAL,
+                TokenTypes.STRING_LITERAL
+            })
+        self.assertIn("program", grammar.nullableRules)
+
+    def test_dispatch_table(self):
+        table = Grammar.from_file().dispatch_table("statement")
+        self.assertEqual(table[TokenTypes.IF], ("ifStatement", ))
+        self.assertEqual(table[TokenTypes.OPEN_BRACE], ("{", ))
+        self.assertEqual(table[TokenTypes.INTEGER], ("defineStatement", ))
+        self.assertEqual(table[TokenTypes.IDENTIFIER],
+                         ("assignStatement", "functionCall"))
+        self.assertNotIn(TokenTypes.ELSE, table)
+
+    def test_ambiguous_grammar(self):
+        grammar = Grammar(
+            EbnfReader("""program = {a | b};
+                a = "fn", "{";
+                b = ["-"], "fn";""").read_rules())
+        self.assertEqual(grammar.first("b"),
+                         {TokenTypes.MINUS, TokenTypes.FUNCTION})
+
+        table = grammar.dispatch_table("program")
+        self.assertEqual(table[TokenTypes.FUNCTION], ("a", "b"))
+        self.assertEqual(bind_dispatch_table(table, {
+            "a": len,
+            "b": len
+        })[TokenTypes.FUNCTION], len)
+        with self.assertRaises(ParserError):
+            bind_dispatch_table(table, {"a": len, "b": str})
+        with self.assertRaises(ParserError):
+            bind_dispatch_table(table, {"a": len})
+
+    def test_unknown_terminal(self):
+        with self.assertRaises(ParserError):
+            Grammar(EbnfReader('program = "fn", "@";').read_rules())
+
+    def test_invalid_token_in_program(self):
+        for source in ["int a; fn f() {} else", "fn f() {} int a; a"]:
+            with self.assertRaises(ParserError) as context:
+                parse_program(source)
+            self.assertIn("Invalid token.", str(context.exception))
+
+
+LAZY_SOURCE = """fn broken(int a) -> int {
+    string s = "}{"; # }
+    int b = ;
+}
+fn main() -> int {
+    if (1) { return 2; }
+}
+"""
+
+
+class LazyParsingTestSuite(unittest.TestCase):
+    def build_lexers(self, source: str):
+        tokenStream = RegexLexer(sourceHandler=DirectInputHandler(source),
+                                 symbolsTable=SymbolsTable()).tokenize()
+        return [
+            RegexLexer(sourceHandler=DirectInputHandler(source),
+                       symbolsTable=SymbolsTable()),
+            tokenStream.cursor()
+        ]
+
+    def test_bodies_parsed_on_use(self):
+        for path in [
+                "Tests/grammar/fibonacci.txt", "Tests/grammar/casting.txt",
+                "Tests/grammar/conditions.txt", "Tests/acceptance/power.txt"
+        ]:
+            with open(path) as file:
+                source = file.read()
+            expectedObject = Parser(lexer=RegexLexer(
+                sourceHandler=DirectInputHandler(source),
+                symbolsTable=SymbolsTable())).try_parse_program()
+            for lexer in self.build_lexers(source):
+                program = Parser(lexer=lexer, lazy=True).try_parse_program()
+                self.assertEqual(program.defineStatementList,
+                                 expectedObject.defineStatementList)
+                for function, expectedFunction in zip(
+                        program.functionDefList,
+                        expectedObject.functionDefList):
+                    #only bodies in braces are skipped
+                    if isinstance(expectedFunction.statement, StatementBlock):
+                        self.assertIsInstance(function.statement,
+                                              LazyStatement)
+                        self.assertEqual(function.statement.statement,
+                                         expectedFunction.statement)
+                    else:
+                        self.assertEqual(function, expectedFunction)
+
+    def test_error_in_body(self):
+        with self.assertRaises(ParserError) as context:
+            parse_program(LAZY_SOURCE)
+        expectedError = str(context.exception)
+
+        for lexer in self.build_lexers(LAZY_SOURCE):
+            program = Parser(lexer=lexer, lazy=True).try_parse_program()
+            mainFunction = program.functionDefList[1]
+            self.assertIsInstance(mainFunction.statement.statement,
+                                  StatementBlock)
+            with self.assertRaises(ParserError) as context:
+                program.functionDefList[0].statement.statement
+            self.assertEqual(str(context.exception), expectedError)
+
+    def test_not_closed_body(self):
+        source = "fn main() -> int {\n return 1;"
+        with self.assertRaises(ParserError) as context:
+            parse_program(source)
+        for lexer in self.build_lexers(source):
+            with self.assertRaises(ParserError) as lazyContext:
+                Parser(lexer=lexer, lazy=True).try_parse_program()
+            self.assertIn("line:2, column:10", str(lazyContext.exception))
+
+    def test_pickled_body_is_parsed(self):
+        source = "fn main() -> int { return 1; }"
+        program = Parser(lexer=RegexLexer(
+            sourceHandler=DirectInputHandler(source),
+            symbolsTable=SymbolsTable()),
+                         lazy=True).try_parse_program()
+        loaded = pickle.loads(pickle.dumps(program))
+        self.assertEqual(loaded.functionDefList[0].statement.statement,
+                         parse_program(source).functionDefList[0].statement)
+
+    def test_lexer_without_skipping(self):
+        with self.assertRaises(ParserError):
+            Parser(lexer=Lexer(sourceHandler=DirectInputHandler("fn main() {}"),
+                               symbolsTable=SymbolsTable()),
+                   lazy=True)
+
+
+class DeepNestingTestSuite(unittest.TestCase):
+    def parse_main(self, body: str):
+        lexer = RegexLexer(sourceHandler=DirectInputHandler("fn main() " +
+                                                            body),
+                           symbolsTable=SymbolsTable())
+        return Parser(lexer=lexer).try_parse_program().functionDefList[0]
+
+    def test_deep_parentheses(self):
+        depth = 100000
+        mainFunction = self.parse_main("return " + "(" * depth + "a + 1" +
+                                       ")" * depth + ";")
+        self.assertEqual(
+            repr(mainFunction.statement),
+            repr(
+                ReturnStatement(
+                    Expression(leftExpression=Variable('a'),
+                               operator='+',
+                               rightExpression=1))))
+
+    def test_deep_statements(self):
+        depth = 10000
+        mainFunction = self.parse_main("{" * depth + "return 1;" +
+                                       "}" * depth)
+        statement = mainFunction.statement
+        for _ in range(depth):
+            self.assertIsInstance(statement, StatementBlock)
+            statement, = statement.statements
+        self.assertIsInstance(statement, ReturnStatement)
+
+        mainFunction = self.parse_main("if (1) return 1; else " * depth +
+                                       "return 2;")
+        statement = mainFunction.statement
+        for _ in range(depth):
+            self.assertEqual(statement.statement, ReturnStatement(1))
+            statement = statement.elseStatement
+        self.assertEqual(statement, ReturnStatement(2))
+
+    def test_iterative_parsing_matches_recursive(self):
+        body = ("{ while (!(a < -(b + f(1, (c))))) if ((a)) a = f(g(1) * 2);"
+                " else { int b = (1 + 2) * 3; } return -a; }")
+        expectedObject = self.parse_main(body)
+        with mock.patch("Parser.parser.MAX_RECURSION_DEPTH", 0):
+            self.assertEqual(self.parse_main(body), expectedObject)
+
+    def test_example_programs_parse_iteratively(self):
+        #every rule on explicit stack gives the same trees as recursion
+        paths = sorted(
+            glob.glob("Tests/grammar/*.txt") +
+            glob.glob("Tests/acceptance/*.txt"))
+        self.assertTrue(paths)
+        for path in paths:
+            with self.subTest(path=path):
+                expectedProgram = Parser(lexer=Lexer(
+                    sourceHandler=FileHandler(path),
+                    symbolsTable=SymbolsTable())).try_parse_program()
+                with mock.patch("Parser.parser.MAX_RECURSION_DEPTH", 0):
+                    program = Parser(lexer=Lexer(
+                        sourceHandler=FileHandler(path),
+                        symbolsTable=SymbolsTable())).try_parse_program()
+                self.assertEqual(program, expectedProgram)
+
+    def test_deep_error(self):
+        depth = 100000
+        with self.assertRaises(ParserError) as context:
+            self.parse_main("return " + "(" * depth + "1;" + ")" * depth)
+        self.assertIn("Expected one of: TokenTypes.CLOSE_PARENTHESES",
+                      str(context.exception))
+
+    def test_nesting_limit(self):
+        with mock.patch("Parser.parser.MAX_NESTING_DEPTH", 1000):
+            with self.assertRaises(ParserError) as context:
+                self.parse_main("{" * 1000 + "}" * 1000)
+        self.assertIn("nested too deep", str(context.exception))
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+from HelperModules.programcache import ProgramCache
+from HelperModules.errorhandler import InterpreterRuntimeError
+from HelperModules.sourcehandler import CHUNK_SIZE
+from HelperModules.sourcehandler import DirectInputHandler, FileHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.lexer import Lexer
+from Parser.parser import Parser
+from Interpreter.interpreter import Interpreter
+
+SOURCE = "fn main() -> int { int a = 2; return a * 21; }"
+
+
+def parse(source: str):
+    return Parser(lexer=Lexer(sourceHandler=DirectInputHandler(source),
+                              symbolsTable=SymbolsTable())).try_parse_program()
+
+
+class FailingParser(Parser):
+    def try_parse_program(self):
+        raise AssertionError("Program should be loaded from cache.")
+
+
+class ProgramCacheTestSuite(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = os.path.join(directory.name, "__bifcache__")
+
+    def test_load_stored_program(self):
+        programCache = ProgramCache(self.directory, "1.0")
+        self.assertIsNone(programCache.load("digest"))
+
+        programCache.store("digest", parse(SOURCE))
+        self.assertEqual(programCache.load("digest"), parse(SOURCE))
+        self.assertEqual(os.listdir(self.directory), ["digest-1.0.pickle"])
+
+    def test_other_version_not_loaded(self):
+        ProgramCache(self.directory, "1.0").store("digest", parse(SOURCE))
+        self.assertIsNone(ProgramCache(self.directory, "2.0").load("digest"))
+
+    def test_damaged_entry_removed(self):
+        programCache = ProgramCache(self.directory, "1.0")
+        programCache.store("digest", parse(SOURCE))
+        path = os.path.join(self.directory, "digest-1.0.pickle")
+        with open(path, 'wb') as file:
+            file.write(b"\x80\x05damaged")
+
+        self.assertIsNone(programCache.load("digest"))
+        self.assertFalse(os.path.exists(path))
+
+    def test_least_recently_used_evicted(self):
+        programCache = ProgramCache(self.directory, "1.0")
+        programCache.store("first", parse(SOURCE))
+        entrySize = os.path.getsize(
+            os.path.join(self.directory, "first-1.0.pickle"))
+        programCache.maxSize = 2 * entrySize
+
+        programCache.store("second", parse(SOURCE))
+        os.utime(os.path.join(self.directory, "second-1.0.pickle"),
+                 (0, 0))
+        programCache.store("third", parse(SOURCE))
+        self.assertEqual(sorted(os.listdir(self.directory)),
+                         ["first-1.0.pickle", "third-1.0.pickle"])
+
+    def test_interpreter_uses_cache(self):
+        programCache = ProgramCache(self.directory, "1.0")
+        sourceHandler = DirectInputHandler(SOURCE)
+        interpreter = Interpreter(
+            Parser(lexer=Lexer(sourceHandler=sourceHandler,
+                               symbolsTable=SymbolsTable())), programCache)
+        self.assertEqual(interpreter.interpret(returnResult=True), 42)
+
+        interpreter = Interpreter(
+            FailingParser(lexer=Lexer(sourceHandler=DirectInputHandler(
+                SOURCE),
+                                      symbolsTable=SymbolsTable())),
+            programCache)
+        self.assertEqual(interpreter.interpret(returnResult=True), 42)
+
+    def test_error_context_of_cached_program(self):
+        #error is after the first chunk, which is the only one read
+        #when program is loaded from cache
+        functions = ''.join(f"fn f{i}() -> int return {i};\n"
+                            for i in range(CHUNK_SIZE // 20))
+        source = (functions +
+                  "fn main() -> int {\n int a = 0;\n return 1 / a;\n}")
+        file = tempfile.NamedTemporaryFile(delete=False)
+        file.write(source.encode('utf-8'))
+        file.close()
+        self.addCleanup(os.remove, file.name)
+
+        programCache = ProgramCache(self.directory, "1.0")
+        for parserType in (Parser, FailingParser):
+            interpreter = Interpreter(
+                parserType(lexer=Lexer(sourceHandler=FileHandler(file.name),
+                                       symbolsTable=SymbolsTable())),
+                programCache)
+            with self.assertRaises(InterpreterRuntimeError) as context:
+                interpreter.interpret()
+            self.assertIn("\n return 1 / a;\n", str(context.exception))
@@ -0,0 +1,96 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+from HelperModules.errorhandler import InterpreterRuntimeError
+from HelperModules.memocache import MemoCache
+from HelperModules.resultcache import ResultCache
+from HelperModules.sourcehandler import DirectInputHandler
+from HelperModules.symbols import SymbolsTable
+from Lexer.lexer import Lexer
+from Parser.ast import structure_digest
+from Parser.parser import Parser
+from Interpreter.interpreter import Interpreter
+
+SOURCE = ("fn square(int a) -> int return a * a;"
+          "fn main() -> int { print(\"a\"); return square(6) + square(2); }")
+
+
+def parse(source: str):
+    return Parser(lexer=Lexer(sourceHandler=DirectInputHandler(source),
+                              symbolsTable=SymbolsTable())).try_parse_program()
+
+
+def interpret(parser: Parser, resultCache: ResultCache,
+              memoCache: MemoCache = None) -> tuple:
+    #result and printed output of program
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = Interpreter(parser,
+                             memoCache=memoCache,
+                             resultCache=resultCache).interpret(
+                                 returnResult=True)
+    return result, output.getvalue()
+
+
+class ResultCacheTestSuite(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = os.path.join(directory.name, "results")
+
+    def build_parser(self, source: str) -> Parser:
+        return Parser(lexer=Lexer(sourceHandler=DirectInputHandler(source),
+                                  symbolsTable=SymbolsTable()))
+
+    def test_digest_ignores_positions(self):
+        self.assertEqual(structure_digest(parse(SOURCE)),
+                         structure_digest(parse(SOURCE.replace(";", ";\n"))))
+        self.assertNotEqual(structure_digest(parse(SOURCE)),
+                            structure_digest(parse(SOURCE.replace("6",
+                                                                  "6.0"))))
+
+    def test_program_result_is_replayed(self):
+        resultCache = ResultCache(self.directory, "1.0")
+        expected = (40, "a\nProgram finished with result: 40\n")
+        self.assertEqual(interpret(self.build_parser(SOURCE), resultCache),
+                         expected)
+
+        #replayed program calls no functions
+        memoCache = MemoCache()
+        self.assertEqual(
+            interpret(self.build_parser(SOURCE), resultCache, memoCache),
+            expected)
+        self.assertEqual((memoCache.hits, memoCache.misses), (0, 0))
+
+    def test_failed_program_is_not_stored(self):
+        resultCache = ResultCache(self.directory, "1.0")
+        source = "fn main() -> int { print(\"a\"); return 1 / 0; }"
+        for _ in range(2):
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertRaises(InterpreterRuntimeError, interpret,
+                                  self.build_parser(source), resultCache)
+        self.assertFalse(os.path.exists(self.directory))
+
+    def test_function_results_are_shared_between_programs(self):
+        resultCache = ResultCache(self.directory, "1.0")
+        interpret(self.build_parser(SOURCE), resultCache, MemoCache())
+
+        memoCache = MemoCache()
+        source = SOURCE.replace("square(2)", "square(3)")
+        self.assertEqual(
+            interpret(self.build_parser(source), resultCache, memoCache)[0],
+            45)
+        self.assertEqual((memoCache.hits, memoCache.misses), (1, 1))
+
+    def test_changed_function_does_not_use_results(self):
+        resultCache = ResultCache(self.directory, "1.0")
+        interpret(self.build_parser(SOURCE), resultCache, MemoCache())
+
+        memoCache = MemoCache()
+        source = SOURCE.replace("a * a", "a * a + 1")
+        self.assertEqual(
+            interpret(self.build_parser(source), resultCache, memoCache)[0],
+            42)
+        self.assertEqual(memoCache.hits, 0)
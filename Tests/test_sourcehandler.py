@@ -0,0 +1,183 @@
+import os
+import tempfile
+import unittest
+import HelperModules.sourcehandler as sourcehandler
+from HelperModules.sourcehandler import FileHandler, DirectInputHandler, StreamHandler
+from HelperModules.symbols import SymbolsTable, TokenTypes
+from HelperModules.errorhandler import LexerError, ParserError
+from HelperModules.errorhandler import InterpreterRuntimeError
+from Lexer.lexer import Lexer
+from Parser.parser import Parser
+from Interpreter.interpreter import Interpreter
+
+
+def read_all(sourceHandler) -> list:
+    result = []
+    while (char := sourceHandler.get_next_char()) != '':
+        result.append((char, sourceHandler.get_position()))
+    return result
+
+
+class SourceHandlerTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.chunkSize = sourcehandler.CHUNK_SIZE
+        sourcehandler.CHUNK_SIZE = 3
+
+    def tearDown(self):
+        sourcehandler.CHUNK_SIZE = self.chunkSize
+
+    def write_file(self, content: bytes) -> str:
+        file = tempfile.NamedTemporaryFile(delete=False)
+        file.write(content)
+        file.close()
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def test_positions_across_chunks(self):
+        sourceHandler = DirectInputHandler("ab\ncd\n\ne")
+        self.assertEqual(read_all(sourceHandler), [('a', (1, 1)),
+                                                   ('b', (1, 2)),
+                                                   ('\n', (2, 0)),
+                                                   ('c', (2, 1)),
+                                                   ('d', (2, 2)),
+                                                   ('\n', (3, 0)),
+                                                   ('\n', (4, 0)),
+                                                   ('e', (4, 1))])
+
+    def test_eof_is_sticky(self):
+        sourceHandler = DirectInputHandler("ab")
+        read_all(sourceHandler)
+        self.assertTrue(sourceHandler.is_eof())
+        self.assertEqual(sourceHandler.get_next_char(), '')
+        self.assertEqual(sourceHandler.get_position(), (1, 2))
+
+    def test_mapped_file_matches_direct_input(self):
+        text = "fn main() {\n    # zażółć gęślą jaźń\n    return 0;\n}"
+        fileHandler = FileHandler(self.write_file(text.encode('utf-8')))
+        self.assertEqual(read_all(fileHandler),
+                         read_all(DirectInputHandler(text)))
+
+    def test_mapped_file_newlines(self):
+        fileHandler = FileHandler(self.write_file(b"a\r\nb\rc\n"))
+        self.assertEqual(''.join(char for char, _ in read_all(fileHandler)),
+                         "a\nb\nc\n")
+
+    def test_empty_file(self):
+        fileHandler = FileHandler(self.write_file(b""))
+        self.assertEqual(fileHandler.get_next_char(), '')
+        self.assertTrue(fileHandler.is_eof())
+
+    def test_direct_input_lines(self):
+        sourceHandler = DirectInputHandler("ab\n\ncd\ne")
+        self.assertEqual(
+            [sourceHandler.get_line(lineNr) for lineNr in range(1, 6)],
+            ["ab", '', "cd", "e", ''])
+        self.assertEqual(sourceHandler.get_line_span(3), (4, 6))
+
+    def test_mapped_file_lines(self):
+        fileHandler = FileHandler(
+            self.write_file(b"ab\r\ncd\rzaz\xc3\xb3\n\nx"))
+        read_all(fileHandler)
+        self.assertEqual(
+            [fileHandler.get_line(lineNr) for lineNr in range(1, 7)],
+            ["ab", "cd", "zaz\u00f3", '', "x", ''])
+
+    def test_line_of_partially_read_file(self):
+        fileHandler = FileHandler(self.write_file(b"a\nbcdefgh\ni"))
+        for i in range(4):
+            fileHandler.get_next_char()
+        self.assertEqual(fileHandler.get_line(), "bcdefgh")
+        #lines not read yet are found in mapped file
+        self.assertEqual(fileHandler.get_line(3), "i")
+        self.assertEqual(''.join(char for char, _ in read_all(fileHandler)),
+                         "defgh\ni")
+        self.assertEqual(fileHandler.get_line(4), '')
+
+
+class ProducerStream:
+    #returns written parts one by one, like a pipe fed by a slow producer
+    def __init__(self, parts: list) -> None:
+        self.parts = parts
+        self.reads = 0
+
+    def read1(self, size: int) -> bytes:
+        self.reads += 1
+        return self.parts.pop(0) if self.parts else b''
+
+
+class StreamHandlerTestSuite(unittest.TestCase):
+    def test_stream_matches_direct_input(self):
+        text = "fn main() {\n    # zażółć\r\n    return 0;\n}"
+        streamHandler = StreamHandler(
+            ProducerStream([text[:15].encode('utf-8'),
+                            text[15:].encode('utf-8')]))
+        self.assertEqual(read_all(streamHandler),
+                         read_all(DirectInputHandler(text.replace('\r', ''))))
+
+    def test_lexing_starts_before_input_ends(self):
+        stream = ProducerStream([b"fn main() ", b"return 0;"])
+        lexer = Lexer(sourceHandler=StreamHandler(stream),
+                      symbolsTable=SymbolsTable())
+        self.assertEqual(lexer.get_token().type, TokenTypes.FUNCTION)
+        self.assertEqual(stream.reads, 1)
+
+    def test_lines_window(self):
+        streamHandler = StreamHandler(ProducerStream(
+            [b"a\nb\nc", b"c\nd\ne\nf", b"f\ng"]),
+                                      windowSize=1)
+        while streamHandler.get_position() != (5, 1):
+            streamHandler.get_next_char()
+        self.assertEqual(
+            [streamHandler.get_line(lineNr) for lineNr in range(1, 8)],
+            ['', "b", "cc", "d", "e", "ff", "g"])
+        #reading the rest of line 6 moved the window
+        self.assertEqual(streamHandler.get_line(2), '')
+        self.assertEqual(streamHandler.get_line_span(5), (9, 10))
+        self.assertEqual(read_all(streamHandler)[-1], ('g', (7, 1)))
+
+    def test_error_line_read_to_end(self):
+        lexer = Lexer(sourceHandler=StreamHandler(
+            ProducerStream([b"int a = 1 $", b" 2;\n", b"int b;"])),
+                      symbolsTable=SymbolsTable())
+        with self.assertRaises(LexerError) as context:
+            while lexer.get_token().type != TokenTypes.EOF:
+                pass
+        self.assertIn("int a = 1 $ 2;\n          ^", str(context.exception))
+
+
+class SourceHandlerLexerTestSuite(unittest.TestCase):
+    def test_comment_at_eof(self):
+        lexer = Lexer(sourceHandler=DirectInputHandler("main # comment"),
+                      symbolsTable=SymbolsTable())
+        self.assertEqual(lexer.get_token().type, TokenTypes.IDENTIFIER)
+        self.assertEqual(lexer.get_token().type, TokenTypes.EOF)
+
+    def test_unterminated_string(self):
+        lexer = Lexer(sourceHandler=DirectInputHandler("\"abc"),
+                      symbolsTable=SymbolsTable())
+        self.assertRaises(LexerError, lexer.get_token)
+
+    def test_unterminated_escape(self):
+        lexer = Lexer(sourceHandler=DirectInputHandler("\"abc\\"),
+                      symbolsTable=SymbolsTable())
+        self.assertRaises(LexerError, lexer.get_token)
+
+
+class ErrorContextTestSuite(unittest.TestCase):
+    def test_parser_error_context(self):
+        parser = Parser(lexer=Lexer(sourceHandler=DirectInputHandler(
+            "fn main() {\n  int a = 1 +;\n}"),
+                                    symbolsTable=SymbolsTable()))
+        with self.assertRaises(ParserError) as context:
+            parser.try_parse_program()
+        self.assertIn("line:2, column:14\n  int a = 1 +;\n             ^\n",
+                      str(context.exception))
+
+    def test_interpreter_error_context(self):
+        parser = Parser(lexer=Lexer(sourceHandler=DirectInputHandler(
+            "fn main() fun();\n\nfn fun() int i = 0.5;"),
+                                    symbolsTable=SymbolsTable()))
+        with self.assertRaises(InterpreterRuntimeError) as context:
+            Interpreter(parser).interpret()
+        self.assertIn("line:3, column:1\nfn fun() int i = 0.5;\n^",
+                      str(context.exception))